@@ -5,12 +5,29 @@ AutoAnalyzer - 연령별 국민평가 데이터 통합 분석
 20대, 30대, 40대, 50대, 60대이상, 디지털취약계층 데이터를 분석하여 JSON 생성
 """
 
-import pandas as pd
 import numpy as np
+import argparse
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
+from aggregation import json_value, nan_max, nan_min, weighted_mean
+from excel_loader import AGE_GROUPS, Q_COLUMNS, ExcelCache, file_digest, load_age_groups, workbook_path
+from output_writer import OutputWriter, dedupe_all_data
+from ranking_index import bottom_k, refresh_index, top_k
+from score_cube import ScoreCube
+from site_shards import refresh_shards
+
+# 부분 집계 형식 버전 (레코드 구조·계산 방식이 바뀌면 올림 → 저장된 부분 집계 전부 무효)
+PARTIALS_VERSION = 2
+
+# 순위 색인·기관별 분할 파일에 함께 들어가는 다른 분석기의 결과 파일 (바뀌면 색인·분할 파일 갱신)
+DERIVED_SOURCES = ('final_integrated_scores.json', 'integrated_nielsen_scores.json',
+                   'nielsen_detailed_reports.json', 'nielsen_mapped_results.json')
+# 결과 저장 후 만드는 파생 파일 (하나라도 없으면 입력이 같아도 다시 생성)
+DERIVED_OUTPUTS = ('rankings.sqlite', 'rankings', 'sites/index.json')
+
 class AgeGroupAnalyzer:
     def __init__(self):
         self.base_dir = Path(__file__).parent
@@ -18,74 +35,84 @@ class AgeGroupAnalyzer:
         self.output_dir = self.base_dir / 'output'
         self.output_dir.mkdir(exist_ok=True)
         
-        self.age_groups = [
-            '20대', '30대', '40대', '50대', '60대이상', '디지털취약계층'
-        ]
+        self.age_groups = list(AGE_GROUPS)
+
+        # 엑셀 파싱 결과 캐시 (nielsen_analyzer 와 공유)
+        self.excel_cache = ExcelCache()
+
+        # 증분 재계산용 입력 다이제스트 manifest + 연령대별 부분 집계
+        self.partials_dir = self.base_dir / '.cache' / 'age_partials'
+
+        # 기관 × 연령대 × 문항 점수 큐브 (save_results 에서 score_cube.npz 로 저장)
+        self.cube = None
+
+        # 연령대별 응답자 수 가중치 ({연령대: 응답자 수}, None 이면 연령대 단순 평균)
+        self.age_weights = None
+
+        # 결과 파일 출력기 (minify / .gz·.br / msgpack·parquet 설정)
+        # dedupe=True 면 analysis_results.json 의 all_data 를 all_data_index 로 대체
+        self.writer = OutputWriter()
+        self.dedupe = False
         
         # Q1~Q10 컬럼 매핑
-        self.q_columns_map = {
-            'Q1': '1.원하는 목적을 달성할 수 있었나요?',
-            'Q2': '2.서비스 이용이 편리 했나요?',
-            'Q3': '3. 전문성 없이도 쉽게 이해할 수 있었나요?',
-            'Q4': '4. 어떤 페이지에서 든 메뉴 이동이 쉬웠나요?',
-            'Q5': '5. 잘못 입력했을 경우 경고 메시지가 표시되나요?',
-            'Q6': '6. 당신이 원하는 서비스(신청, 조회 콘텐츠 상세 등) 이용에 대해 친절하게 설명해 주었나요?',
-            'Q7': '7. 시각적으로 서비스의 내용이 잘 구분되어 있나요?',
-            'Q8': '8. 제목, 글머리표, 아이콘, 이미지 등이 일관성 있게 배치되어 통일감 있게 느끼셨나요?',
-            'Q9': '9. 보편적이고 익숙한 구조를 사용하고 있나요?',
-            'Q10': '10. 색상간의 조화가 잘 이루어지고 있나요?'
-        }
-        
-    def load_age_group_data(self, age_group):
-        """연령대별 데이터 로드"""
-        filename = f'UI_UX 평가시스템_{age_group}.xlsx'
-        filepath = self.data_dir / filename
+        self.q_columns_map = dict(Q_COLUMNS)
         
-        if not filepath.exists():
-            print(f"⚠️  파일을 찾을 수 없습니다: {filename}")
+    def load_all_age_group_data(self):
+        """전체 연령대 데이터 로드 (캐시에 없는 파일만 병렬 파싱)"""
+        return load_age_groups(self.data_dir, self.age_groups, self.excel_cache)
+
+    def load_age_group_data(self, age_group, frames=None):
+        """연령대별 데이터 로드 (frames: load_all_age_group_data 결과)"""
+        if frames is None:
+            frames = load_age_groups(self.data_dir, [age_group], self.excel_cache)
+        df = frames.get(age_group)
+
+        if df is None:
+            print(f"⚠️  파일을 찾을 수 없습니다: {workbook_path(self.data_dir, age_group).name}")
             return None
         
-        df = pd.read_excel(filepath)
         print(f"✅ {age_group} 데이터 로드: {df.shape[0]}개 기관")
         return df
     
     def process_age_group(self, df, age_group):
         """연령대별 데이터 처리"""
-        results = []
-        
-        for idx, row in df.iterrows():
-            site_name = str(row['기관명'])
-            site_url = str(row['사이트주소']) if pd.notna(row['사이트주소']) else ''
-            
-            # Q1~Q10 점수 추출
-            scores = {}
-            for q_key, col_name in self.q_columns_map.items():
-                if col_name in df.columns:
-                    score = row[col_name]
-                    if pd.isna(score):
-                        score = 0.0
-                    scores[q_key] = round(float(score), 2)
-                else:
-                    scores[q_key] = 0.0
-            
-            # 평균 점수
-            convenience_avg = row['편의성평균'] if '편의성평균' in df.columns else 0.0
-            design_avg = row['디자인평균'] if '디자인평균' in df.columns else 0.0
-            total_avg = row['총합평균'] if '총합평균' in df.columns else 0.0
-            
-            result = {
-                'name': site_name,
-                'url': site_url,
+        # 컬럼 단위로 한 번에 변환 (행 반복 없이)
+        names = [str(v) for v in df['기관명'].tolist()]
+        urls = df['사이트주소']
+        urls = [str(v) if present else '' for v, present in zip(urls.tolist(), urls.notna().tolist())]
+
+        # Q1~Q10 점수 행렬 (없는 컬럼·빈 응답은 NaN → 출력은 null, 평균에서 제외)
+        q_keys = list(self.q_columns_map)
+        q_matrix = np.full((len(df), len(q_keys)), np.nan, dtype=np.float64)
+        for i, col_name in enumerate(self.q_columns_map.values()):
+            if col_name in df.columns:
+                q_matrix[:, i] = df[col_name].astype(np.float64).to_numpy()
+
+        # 평균 점수 (없으면 null)
+        def avg_column(col_name):
+            if col_name not in df.columns:
+                return [None] * len(df)
+            return [json_value(v, 2) for v in df[col_name].astype(np.float64).tolist()]
+
+        convenience_avgs = avg_column('편의성평균')
+        design_avgs = avg_column('디자인평균')
+        total_avgs = avg_column('총합평균')
+
+        # round 는 파이썬 float 에 적용 (np.round 와 반올림 결과가 다를 수 있음)
+        return [
+            {
+                'name': name,
+                'url': url,
                 'age_group': age_group,
-                'scores': scores,
-                'convenience_avg': round(float(convenience_avg), 2),
-                'design_avg': round(float(design_avg), 2),
-                'total_avg': round(float(total_avg), 2)
+                'scores': dict(zip(q_keys, [json_value(v, 2) for v in q_row])),
+                'convenience_avg': convenience_avg,
+                'design_avg': design_avg,
+                'total_avg': total_avg
             }
-            
-            results.append(result)
-        
-        return results
+            for name, url, q_row, convenience_avg, design_avg, total_avg in zip(
+                names, urls, q_matrix.tolist(), convenience_avgs, design_avgs, total_avgs
+            )
+        ]
     
     def analyze_all_age_groups(self):
         """전체 연령대 데이터 분석"""
@@ -96,103 +123,208 @@ class AgeGroupAnalyzer:
         all_data = []
         age_group_summary = {}
         
+        frames = self.load_all_age_group_data()
+
         # 각 연령대 데이터 처리
         for age_group in self.age_groups:
             print(f"\n🔍 {age_group} 데이터 처리 중...")
-            df = self.load_age_group_data(age_group)
+            df = self.load_age_group_data(age_group, frames)
             
             if df is None:
                 continue
             
             results = self.process_age_group(df, age_group)
             all_data.extend(results)
-            
-            # 연령대별 통계
-            total_scores = [r['total_avg'] for r in results]
-            convenience_scores = [r['convenience_avg'] for r in results]
-            design_scores = [r['design_avg'] for r in results]
-            
-            age_group_summary[age_group] = {
-                'count': len(results),
-                'total_avg': round(float(np.mean(total_scores)), 2),
-                'convenience_avg': round(float(np.mean(convenience_scores)), 2),
-                'design_avg': round(float(np.mean(design_scores)), 2),
-                'total_max': round(float(np.max(total_scores)), 2),
-                'total_min': round(float(np.min(total_scores)), 2)
-            }
-            
-            print(f"   평균 점수: {age_group_summary[age_group]['total_avg']}")
-            print(f"   최고: {age_group_summary[age_group]['total_max']}")
-            print(f"   최저: {age_group_summary[age_group]['total_min']}")
+            age_group_summary[age_group] = self.summarize_age_group(results)
         
         return all_data, age_group_summary
+
+    def summarize_age_group(self, results):
+        """연령대별 통계 (점수가 없는 기관은 제외)"""
+        total_scores = [r['total_avg'] for r in results]
+        convenience_scores = [r['convenience_avg'] for r in results]
+        design_scores = [r['design_avg'] for r in results]
+        
+        summary = {
+            'count': len(results),
+            'total_avg': json_value(weighted_mean(total_scores), 2),
+            'convenience_avg': json_value(weighted_mean(convenience_scores), 2),
+            'design_avg': json_value(weighted_mean(design_scores), 2),
+            'total_max': json_value(nan_max(total_scores), 2),
+            'total_min': json_value(nan_min(total_scores), 2)
+        }
+        
+        print(f"   평균 점수: {summary['total_avg']}")
+        print(f"   최고: {summary['total_max']}")
+        print(f"   최저: {summary['total_min']}")
+        return summary
+
+    def build_partial(self, age_group, digest, results, summary):
+        """연령대 1개의 부분 집계 (기관 레코드 + 연령대 요약, 입력 다이제스트로 재사용 여부 판단)"""
+        return {
+            'age_group': age_group,
+            'digest': digest,
+            'summary': summary,
+            'records': results
+        }
+
+    def partial_settings(self):
+        """부분 집계 내용에 영향을 주는 설정 (manifest 에 저장, 다르면 모든 연령대 재처리)"""
+        return {
+            'version': PARTIALS_VERSION,
+            'q_columns': self.q_columns_map
+        }
+
+    def output_settings(self):
+        """
+        결과 파일 내용에 영향을 주는 설정 - 가중치, 출력기(minify / 압축 / 추가 형식), dedupe
+        (입력이 같아도 지난 실행과 다르면 결과를 다시 저장)
+        가중치 키가 (기관, 연령대) 이면 '기관|연령대' 로 저장
+        """
+        weights = None
+        if self.age_weights:
+            weights = {'|'.join(key) if isinstance(key, tuple) else key: float(value)
+                       for key, value in self.age_weights.items()}
+        return {
+            'age_weights': weights,
+            'minify': self.writer.minify,
+            'compress': sorted(self.writer.compress),
+            'formats': sorted(self.writer.formats),
+            'dedupe': self.dedupe
+        }
+
+    def derived_inputs(self):
+        """순위 색인·분할 파일에 들어가는 다른 분석기 결과 파일의 다이제스트 (없는 파일은 None)"""
+        return {
+            name: file_digest(self.output_dir / name) if (self.output_dir / name).exists() else None
+            for name in DERIVED_SOURCES
+        }
+
+    def derived_current(self):
+        """순위 색인·분할 파일이 모두 있고 마지막 생성 이후 다른 분석기 결과가 바뀌지 않았는지"""
+        if not all((self.output_dir / name).exists() for name in DERIVED_OUTPUTS):
+            return False
+        return self._load_manifest().get('derived') == self.derived_inputs()
+
+    def _record_outputs(self):
+        """결과 저장 후 manifest 에 이번 결과의 입력 다이제스트·설정과 파생 파일 입력 다이제스트 기록"""
+        self.partials_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        manifest['saved_digests'] = manifest['digests']
+        manifest['outputs'] = self.output_settings()
+        manifest['derived'] = self.derived_inputs()
+        self._write_json(self.partials_dir / 'manifest.json', manifest, indent=2)
+
+    def _load_manifest(self):
+        """
+        {'settings': partial_settings, 'digests': {연령대: 다이제스트},
+         'saved_digests': 결과 파일을 만든 입력의 digests, 'outputs': output_settings, 'derived': derived_inputs}
+        (없거나 옛 형식이면 빈 manifest)
+        """
+        manifest_file = self.partials_dir / 'manifest.json'
+        if manifest_file.exists():
+            with open(manifest_file, encoding='utf-8') as f:
+                manifest = json.load(f)
+            if 'digests' in manifest:
+                return manifest
+        return {'settings': None, 'digests': {}, 'saved_digests': None, 'outputs': None, 'derived': None}
+
+    def _write_json(self, path, data, **options):
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **options)
+        os.replace(tmp, path)
+
+    def analyze_incremental(self):
+        """
+        변경된 연령대 파일만 다시 처리
+
+        Returns:
+            (all_data, age_group_summary, site_averages, 변경된 연령대 목록)
+        """
+        print("=" * 60)
+        print("📊 연령별 국민평가 데이터 분석 시작 (증분)")
+        print("=" * 60)
+
+        self.partials_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        settings = self.partial_settings()
+        previous = manifest['digests']
+        if manifest['settings'] != settings:
+            # 형식 버전·설정이 바뀌면 저장된 부분 집계를 믿을 수 없음
+            if previous:
+                print("⚠️  부분 집계 형식·설정 변경 - 모든 연령대 재처리")
+            previous = {}
+
+        digests = {}
+        for age_group in self.age_groups:
+            path = workbook_path(self.data_dir, age_group)
+            if path.exists():
+                digests[age_group] = self.excel_cache.digest(path)
+            else:
+                print(f"⚠️  파일을 찾을 수 없습니다: {path.name}")
+
+        changed = [
+            age_group for age_group, digest in digests.items()
+            if previous.get(age_group) != digest
+            or not (self.partials_dir / f'{age_group}.json').exists()
+        ]
+        removed = [age_group for age_group in manifest['digests'] if age_group not in digests]
+
+        frames = load_age_groups(self.data_dir, changed, self.excel_cache) if changed else {}
+        partials = {}
+        for age_group in self.age_groups:
+            if age_group not in digests:
+                continue
+            partial_file = self.partials_dir / f'{age_group}.json'
+
+            if age_group in changed:
+                print(f"\n🔍 {age_group} 데이터 처리 중...")
+                df = self.load_age_group_data(age_group, frames)
+                results = self.process_age_group(df, age_group)
+                partial = self.build_partial(age_group, digests[age_group], results,
+                                             self.summarize_age_group(results))
+                self._write_json(partial_file, partial)
+            else:
+                with open(partial_file, encoding='utf-8') as f:
+                    partial = json.load(f)
+                print(f"\n♻️  {age_group}: 변경 없음 (저장된 부분 집계 사용)")
+            partials[age_group] = partial
+
+        for age_group in removed:
+            (self.partials_dir / f'{age_group}.json').unlink(missing_ok=True)
+
+        manifest.update(settings=settings, digests=digests)
+        self._write_json(self.partials_dir / 'manifest.json', manifest, indent=2)
+
+        all_data = []
+        age_group_summary = {}
+        for age_group in self.age_groups:
+            if age_group in partials:
+                all_data.extend(partials[age_group]['records'])
+                age_group_summary[age_group] = partials[age_group]['summary']
+
+        site_averages = self.calculate_site_averages(all_data) if all_data else []
+        return all_data, age_group_summary, site_averages, changed + removed
     
     def calculate_site_averages(self, all_data):
-        """기관별 전체 연령대 평균 계산"""
+        """기관별 전체 연령대 평균 계산 (기관 × 연령대 × 문항 큐브의 NaN 제외 가중 평균)"""
         print("\n📈 기관별 연령대 통합 점수 계산 중...")
         
-        site_data = {}
-        
-        # 기관명별로 그룹화
-        for item in all_data:
-            site_name = item['name']
-            
-            if site_name not in site_data:
-                site_data[site_name] = {
-                    'name': site_name,
-                    'url': item['url'],
-                    'age_groups': {},
-                    'scores_by_age': {}
-                }
-            
-            age_group = item['age_group']
-            site_data[site_name]['age_groups'][age_group] = {
-                'total_avg': item['total_avg'],
-                'convenience_avg': item['convenience_avg'],
-                'design_avg': item['design_avg'],
-                'scores': item['scores']
-            }
-        
-        # 전체 연령대 평균 계산
-        site_averages = []
-        for site_name, data in site_data.items():
-            age_totals = [v['total_avg'] for v in data['age_groups'].values()]
-            age_convenience = [v['convenience_avg'] for v in data['age_groups'].values()]
-            age_design = [v['design_avg'] for v in data['age_groups'].values()]
-            
-            # Q1~Q10 평균 계산
-            q_averages = {}
-            for q in ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Q7', 'Q8', 'Q9', 'Q10']:
-                q_scores = []
-                for age_data in data['age_groups'].values():
-                    if q in age_data['scores']:
-                        q_scores.append(age_data['scores'][q])
-                q_averages[q] = round(float(np.mean(q_scores)), 2) if q_scores else 0.0
-            
-            site_avg = {
-                'name': site_name,
-                'url': data['url'],
-                'total_avg': round(float(np.mean(age_totals)), 2),
-                'convenience_avg': round(float(np.mean(age_convenience)), 2),
-                'design_avg': round(float(np.mean(age_design)), 2),
-                'scores': q_averages,
-                'age_groups': data['age_groups']
-            }
-            
-            site_averages.append(site_avg)
-        
-        # 총합 평균으로 정렬
-        site_averages.sort(key=lambda x: x['total_avg'], reverse=True)
+        self.cube = ScoreCube.from_records(all_data, self.age_groups, list(self.q_columns_map),
+                                           self.age_weights)
+        site_averages = self.cube.site_averages()
         
         print(f"✅ {len(site_averages)}개 기관 통합 점수 계산 완료")
         
         return site_averages
     
     def get_rankings(self, site_averages, n=5):
-        """상위/하위 N개 기관"""
+        """상위/하위 N개 기관 (총합 평균 기준 힙 top-k, 차원별 전체 순위는 save_results 의 순위 색인)"""
+        key = lambda x: x['total_avg']
         return {
-            'top_5': site_averages[:n],
-            'bottom_5': site_averages[-n:]
+            'top_5': top_k(site_averages, n, key),
+            'bottom_5': bottom_k(site_averages, n, key)
         }
     
     def save_results(self, all_data, age_group_summary, site_averages, rankings):
@@ -212,56 +344,85 @@ class AgeGroupAnalyzer:
         
         # JSON 파일 저장
         files_saved = []
+        outputs = [
+            # 1. 전체 데이터
+            ('analysis_results.json', dedupe_all_data(final_data) if self.dedupe else final_data),
+            # 2. 기관별 평균 (간소화)
+            ('site_averages.json', site_averages),
+            # 3. 순위
+            ('rankings.json', rankings),
+            # 4. 연령대별 요약
+            ('age_group_summary.json', age_group_summary)
+        ]
+        for name, data in outputs:
+            for filepath in self.writer.write(self.output_dir / name, data):
+                files_saved.append(filepath)
+                print(f"   ✅ {filepath.name}")
         
-        # 1. 전체 데이터
-        filepath = self.output_dir / 'analysis_results.json'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=2)
-        files_saved.append(filepath)
-        print(f"   ✅ {filepath.name}")
-        
-        # 2. 기관별 평균 (간소화)
-        filepath = self.output_dir / 'site_averages.json'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(site_averages, f, ensure_ascii=False, indent=2)
-        files_saved.append(filepath)
-        print(f"   ✅ {filepath.name}")
-        
-        # 3. 순위
-        filepath = self.output_dir / 'rankings.json'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(rankings, f, ensure_ascii=False, indent=2)
-        files_saved.append(filepath)
-        print(f"   ✅ {filepath.name}")
+        # 5. 점수 큐브 (다른 분석 모듈이 메모리 매핑으로 사용)
+        if self.cube is not None:
+            filepath = self.output_dir / 'score_cube.npz'
+            self.cube.save(filepath)
+            files_saved.append(filepath)
+            print(f"   ✅ {filepath.name}")
         
-        # 4. 연령대별 요약
-        filepath = self.output_dir / 'age_group_summary.json'
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(age_group_summary, f, ensure_ascii=False, indent=2)
-        files_saved.append(filepath)
-        print(f"   ✅ {filepath.name}")
+        # 6. 차원별 순위 색인 (PHP API 용 SQLite + 차원별 상위/하위 JSON)
+        # 7. 기관별 분할 파일 + 색인 (대시보드 첫 화면용)
+        files_saved.extend(self.refresh_derived(site_averages))
         
         return files_saved
     
-    def run(self):
-        """전체 분석 실행"""
+    def refresh_derived(self, site_averages):
+        """순위 색인(rankings.sqlite, rankings/)과 기관별 분할 파일(sites/) 갱신"""
+        refresh_index(self.output_dir, site_averages)
+        refresh_shards(self.output_dir)
+        return [self.output_dir / 'rankings.sqlite', self.output_dir / 'sites' / 'index.json']
+    
+    def run(self, full=False):
+        """
+        전체 분석 실행
+
+        기본은 증분 모드: 입력 파일 다이제스트가 바뀐 연령대만 다시 처리하고,
+        나머지는 저장된 부분 집계로 site_averages / rankings / age_group_summary 를 다시 만든다.
+        full=True 면 모든 연령대를 처음부터 계산
+        """
         print("\n🚀 AutoAnalyzer - 연령별 분석 시작\n")
         
-        # 전체 연령대 데이터 분석
-        all_data, age_group_summary = self.analyze_all_age_groups()
+        if full:
+            # 전체 연령대 데이터 분석
+            all_data, age_group_summary = self.analyze_all_age_groups()
+            site_averages = self.calculate_site_averages(all_data) if all_data else []
+        else:
+            all_data, age_group_summary, site_averages, changed = self.analyze_incremental()
+            outputs_exist = all((self.output_dir / name).exists() for name in (
+                'analysis_results.json', 'site_averages.json', 'rankings.json', 'age_group_summary.json'))
+            # 가중치·출력 옵션이 지난 실행과 다르거나, 부분 집계만 갱신되고 결과 저장이
+            # 끝나지 않은 경우(중단 등)에는 입력이 같아도 다시 저장
+            manifest = self._load_manifest()
+            same_settings = (manifest.get('outputs') == self.output_settings()
+                             and manifest.get('saved_digests') == manifest['digests'])
+            if all_data and not changed and outputs_exist and same_settings:
+                if self.derived_current():
+                    print("\n✅ 변경된 입력 없음 - 기존 결과 유지")
+                    return True
+                # 결과 파일은 그대로, 순위 색인·분할 파일만 없거나 다른 분석기 결과가 바뀜
+                print("\n🔄 순위 색인·분할 파일 갱신 (결과 파일은 유지)")
+                self.refresh_derived(site_averages)
+                self._record_outputs()
+                return True
+            if all_data and not changed and not same_settings:
+                print("\n🔄 결과 설정 변경 또는 지난 저장 미완료 - 결과 다시 저장")
         
         if not all_data:
             print("\n❌ 분석할 데이터가 없습니다")
             return False
         
-        # 기관별 통합 점수 계산
-        site_averages = self.calculate_site_averages(all_data)
-        
         # 순위 추출
         rankings = self.get_rankings(site_averages)
         
         # 결과 저장
         files = self.save_results(all_data, age_group_summary, site_averages, rankings)
+        self._record_outputs()
         
         print("\n" + "=" * 60)
         print("✅ 분석 완료!")
@@ -269,7 +430,7 @@ class AgeGroupAnalyzer:
         print(f"\n📊 분석 결과:")
         print(f"   - 총 {len(site_averages)}개 기관")
         print(f"   - {len(self.age_groups)}개 연령대")
-        print(f"   - 평균 점수: {np.mean([s['total_avg'] for s in site_averages]):.2f}")
+        print(f"   - 평균 점수: {weighted_mean([s['total_avg'] for s in site_averages]):.2f}")
         
         print(f"\n📋 다음 단계:")
         print(f"   1. output/ 폴더의 JSON 파일 확인")
@@ -279,8 +440,34 @@ class AgeGroupAnalyzer:
         return True
 
 def main():
+    parser = argparse.ArgumentParser(description='연령별 국민평가 데이터 통합 분석')
+    parser.add_argument('--full', action='store_true', help='저장된 부분 집계를 무시하고 전체 재계산')
+    parser.add_argument('--minify', action='store_true', help='들여쓰기 없는 JSON 으로 저장')
+    parser.add_argument('--compress', default='', help='함께 만들 압축 파일 (쉼표 구분: gz,br)')
+    parser.add_argument('--formats', default='', help='추가 출력 형식 (쉼표 구분: msgpack,parquet)')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='analysis_results.json 의 all_data 를 site_averages 참조(all_data_index)로 대체')
+    parser.add_argument('--engine', choices=['auto', 'json', 'orjson'], default='auto', help='JSON 직렬화 엔진')
+    parser.add_argument('--weights', help='연령대별 응답자 수 가중치 (예: 20대=120,30대=95,...)')
+    args = parser.parse_args()
+
     analyzer = AgeGroupAnalyzer()
-    analyzer.run()
+    analyzer.writer = OutputWriter(
+        minify=args.minify,
+        compress=[c for c in args.compress.split(',') if c],
+        formats=[f for f in args.formats.split(',') if f],
+        engine=args.engine
+    )
+    analyzer.dedupe = args.dedupe
+    if args.weights:
+        analyzer.age_weights = {
+            age_group.strip(): float(count)
+            for age_group, count in (pair.split('=') for pair in args.weights.split(','))
+        }
+        missing = [age_group for age_group in analyzer.age_groups if age_group not in analyzer.age_weights]
+        if missing:
+            parser.error(f"--weights 에 없는 연령대: {', '.join(missing)}")
+    analyzer.run(full=args.full)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NaN 인식 가중 집계
+- 결측값은 NaN 으로 유지 (0.0 으로 채우지 않음) → 평균에서 자동 제외, 0 점 걸러내기 불필요
+- weights: 응답자 수 등 값과 브로드캐스트 가능한 배열 (없으면 모두 1)
+- 유효한 값이 하나도 없으면 결과도 NaN (JSON 출력 시 json_value 로 null)
+- 합산은 누적합(cumsum)으로 앞에서부터 차례로 더함 → 파이썬 sum / 반복문 합산과 같은 부동소수점 결과
+
+age_analyzer(score_cube), nielsen_analyzer, integrated_analyzer, heuristic_extractor,
+respondent_loader 가 함께 사용
+"""
+
+import numpy as np
+
+
+def as_array(values):
+    """목록 → float64 배열 (None 은 NaN)"""
+    return np.array(values, dtype=np.float64)
+
+
+def json_value(value, digits=None):
+    """NaN → None, 나머지는 (digits 가 있으면) 파이썬 round"""
+    if value is None or value != value:
+        return None
+    return round(value, digits) if digits is not None else value
+
+
+def _weights(values, weights):
+    valid = ~np.isnan(values)
+    if weights is None:
+        return valid, valid.astype(np.float64)
+    weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), values.shape)
+    valid &= ~np.isnan(weights) & (weights > 0)
+    return valid, np.where(valid, weights, 0.0)
+
+
+def _sum(array, axis):
+    """axis 방향 순차 합 (np.sum 의 pairwise 합산과 달리 파이썬 반복 합산과 같은 순서)"""
+    if array.shape[axis] == 0:
+        return np.zeros(np.delete(array.shape, axis))
+    return np.take(np.cumsum(array, axis=axis), -1, axis=axis)
+
+
+def weighted_mean(values, weights=None, axis=-1, return_weight=False):
+    """
+    NaN 을 제외한 가중 평균
+
+    Returns:
+        평균 (return_weight=True 면 (평균, 유효 가중치 합))
+    """
+    values = as_array(values)
+    valid, w = _weights(values, weights)
+    weighted = np.where(valid, values if weights is None else values * w, 0.0)
+
+    total = _sum(weighted, axis)
+    weight = _sum(w, axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(weight > 0, total / np.where(weight > 0, weight, 1.0), np.nan)
+    if mean.ndim == 0:
+        mean = float(mean)
+    return (mean, weight) if return_weight else mean
+
+
+def nan_max(values):
+    values = as_array(values)
+    return float(np.nanmax(values)) if (~np.isnan(values)).any() else float('nan')
+
+
+def nan_min(values):
+    values = as_array(values)
+    return float(np.nanmin(values)) if (~np.isnan(values)).any() else float('nan')
+
+
+def group_mean(keys, values, weights=None):
+    """
+    행별 키(기관명 등)로 묶은 가중 평균
+
+    Args:
+        keys: 행별 키 목록
+        values: [행, 필드] (NaN = 결측)
+        weights: [행] 또는 [행, 필드]
+
+    Returns:
+        (키 목록 - 처음 나온 순서, 평균 [그룹, 필드], 가중치 합 [그룹, 필드])
+    """
+    values = as_array(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim == 1:
+            weights = weights[:, None]
+    valid, w = _weights(values, weights)
+
+    index = {}
+    codes = np.array([index.setdefault(key, len(index)) for key in keys], dtype=np.int64)
+    total = np.zeros((len(index), values.shape[1]))
+    weight = np.zeros((len(index), values.shape[1]))
+    # np.add.at 은 행 순서대로 더함 (파이썬 반복 합산과 같은 결과)
+    np.add.at(total, codes, np.where(valid, values if weights is None else values * w, 0.0))
+    np.add.at(weight, codes, w)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(weight > 0, total / np.where(weight > 0, weight, 1.0), np.nan)
+    return list(index), mean, weight
+
+
+def cube_summary(cube, mask=None, weights=None):
+    """
+    [기관, 연령대, 필드] 큐브의 기관별·연령대별·전체 가중 평균을 한 번에 계산
+
+    Args:
+        mask: [기관, 연령대] 평가 여부 (False 인 칸은 값과 무관하게 제외)
+        weights: [기관, 연령대] 응답자 수 (또는 [기관, 연령대, 필드])
+
+    Returns:
+        {'site': [기관, 필드], 'age': [연령대, 필드], 'overall': [필드],
+         'site_weight': [기관, 필드], 'age_weight': [연령대, 필드]}
+    """
+    cube = np.asarray(cube, dtype=np.float64)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim == 2:
+            weights = weights[:, :, None]
+    valid, w = _weights(cube, weights)
+    if mask is not None:
+        valid &= np.asarray(mask, dtype=bool)[:, :, None]
+        w = np.where(valid, w, 0.0)
+    weighted = np.where(valid, cube if weights is None else cube * w, 0.0)
+
+    def mean(total, weight):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(weight > 0, total / np.where(weight > 0, weight, 1.0), np.nan)
+
+    site_total = _sum(weighted, 1)
+    site_weight = _sum(w, 1)
+    age_total = _sum(weighted, 0)
+    age_weight = _sum(w, 0)
+    return {
+        'site': mean(site_total, site_weight),
+        'age': mean(age_total, age_weight),
+        'overall': mean(_sum(age_total, 0), _sum(age_weight, 0)),
+        'site_weight': site_weight,
+        'age_weight': age_weight
+    }
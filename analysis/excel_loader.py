@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연령대별 평가 엑셀(UI_UX 평가시스템_<연령대>.xlsx) 공통 로더
+- 캐시에 없는 파일만 프로세스 풀에서 병렬 파싱 (openpyxl 파싱이 대부분의 시간)
+- 파싱 결과는 컬럼 단위 캐시로 저장 (pyarrow 가 있으면 Parquet, 없으면 pandas pickle)
+- 캐시 키: 파일 경로 + 수정 시각/크기, 수정 시각이 바뀌면 내용 해시(sha256)로 다시 확인
+  → 반복 실행 시 엑셀 파싱을 완전히 건너뜀
+
+age_analyzer.py, nielsen_analyzer.py 가 함께 사용
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+AGE_GROUPS = ['20대', '30대', '40대', '50대', '60대이상', '디지털취약계층']
+
+# Q1~Q10 컬럼 (Q1~Q6 편의성, Q7~Q10 디자인)
+Q_COLUMNS = {
+    'Q1': '1.원하는 목적을 달성할 수 있었나요?',
+    'Q2': '2.서비스 이용이 편리 했나요?',
+    'Q3': '3. 전문성 없이도 쉽게 이해할 수 있었나요?',
+    'Q4': '4. 어떤 페이지에서 든 메뉴 이동이 쉬웠나요?',
+    'Q5': '5. 잘못 입력했을 경우 경고 메시지가 표시되나요?',
+    'Q6': '6. 당신이 원하는 서비스(신청, 조회 콘텐츠 상세 등) 이용에 대해 친절하게 설명해 주었나요?',
+    'Q7': '7. 시각적으로 서비스의 내용이 잘 구분되어 있나요?',
+    'Q8': '8. 제목, 글머리표, 아이콘, 이미지 등이 일관성 있게 배치되어 통일감 있게 느끼셨나요?',
+    'Q9': '9. 보편적이고 익숙한 구조를 사용하고 있나요?',
+    'Q10': '10. 색상간의 조화가 잘 이루어지고 있나요?'
+}
+CONVENIENCE_QUESTIONS = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6']
+DESIGN_QUESTIONS = ['Q7', 'Q8', 'Q9', 'Q10']
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / '.cache' / 'excel'
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+
+def workbook_path(data_dir, age_group):
+    return Path(data_dir) / f'UI_UX 평가시스템_{age_group}.xlsx'
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_frame(df, cache_file):
+    tmp = cache_file.with_name(cache_file.name + '.tmp')
+    if CACHE_FORMAT == 'parquet':
+        df.to_parquet(tmp)
+    else:
+        df.to_pickle(tmp)
+    os.replace(tmp, cache_file)
+
+
+def _read_frame(cache_file):
+    if CACHE_FORMAT == 'parquet':
+        return pd.read_parquet(cache_file)
+    return pd.read_pickle(cache_file)
+
+
+def _parse_workbook(path, cache_file):
+    """프로세스 풀 작업: 엑셀 파싱 → 캐시 기록"""
+    df = pd.read_excel(path)
+    _write_frame(df, Path(cache_file))
+    return df
+
+
+class ExcelCache:
+    """엑셀 파일 → DataFrame 캐시 (cache_dir/manifest.json + 내용 해시별 캐시 파일)"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, workers=None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_file = self.cache_dir / 'manifest.json'
+        self.workers = workers
+        self.manifest = {}
+        if self.manifest_file.exists():
+            with open(self.manifest_file, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        self.hits = 0
+        self.parsed = 0
+
+    def _cache_file(self, digest):
+        suffix = '.parquet' if CACHE_FORMAT == 'parquet' else '.pkl'
+        return self.cache_dir / f'{digest}{suffix}'
+
+    def digest(self, path):
+        """내용 해시 (경로·수정 시각·크기가 manifest 와 같으면 다시 계산하지 않음)"""
+        stat = os.stat(path)
+        entry = self.manifest.get(str(path))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['sha256']
+
+        sha = file_digest(path)
+        self.manifest[str(path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha}
+        return sha
+
+    def load(self, paths):
+        """
+        여러 엑셀 파일 로드
+
+        Returns:
+            {경로: DataFrame} - 없는 파일은 결과에서 빠짐
+        """
+        frames = {}
+        pending = []
+        for path in paths:
+            path = Path(path)
+            if not path.exists():
+                continue
+            cache_file = self._cache_file(self.digest(path))
+            if cache_file.exists():
+                try:
+                    frames[path] = _read_frame(cache_file)
+                    self.hits += 1
+                    continue
+                except Exception:
+                    cache_file.unlink(missing_ok=True)
+            pending.append((path, cache_file))
+
+        if len(pending) > 1 and self.workers != 1:
+            workers = min(len(pending), self.workers or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [(path, pool.submit(_parse_workbook, str(path), str(cache_file)))
+                           for path, cache_file in pending]
+                for path, future in futures:
+                    frames[path] = future.result()
+        else:
+            for path, cache_file in pending:
+                frames[path] = _parse_workbook(path, cache_file)
+        self.parsed += len(pending)
+
+        self._save_manifest()
+        return frames
+
+    def _save_manifest(self):
+        tmp = self.manifest_file.with_name('manifest.json.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.manifest_file)
+
+
+def load_age_groups(data_dir, age_groups=AGE_GROUPS, cache=None):
+    """
+    연령대별 평가 데이터 로드
+
+    Returns:
+        {연령대: DataFrame 또는 None(파일 없음)} - age_groups 순서
+    """
+    cache = cache or ExcelCache()
+    paths = {age_group: workbook_path(data_dir, age_group) for age_group in age_groups}
+    frames = cache.load(paths.values())
+    return {age_group: frames.get(path) for age_group, path in paths.items()}
@@ -15,6 +15,9 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ranking_index import refresh_index
+from site_shards import refresh_shards
+
 class FinalIntegrator:
     def __init__(self):
         self.nielsen_principles = {
@@ -207,6 +210,9 @@ class FinalIntegrator:
         """결과 저장"""
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
+        # 최종 Nielsen 점수 차원(nielsen) 순위 색인과 기관별 분할 파일 갱신
+        refresh_index(output_path.parent)
+        refresh_shards(output_path.parent)
         
         stats = results["statistics"]
         print(f"💾 저장 완료: {output_path}\n")
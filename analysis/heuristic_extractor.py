@@ -11,6 +11,8 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, List
 
+from aggregation import json_value, weighted_mean
+
 class HeuristicEvaluationExtractor:
     def __init__(self, excel_dir: str, output_dir: str):
         self.excel_dir = Path(excel_dir)
@@ -71,22 +73,21 @@ class HeuristicEvaluationExtractor:
                     if pd.notna(score) and isinstance(score, (int, float)):
                         scores[item_name] = float(score)
                     else:
-                        scores[item_name] = 0.0
+                        scores[item_name] = None
                 except Exception as e:
                     print(f"   ⚠️  행 {row_idx} 점수 추출 실패: {e}")
-                    scores[item_name] = 0.0
+                    scores[item_name] = None
             
-            # 전체 평균 계산
-            valid_scores = [s for s in scores.values() if s > 0]
-            overall_avg = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
+            # 전체 평균 계산 (점수 없는 항목(null)은 제외)
+            overall_avg = weighted_mean(list(scores.values()))
             
             return {
                 "agency": agency_name,
                 "url": url,
                 "scores": scores,
-                "overall_average": round(overall_avg, 2),
+                "overall_average": json_value(overall_avg, 2) or 0.0,
                 "total_items": len(self.heuristic_items),
-                "valid_items": len(valid_scores)
+                "valid_items": sum(1 for s in scores.values() if s is not None)
             }
             
         except Exception as e:
@@ -140,7 +141,7 @@ class HeuristicEvaluationExtractor:
         
         # 전체 평균 계산
         if all_scores:
-            all_results["statistics"]["average_score"] = round(sum(all_scores) / len(all_scores), 2)
+            all_results["statistics"]["average_score"] = json_value(weighted_mean(all_scores), 2)
         
         return all_results
     
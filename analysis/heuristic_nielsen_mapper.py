@@ -103,6 +103,9 @@ class HeuristicToNielsenMapper:
             nielsen_scores = {i: [] for i in range(1, 11)}
             
             for heuristic_item, score in heuristic_scores.items():
+                # 점수 없는 항목(null)은 원칙 평균에서 제외 (0.0 은 실제 점수)
+                if score is None:
+                    continue
                 if heuristic_item in self.mapping:
                     mapping_info = self.mapping[heuristic_item]
                     nielsen_principles = mapping_info["nielsen"]
@@ -8,6 +8,22 @@ import json
 import pandas as pd
 from pathlib import Path
 
+from aggregation import json_value, weighted_mean
+
+# 국민평가 Q → Nielsen 원칙 (원칙 점수 = 해당 Q 들의 NaN 제외 평균)
+NIELSEN_Q_MAP = [
+    ('N1_visibility', ['Q1', 'Q2']),        # 시스템 상태의 가시성
+    ('N2_match', ['Q3', 'Q4']),             # 시스템과 현실 세계의 일치
+    ('N3_control', ['Q5']),                 # 사용자 제어 및 자유
+    ('N4_consistency', ['Q6', 'Q7']),       # 일관성 및 표준
+    ('N5_error_prevention', ['Q8']),        # 오류 예방
+    ('N6_recognition', ['Q9']),             # 기억보다 인식
+    ('N7_flexibility', ['Q10']),            # 유연성 및 효율성
+    ('N8_minimalism', ['Q6']),              # 미니멀 디자인 (디자인 관련)
+    ('N9_error_recovery', ['Q8']),          # 오류 인식, 진단 및 복구
+    ('N10_help', ['Q9'])                    # 도움말 및 문서
+]
+
 def load_national_evaluation():
     """국민평가 데이터 로드 (Q1~Q10)"""
     data_file = Path('/home/user/webapp/web/data/site_averages.json')
@@ -87,9 +103,9 @@ def integrate_data():
     for site in national_data:
         site_name = site['name']
         
-        # 국민평가 점수 (Q1~Q10 평균)
+        # 국민평가 점수 (Q1~Q10 평균, 응답 없는 문항(null)은 제외)
         q_scores = site['scores']
-        national_avg = sum(q_scores.values()) / len(q_scores)
+        national_avg = weighted_mean(list(q_scores.values()))
         
         # KRDS 편의성 점수 매핑
         krds_score = map_site_name_to_krds(site_name, krds_dict)
@@ -98,16 +114,7 @@ def integrate_data():
         integrated_site = {
             'site_name': site_name,
             'national_evaluation': {
-                'Q1': q_scores.get('Q1', 0),
-                'Q2': q_scores.get('Q2', 0),
-                'Q3': q_scores.get('Q3', 0),
-                'Q4': q_scores.get('Q4', 0),
-                'Q5': q_scores.get('Q5', 0),
-                'Q6': q_scores.get('Q6', 0),
-                'Q7': q_scores.get('Q7', 0),
-                'Q8': q_scores.get('Q8', 0),
-                'Q9': q_scores.get('Q9', 0),
-                'Q10': q_scores.get('Q10', 0),
+                **{f'Q{i}': q_scores.get(f'Q{i}') for i in range(1, 11)},
                 'average': national_avg
             },
             'krds_convenience': krds_score,
@@ -128,36 +135,11 @@ def calculate_nielsen_scores(integrated_data):
         nat_eval = site['national_evaluation']
         krds = site['krds_convenience']
         
-        # Nielsen 항목별 점수 계산 (국민평가 Q1~Q10 매핑)
-        # N1: 시스템 상태의 가시성 → Q1, Q2
-        n1_score = (nat_eval['Q1'] + nat_eval['Q2']) / 2
-        
-        # N2: 시스템과 현실 세계의 일치 → Q3, Q4
-        n2_score = (nat_eval['Q3'] + nat_eval['Q4']) / 2
-        
-        # N3: 사용자 제어 및 자유 → Q5
-        n3_score = nat_eval['Q5']
-        
-        # N4: 일관성 및 표준 → Q6, Q7
-        n4_score = (nat_eval['Q6'] + nat_eval['Q7']) / 2
-        
-        # N5: 오류 예방 → Q8
-        n5_score = nat_eval['Q8']
-        
-        # N6: 기억보다 인식 → Q9
-        n6_score = nat_eval['Q9']
-        
-        # N7: 유연성 및 효율성 → Q10
-        n7_score = nat_eval['Q10']
-        
-        # N8: 미니멀 디자인 → Q6 (디자인 관련)
-        n8_score = nat_eval['Q6']
-        
-        # N9: 오류 인식, 진단 및 복구 → Q8
-        n9_score = nat_eval['Q8']
-        
-        # N10: 도움말 및 문서 → Q9
-        n10_score = nat_eval['Q9']
+        # Nielsen 항목별 점수 계산 (국민평가 Q1~Q10 매핑, NIELSEN_Q_MAP)
+        n_scores = {
+            code: weighted_mean([nat_eval[q] for q in questions])
+            for code, questions in NIELSEN_Q_MAP
+        }
         
         # KRDS 편의성 가중치 적용 (있는 경우)
         if krds:
@@ -165,39 +147,16 @@ def calculate_nielsen_scores(integrated_data):
             krds_normalized = krds / 20.0
             
             # 가중 평균 (국민평가 70% + KRDS 30%)
-            nielsen_avg = (
-                n1_score * 0.7 + krds_normalized * 0.3 +
-                n2_score * 0.7 + krds_normalized * 0.3 +
-                n3_score * 0.7 + krds_normalized * 0.3 +
-                n4_score * 0.7 + krds_normalized * 0.3 +
-                n5_score * 0.7 + krds_normalized * 0.3 +
-                n6_score * 0.7 + krds_normalized * 0.3 +
-                n7_score * 0.7 + krds_normalized * 0.3 +
-                n8_score * 0.7 + krds_normalized * 0.3 +
-                n9_score * 0.7 + krds_normalized * 0.3 +
-                n10_score * 0.7 + krds_normalized * 0.3
-            ) / 10
+            nielsen_avg = weighted_mean([score * 0.7 + krds_normalized * 0.3 for score in n_scores.values()])
         else:
             # KRDS 없는 경우 국민평가만 사용
-            nielsen_avg = (n1_score + n2_score + n3_score + n4_score + n5_score + 
-                          n6_score + n7_score + n8_score + n9_score + n10_score) / 10
+            nielsen_avg = weighted_mean(list(n_scores.values()))
         
         nielsen_site = {
             'site_name': site_name,
-            'nielsen_scores': {
-                'N1_visibility': round(n1_score, 2),
-                'N2_match': round(n2_score, 2),
-                'N3_control': round(n3_score, 2),
-                'N4_consistency': round(n4_score, 2),
-                'N5_error_prevention': round(n5_score, 2),
-                'N6_recognition': round(n6_score, 2),
-                'N7_flexibility': round(n7_score, 2),
-                'N8_minimalism': round(n8_score, 2),
-                'N9_error_recovery': round(n9_score, 2),
-                'N10_help': round(n10_score, 2)
-            },
-            'nielsen_average': round(nielsen_avg, 2),
-            'national_average': round(nat_eval['average'], 2),
+            'nielsen_scores': {code: json_value(score, 2) for code, score in n_scores.items()},
+            'nielsen_average': json_value(nielsen_avg, 2),
+            'national_average': json_value(nat_eval['average'], 2),
             'krds_score': round(krds / 20.0, 2) if krds else None,
             'has_krds': site['has_krds']
         }
@@ -242,21 +201,22 @@ def main():
     print("📈 Nielsen 점수 통계")
     print("="*60 + "\n")
     
-    # 평균 점수 순위
-    sorted_sites = sorted(nielsen_data, key=lambda x: x['nielsen_average'], reverse=True)
+    # 평균 점수 순위 (점수가 없는 기관은 '-')
+    score_text = lambda score: f"{score:.2f}점" if score is not None else '-'
+    sorted_sites = sorted(nielsen_data, key=lambda x: x['nielsen_average'] or 0.0, reverse=True)
     
     print("🏆 Nielsen 최고점 TOP 10:")
     for i, site in enumerate(sorted_sites[:10], 1):
         krds_indicator = "✓" if site['has_krds'] else " "
-        print(f"   {i:2d}. [{krds_indicator}] {site['site_name']:30s} {site['nielsen_average']:.2f}점")
+        print(f"   {i:2d}. [{krds_indicator}] {site['site_name']:30s} {score_text(site['nielsen_average'])}")
     
     print("\n⚠️ Nielsen 최저점 BOTTOM 10:")
     for i, site in enumerate(sorted_sites[-10:], 1):
         krds_indicator = "✓" if site['has_krds'] else " "
-        print(f"   {i:2d}. [{krds_indicator}] {site['site_name']:30s} {site['nielsen_average']:.2f}점")
+        print(f"   {i:2d}. [{krds_indicator}] {site['site_name']:30s} {score_text(site['nielsen_average'])}")
     
     # 평균
-    avg_nielsen = sum(s['nielsen_average'] for s in nielsen_data) / len(nielsen_data)
+    avg_nielsen = weighted_mean([s['nielsen_average'] for s in nielsen_data])
     print(f"\n📊 전체 평균: {avg_nielsen:.2f}점")
     print(f"✓ = KRDS 데이터 포함\n")
 
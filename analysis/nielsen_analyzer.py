@@ -5,10 +5,239 @@ Nielsen 10원칙 기반 25개 세부 항목 UI/UX 분석기
 """
 
 import json
-import pandas as pd
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+from aggregation import group_mean
+from excel_loader import AGE_GROUPS, Q_COLUMNS, load_age_groups, workbook_path
+from nielsen_projection import PROJECTION
+from output_writer import OutputWriter, compact_reports
+from site_shards import refresh_shards
+
+DIAGNOSIS_LEVELS = ("poor", "good", "excellent")
+
+# 항목별 진단 템플릿 (점수 구간별 진단 문구 + 개선 방안)
+DIAGNOSIS_TEMPLATES = {
+    "N1.1": {
+        "excellent": (4.5, "✅ Breadcrumb가 모든 페이지에 명확히 표시되며, 현재 위치가 하이라이트 처리되어 있습니다."),
+        "good": (3.5, "⚠️ Breadcrumb가 일부 페이지에서만 제공되거나 시각적으로 눈에 띄지 않습니다."),
+        "poor": (0, "❌ Breadcrumb가 없어 사용자가 현재 어느 페이지에 있는지 파악하기 어렵습니다."),
+        "improvement": "상단에 '홈 > 카테고리 > 현재페이지' 형태의 Breadcrumb을 추가하고, 현재 페이지는 굵은 글씨로 강조하세요."
+    },
+    "N1.2": {
+        "excellent": (4.5, "✅ 로딩 시 진행률 표시 또는 스피너가 명확히 나타나며, 예상 소요 시간이 표시됩니다."),
+        "good": (3.5, "⚠️ 로딩 인디케이터는 있지만 작거나 눈에 띄지 않습니다."),
+        "poor": (0, "❌ 로딩 상태 표시가 없어 사용자가 시스템이 작동 중인지 알 수 없습니다."),
+        "improvement": "중앙에 큰 스피너를 표시하고, '데이터를 불러오는 중...' 메시지를 추가하세요. 3초 이상 소요 시 진행률(%)을 표시하세요."
+    },
+    "N1.3": {
+        "excellent": (4.5, "✅ 작업 완료 시 '저장되었습니다' 등의 성공 메시지가 명확히 표시됩니다."),
+        "good": (3.5, "⚠️ 피드백이 제공되지만 너무 빠르게 사라지거나 눈에 띄지 않습니다."),
+        "poor": (0, "❌ 작업 완료 여부를 알 수 없어 사용자가 불안감을 느낍니다."),
+        "improvement": "화면 상단에 3초간 녹색 배경의 '✓ 저장되었습니다' 토스트 메시지를 표시하세요."
+    },
+    "N2.1": {
+        "excellent": (4.5, "✅ 모든 메뉴와 안내가 일상 언어로 작성되어 누구나 쉽게 이해할 수 있습니다."),
+        "good": (3.5, "⚠️ 일부 행정 용어나 전문 용어가 사용되지만 설명이 제공됩니다."),
+        "poor": (0, "❌ '대장조회', '통합민원' 등 전문 용어가 남발되어 일반 시민이 이해하기 어렵습니다."),
+        "improvement": "'대장조회' → '내 신청 내역 보기', '통합민원' → '문의하기'로 변경하고, 필요 시 말풍선 설명을 추가하세요."
+    },
+    "N2.2": {
+        "excellent": (4.5, "✅ 메뉴 구조가 사용자의 실제 업무 흐름을 반영하여 직관적입니다."),
+        "good": (3.5, "⚠️ 메뉴 구조는 논리적이지만 일부 항목이 예상과 다른 위치에 있습니다."),
+        "poor": (0, "❌ 조직도 중심으로 구성되어 사용자가 원하는 서비스를 찾기 어렵습니다."),
+        "improvement": "조직 중심 메뉴를 사용자 목적 중심(예: '신청', '조회', '상담')으로 재구성하세요."
+    },
+    "N2.3": {
+        "excellent": (4.5, "✅ 모든 아이콘이 Material Design 등 표준을 따르며, 직관적으로 의미를 파악할 수 있습니다."),
+        "good": (3.5, "⚠️ 대부분의 아이콘은 이해 가능하지만 일부는 의미가 불분명합니다."),
+        "poor": (0, "❌ 추상적이거나 생소한 아이콘이 사용되어 사용자가 혼란스러워합니다."),
+        "improvement": "🏠(홈), 🔍(검색), 📄(문서) 등 보편적 아이콘을 사용하고, 모든 아이콘에 텍스트 레이블을 병기하세요."
+    },
+    "N3.1": {
+        "excellent": (4.5, "✅ 모든 페이지에 '이전' 버튼이 명확히 표시되며, 브라우저 뒤로가기도 정상 작동합니다."),
+        "good": (3.5, "⚠️ 뒤로가기 버튼은 있지만 일부 페이지에서 누락되거나 눈에 띄지 않습니다."),
+        "poor": (0, "❌ 뒤로가기 시 입력한 데이터가 손실되거나, 뒤로가기 버튼이 없어 답답함을 느낍니다."),
+        "improvement": "상단 좌측에 '← 이전' 버튼을 배치하고, 브라우저 뒤로가기와 연동하여 데이터를 보존하세요."
+    },
+    "N3.2": {
+        "excellent": (4.5, "✅ 긴 신청서에서 5분마다 자동 저장되며, '임시 저장' 버튼도 제공됩니다."),
+        "good": (3.5, "⚠️ 임시 저장 기능은 있지만 자동 저장이 없거나 저장 시점을 알 수 없습니다."),
+        "poor": (0, "❌ 임시 저장 기능이 없어 사용자가 실수로 페이지를 닫으면 모든 입력이 날아갑니다."),
+        "improvement": "5분마다 자동 저장하고, '마지막 저장: 2분 전' 메시지를 표시하세요. '임시 저장' 버튼을 우측 하단에 배치하세요."
+    },
+    "N3.3": {
+        "excellent": (4.5, "✅ 사용자가 검색 기록, 즐겨찾기 등을 자유롭게 삭제하고 관리할 수 있습니다."),
+        "good": (3.5, "⚠️ 일부 데이터는 관리 가능하지만 검색 기록 삭제 등 일부 기능이 누락되었습니다."),
+        "poor": (0, "❌ 사용자가 자신의 데이터를 제어할 수 없어 프라이버시 우려가 있습니다."),
+        "improvement": "검색창 우측에 '기록 지우기' 버튼을 추가하고, 설정 페이지에서 모든 활동 데이터를 관리할 수 있게 하세요."
+    },
+    "N4.1": {
+        "excellent": (4.5, "✅ 모든 주요 버튼이 동일한 색상과 크기를 유지하며, 위치도 일관적입니다."),
+        "good": (3.5, "⚠️ 대부분의 버튼은 일관적이지만 일부 페이지에서 다른 스타일이 사용됩니다."),
+        "poor": (0, "❌ 페이지마다 버튼 색상과 위치가 달라 사용자가 혼란스러워합니다."),
+        "improvement": "디자인 시스템을 정의하세요. 예: Primary 버튼(파란색, 우측), Secondary 버튼(회색, 좌측), Danger 버튼(빨간색)."
+    },
+    "N4.2": {
+        "excellent": (4.5, "✅ 브랜드 컬러가 모든 페이지에 일관되게 적용되며, Primary/Secondary 색상이 명확합니다."),
+        "good": (3.5, "⚠️ 색상 체계는 있지만 일부 페이지에서 다른 색상이 혼재되어 있습니다."),
+        "poor": (0, "❌ 페이지마다 색상이 다르고, 브랜드 정체성을 느낄 수 없습니다."),
+        "improvement": "Primary: #0066CC, Secondary: #6C757D, Success: #28A745, Danger: #DC3545, Warning: #FFC107로 통일하세요."
+    },
+    "N4.3": {
+        "excellent": (4.5, "✅ 제목(24px 굵게), 본문(16px 보통), 캡션(14px 얇게) 등 타이포그래피 계층이 명확합니다."),
+        "good": (3.5, "⚠️ 글꼴 크기는 구분되지만 일부 페이지에서 다른 굵기가 사용됩니다."),
+        "poor": (0, "❌ 글꼴 크기와 굵기가 일관성 없이 사용되어 시각적 계층이 불분명합니다."),
+        "improvement": "H1: 32px Bold, H2: 24px Semi-bold, 본문: 16px Regular, 캡션: 14px Light로 통일하세요."
+    },
+    "N5.1": {
+        "excellent": (4.5, "✅ 모든 입력 필드에 '예: 010-1234-5678' 형태의 명확한 가이드가 제공됩니다."),
+        "good": (3.5, "⚠️ 일부 필드에만 가이드가 있거나, 가이드가 불명확합니다."),
+        "poor": (0, "❌ 입력 형식 안내가 없어 사용자가 시행착오를 겪습니다."),
+        "improvement": "입력 필드 아래에 회색 작은 글씨로 '예: 010-1234-5678' 또는 placeholder로 표시하세요."
+    },
+    "N5.2": {
+        "excellent": (4.5, "✅ 입력 중 또는 포커스 아웃 시 즉시 유효성 검사가 수행되고 오류가 표시됩니다."),
+        "good": (3.5, "⚠️ 유효성 검사는 있지만 제출 버튼을 눌러야만 확인됩니다."),
+        "poor": (0, "❌ 제출 후에야 오류를 알 수 있어 사용자가 불편을 느낍니다."),
+        "improvement": "입력 필드에서 포커스가 벗어날 때 즉시 검사하고, 오류 시 빨간색 테두리 + 메시지를 표시하세요."
+    },
+    "N5.3": {
+        "excellent": (4.5, "✅ 삭제, 제출 등 중요한 작업 전 '정말 삭제하시겠습니까?' 확인 메시지가 나타납니다."),
+        "good": (3.5, "⚠️ 일부 중요 작업에만 확인 메시지가 제공됩니다."),
+        "poor": (0, "❌ 삭제 버튼 클릭 즉시 삭제되어 사용자가 실수로 데이터를 잃을 위험이 있습니다."),
+        "improvement": "삭제/제출 버튼 클릭 시 모달 창을 띄우고, '취소' / '확인' 버튼을 제공하세요."
+    },
+    "N6.1": {
+        "excellent": (4.5, "✅ 검색창 클릭 시 최근 5개 검색어가 드롭다운으로 표시되며, 클릭 한 번으로 재검색 가능합니다."),
+        "good": (3.5, "⚠️ 최근 검색어는 표시되지만 수량이 적거나 삭제 기능이 없습니다."),
+        "poor": (0, "❌ 검색어를 매번 새로 입력해야 하여 반복 작업 시 불편합니다."),
+        "improvement": "검색창 포커스 시 최근 5개 검색어를 드롭다운으로 표시하고, 각 항목에 'X' 삭제 버튼을 추가하세요."
+    },
+    "N6.2": {
+        "excellent": (4.5, "✅ 입력 중 실시간으로 연관 검색어가 제안되며, 화살표 키로 선택 가능합니다."),
+        "good": (3.5, "⚠️ 자동완성은 있지만 정확도가 낮거나 반응이 느립니다."),
+        "poor": (0, "❌ 자동완성 기능이 없어 긴 검색어를 끝까지 입력해야 합니다."),
+        "improvement": "Google 스타일 자동완성을 구현하세요. 2글자 이상 입력 시 상위 5개 제안을 드롭다운으로 표시하세요."
+    },
+    "N6.3": {
+        "excellent": (4.5, "✅ 모든 아이콘과 버튼에 마우스를 올리면 툴팁이 나타나 기능을 설명합니다."),
+        "good": (3.5, "⚠️ 일부 아이콘에만 툴팁이 제공되거나, 설명이 불명확합니다."),
+        "poor": (0, "❌ 아이콘만 있고 설명이 없어 사용자가 기능을 추측해야 합니다."),
+        "improvement": "모든 아이콘에 title 속성을 추가하고, hover 시 0.5초 후 툴팁을 표시하세요. 예: '출력', '다운로드', '공유'."
+    },
+    "N7.1": {
+        "excellent": (4.5, "✅ Ctrl+S(저장), Enter(검색), Tab(필드 이동) 등 주요 단축키가 지원되며 안내가 제공됩니다."),
+        "good": (3.5, "⚠️ 일부 단축키는 작동하지만 안내가 없어 사용자가 알기 어렵습니다."),
+        "poor": (0, "❌ 키보드만으로는 작업이 불가능하며, 마우스에 의존해야 합니다."),
+        "improvement": "주요 버튼에 'Ctrl+S로 저장' 힌트를 표시하고, 도움말에 단축키 목록을 제공하세요."
+    },
+    "N7.2": {
+        "excellent": (4.5, "✅ 상단에 '자주 찾는 메뉴'가 있으며, 사용자가 드래그로 순서를 변경하고 추가/삭제할 수 있습니다."),
+        "good": (3.5, "⚠️ 즐겨찾기 기능은 있지만 커스터마이징이 제한적입니다."),
+        "poor": (0, "❌ 즐겨찾기 기능이 없어 자주 쓰는 메뉴를 매번 찾아야 합니다."),
+        "improvement": "각 메뉴 옆에 '★ 즐겨찾기 추가' 버튼을 배치하고, 상단에 즐겨찾기 바를 고정하세요."
+    },
+    "N7.3": {
+        "excellent": (4.5, "✅ 검색 결과를 날짜, 카테고리, 지역 등 다양한 필터로 정렬하고 좁힐 수 있습니다."),
+        "good": (3.5, "⚠️ 기본 필터(날짜)는 있지만 고급 옵션이 부족합니다."),
+        "poor": (0, "❌ 검색 시 필터가 없어 원하는 결과를 찾기 어렵습니다."),
+        "improvement": "좌측 사이드바에 '필터: 날짜, 카테고리, 지역' 체크박스를 추가하고, '정렬: 최신순/인기순'을 제공하세요."
+    },
+    "N8.1": {
+        "excellent": (4.5, "✅ 한 화면에 핵심 정보만 표시되며, 추가 정보는 '더보기'로 접근할 수 있습니다."),
+        "good": (3.5, "⚠️ 정보량은 적절하지만 일부 페이지에서 과도한 텍스트가 표시됩니다."),
+        "poor": (0, "❌ 한 화면에 너무 많은 정보가 빽빽하게 표시되어 압도감을 느낍니다."),
+        "improvement": "정보를 탭이나 아코디언으로 숨기고, 첫 화면에는 주요 CTA와 3~5개 핵심 메뉴만 표시하세요."
+    },
+    "N8.2": {
+        "excellent": (4.5, "✅ 요소 간 여백이 충분하고(20px 이상), 그리드 시스템을 사용하여 정돈된 느낌을 줍니다."),
+        "good": (3.5, "⚠️ 여백은 있지만 일부 영역이 답답하거나 불규칙합니다."),
+        "poor": (0, "❌ 여백 없이 요소들이 붙어 있어 답답하고 가독성이 떨어집니다."),
+        "improvement": "요소 간 최소 20px 여백을 확보하고, 12-column 그리드 시스템을 적용하세요."
+    },
+    "N8.3": {
+        "excellent": (4.5, "✅ 제목이 가장 크고 굵으며, 중요도에 따라 크기와 색상이 차등 적용되어 시선 흐름이 명확합니다."),
+        "good": (3.5, "⚠️ 제목과 본문은 구분되지만 중요도 표시가 불명확합니다."),
+        "poor": (0, "❌ 모든 텍스트가 비슷한 크기와 색상으로 되어 있어 어디를 먼저 봐야 할지 모릅니다."),
+        "improvement": "제목(32px, 검은색), 부제목(24px, 진회색), 본문(16px, 회색)으로 계층을 명확히 하고, 주요 CTA는 큰 버튼으로 강조하세요."
+    },
+    "N9.1": {
+        "excellent": (4.5, "✅ 오류 메시지가 '이메일 형식이 올바르지 않습니다. 예: user@example.com' 처럼 구체적입니다."),
+        "good": (3.5, "⚠️ 오류 메시지는 제공되지만 '잘못된 입력' 등 추상적입니다."),
+        "poor": (0, "❌ 'Error 500: Internal Server Error' 등 기술 용어로만 표시되어 사용자가 이해할 수 없습니다."),
+        "improvement": "기술 용어 대신 '일시적 오류가 발생했습니다. 잠시 후 다시 시도해주세요.' 형태로 변경하세요."
+    },
+    "N9.2": {
+        "excellent": (4.5, "✅ 오류 메시지에 '@ 기호를 포함해주세요' 등 구체적인 해결 방법이 제시됩니다."),
+        "good": (3.5, "⚠️ 해결책이 제공되지만 불명확하거나 링크만 제공됩니다."),
+        "poor": (0, "❌ 문제만 알려주고 해결 방법은 제공하지 않아 사용자가 답답함을 느낍니다."),
+        "improvement": "오류 메시지 아래에 '해결 방법: 전화번호는 010-1234-5678 형식으로 입력해주세요' 안내를 추가하세요."
+    },
+    "N9.3": {
+        "excellent": (4.5, "✅ 오류가 발생한 입력 필드가 빨간색 테두리로 강조되며, 자동으로 스크롤됩니다."),
+        "good": (3.5, "⚠️ 오류 필드는 강조되지만 스크롤되지 않아 찾기 어렵습니다."),
+        "poor": (0, "❌ 오류 위치를 알 수 없어 사용자가 전체 폼을 다시 확인해야 합니다."),
+        "improvement": "오류 필드에 빨간색 테두리를 적용하고, scrollIntoView()로 자동 스크롤하세요."
+    },
+    "N10.1": {
+        "excellent": (4.5, "✅ 헤더에 '도움말' 메뉴가 있으며, FAQ 페이지에 검색 기능이 제공됩니다."),
+        "good": (3.5, "⚠️ FAQ는 있지만 접근이 어렵거나 검색 기능이 없습니다."),
+        "poor": (0, "❌ 도움말이 푸터 깊숙이 숨겨져 있거나 존재하지 않습니다."),
+        "improvement": "상단 헤더 우측에 '❓ 도움말' 버튼을 고정하고, FAQ 페이지에 키워드 검색창을 추가하세요."
+    },
+    "N10.2": {
+        "excellent": (4.5, "✅ 각 페이지/섹션에 '이 페이지에 대한 도움말' 링크가 있으며, 클릭 시 관련 설명이 팝업으로 나타납니다."),
+        "good": (3.5, "⚠️ 일부 페이지에만 도움말이 제공되거나 일반적인 안내만 있습니다."),
+        "poor": (0, "❌ 페이지별 도움말이 없어 사용자가 전체 매뉴얼을 뒤져야 합니다."),
+        "improvement": "각 섹션 제목 옆에 '?' 아이콘을 배치하고, 클릭 시 해당 기능 설명 팝업을 표시하세요."
+    },
+    "N10.3": {
+        "excellent": (4.5, "✅ 첫 방문 시 인터랙티브 가이드 투어가 제공되며, '튜토리얼 건너뛰기' 옵션도 있습니다."),
+        "good": (3.5, "⚠️ 튜토리얼은 있지만 정적 문서 형태로만 제공됩니다."),
+        "poor": (0, "❌ 튜토리얼이 없어 신규 사용자가 사용법을 스스로 파악해야 합니다."),
+        "improvement": "첫 로그인 시 '환영합니다! 3분 가이드를 시작하시겠습니까?' 모달을 표시하고, 주요 기능을 하이라이트하며 설명하세요."
+    }
+}
+
+
+def _compile_diagnosis(templates):
+    """
+    템플릿 → {항목 코드: (구간 경계 [good, excellent], 등급별 진단 문구, 개선 방안)}
+
+    템플릿에 없는 등급·항목은 기존과 같이 경계 3.5 / 4.5, 문구 '평가 중', 개선 방안 '추가 분석 필요'
+    """
+    table = {}
+    for item_code, template in templates.items():
+        cuts = [template.get("good", (3.5, ""))[0], template.get("excellent", (4.5, ""))[0]]
+        diagnoses = tuple(template.get(level, (0, "평가 중"))[1] for level in DIAGNOSIS_LEVELS)
+        table[item_code] = (cuts, diagnoses, template.get("improvement", "추가 분석 필요"))
+    return table
+
+
+DIAGNOSIS_TABLE = _compile_diagnosis(DIAGNOSIS_TEMPLATES)
+_DEFAULT_DIAGNOSIS = ([3.5, 4.5], ("평가 중",) * 3, "추가 분석 필요")
+
+
+def diagnosis_level(item_code: str, score: float) -> str:
+    """점수 → 등급 (구간 경계 bisect, 경계값은 위 등급)"""
+    if score != score:
+        return "poor"
+    cuts = DIAGNOSIS_TABLE.get(item_code, _DEFAULT_DIAGNOSIS)[0]
+    return DIAGNOSIS_LEVELS[bisect_right(cuts, score)]
+
+
+@lru_cache(maxsize=None)
+def diagnosis_text(item_code: str, level: str) -> Tuple[str, str]:
+    """(항목, 등급) → (진단 문구, 개선 방안)"""
+    _, diagnoses, improvement = DIAGNOSIS_TABLE.get(item_code, _DEFAULT_DIAGNOSIS)
+    return diagnoses[DIAGNOSIS_LEVELS.index(level)], improvement
+
+
 class NielsenAnalyzer:
     """Nielsen 10가지 원칙 기반 상세 UI/UX 분석"""
     
@@ -126,292 +355,15 @@ class NielsenAnalyzer:
         - Q8 (일관성) → N4 (일관성)
         - Q9 (보편적 구조) → N2 (현실 일치)
         - Q10 (색상 조화) → N4 (일관성), N8 (미니멀)
+
+        계수는 nielsen_projection.Q_TO_NIELSEN (없는 Q 는 3.5)
         """
-        
-        nielsen_scores = {}
-        
-        # N1: 시스템 상태 가시성
-        nielsen_scores["N1_visibility"] = {
-            "N1.1": q_scores.get("Q7", 3.5) * 0.9,  # Q7 기반, 약간 보수적
-            "N1.2": q_scores.get("Q1", 3.5) * 0.85,  # Q1 기반 (목적 달성 = 진행 상태 파악)
-            "N1.3": q_scores.get("Q1", 3.5) * 0.9,
-            "overall": (q_scores.get("Q7", 3.5) + q_scores.get("Q1", 3.5)) / 2
-        }
-        
-        # N2: 시스템과 현실의 일치
-        nielsen_scores["N2_real_world"] = {
-            "N2.1": q_scores.get("Q3", 3.5),  # 이해 가능성 = 친화적 용어
-            "N2.2": q_scores.get("Q9", 3.5),  # 보편적 구조
-            "N2.3": q_scores.get("Q9", 3.5) * 0.95,
-            "overall": (q_scores.get("Q3", 3.5) + q_scores.get("Q9", 3.5)) / 2
-        }
-        
-        # N3: 사용자 제어 및 자유도
-        nielsen_scores["N3_control"] = {
-            "N3.1": q_scores.get("Q4", 3.5) * 1.05,  # 메뉴 이동 = 뒤로가기
-            "N3.2": q_scores.get("Q2", 3.5) * 0.8,  # 편리성 기반, 임시저장은 더 까다로움
-            "N3.3": q_scores.get("Q2", 3.5) * 0.85,
-            "overall": (q_scores.get("Q4", 3.5) + q_scores.get("Q2", 3.5)) / 2
-        }
-        
-        # N4: 일관성 및 표준
-        nielsen_scores["N4_consistency"] = {
-            "N4.1": q_scores.get("Q8", 3.5),  # 일관성 직접 연결
-            "N4.2": q_scores.get("Q10", 3.5),  # 색상 조화
-            "N4.3": q_scores.get("Q8", 3.5) * 0.95,
-            "overall": (q_scores.get("Q8", 3.5) + q_scores.get("Q10", 3.5)) / 2
-        }
-        
-        # N5: 오류 예방
-        nielsen_scores["N5_prevention"] = {
-            "N5.1": q_scores.get("Q5", 3.5) * 0.9,  # 경고 메시지 기반
-            "N5.2": q_scores.get("Q5", 3.5) * 0.85,  # 실시간 검사는 더 까다로움
-            "N5.3": q_scores.get("Q5", 3.5),
-            "overall": q_scores.get("Q5", 3.5)
-        }
-        
-        # N6: 기억보다 인식
-        nielsen_scores["N6_recognition"] = {
-            "N6.1": q_scores.get("Q6", 3.5) * 0.8,  # 친절한 설명 기반
-            "N6.2": q_scores.get("Q1", 3.5) * 0.85,  # 목적 달성 = 검색 용이
-            "N6.3": q_scores.get("Q6", 3.5) * 0.95,
-            "overall": (q_scores.get("Q6", 3.5) + q_scores.get("Q1", 3.5)) / 2
-        }
-        
-        # N7: 유연성 및 효율성
-        nielsen_scores["N7_flexibility"] = {
-            "N7.1": q_scores.get("Q2", 3.5) * 0.7,  # 편리성 기반, 단축키는 어려움
-            "N7.2": q_scores.get("Q4", 3.5) * 0.9,  # 메뉴 이동 = 즐겨찾기
-            "N7.3": q_scores.get("Q2", 3.5) * 0.85,
-            "overall": (q_scores.get("Q2", 3.5) + q_scores.get("Q4", 3.5)) / 2
-        }
-        
-        # N8: 미니멀한 디자인
-        nielsen_scores["N8_minimalist"] = {
-            "N8.1": q_scores.get("Q7", 3.5),  # 시각적 구분
-            "N8.2": q_scores.get("Q7", 3.5) * 0.9,
-            "N8.3": q_scores.get("Q10", 3.5),  # 색상 조화 = 계층 구조
-            "overall": (q_scores.get("Q7", 3.5) + q_scores.get("Q10", 3.5)) / 2
-        }
-        
-        # N9: 오류 복구 지원
-        nielsen_scores["N9_error_recovery"] = {
-            "N9.1": q_scores.get("Q5", 3.5),  # 경고 메시지
-            "N9.2": q_scores.get("Q6", 3.5) * 0.9,  # 친절한 설명 = 해결책
-            "N9.3": q_scores.get("Q5", 3.5) * 0.95,
-            "overall": (q_scores.get("Q5", 3.5) + q_scores.get("Q6", 3.5)) / 2
-        }
-        
-        # N10: 도움말 및 문서
-        nielsen_scores["N10_help"] = {
-            "N10.1": q_scores.get("Q6", 3.5) * 0.85,  # 친절한 설명
-            "N10.2": q_scores.get("Q6", 3.5) * 0.9,
-            "N10.3": q_scores.get("Q3", 3.5) * 0.8,  # 이해 가능 = 튜토리얼
-            "overall": (q_scores.get("Q6", 3.5) + q_scores.get("Q3", 3.5)) / 2
-        }
-        
-        return nielsen_scores
+        return PROJECTION.to_dict(PROJECTION.project(PROJECTION.q_matrix([q_scores]))[0])
     
     def generate_detailed_diagnosis(self, item_code: str, score: float) -> Dict[str, str]:
-        """각 세부 항목별 구체적 진단 및 개선 방안 생성"""
-        
-        # 진단 템플릿 (점수 구간별)
-        diagnosis_templates = {
-            "N1.1": {
-                "excellent": (4.5, "✅ Breadcrumb가 모든 페이지에 명확히 표시되며, 현재 위치가 하이라이트 처리되어 있습니다."),
-                "good": (3.5, "⚠️ Breadcrumb가 일부 페이지에서만 제공되거나 시각적으로 눈에 띄지 않습니다."),
-                "poor": (0, "❌ Breadcrumb가 없어 사용자가 현재 어느 페이지에 있는지 파악하기 어렵습니다."),
-                "improvement": "상단에 '홈 > 카테고리 > 현재페이지' 형태의 Breadcrumb을 추가하고, 현재 페이지는 굵은 글씨로 강조하세요."
-            },
-            "N1.2": {
-                "excellent": (4.5, "✅ 로딩 시 진행률 표시 또는 스피너가 명확히 나타나며, 예상 소요 시간이 표시됩니다."),
-                "good": (3.5, "⚠️ 로딩 인디케이터는 있지만 작거나 눈에 띄지 않습니다."),
-                "poor": (0, "❌ 로딩 상태 표시가 없어 사용자가 시스템이 작동 중인지 알 수 없습니다."),
-                "improvement": "중앙에 큰 스피너를 표시하고, '데이터를 불러오는 중...' 메시지를 추가하세요. 3초 이상 소요 시 진행률(%)을 표시하세요."
-            },
-            "N1.3": {
-                "excellent": (4.5, "✅ 작업 완료 시 '저장되었습니다' 등의 성공 메시지가 명확히 표시됩니다."),
-                "good": (3.5, "⚠️ 피드백이 제공되지만 너무 빠르게 사라지거나 눈에 띄지 않습니다."),
-                "poor": (0, "❌ 작업 완료 여부를 알 수 없어 사용자가 불안감을 느낍니다."),
-                "improvement": "화면 상단에 3초간 녹색 배경의 '✓ 저장되었습니다' 토스트 메시지를 표시하세요."
-            },
-            "N2.1": {
-                "excellent": (4.5, "✅ 모든 메뉴와 안내가 일상 언어로 작성되어 누구나 쉽게 이해할 수 있습니다."),
-                "good": (3.5, "⚠️ 일부 행정 용어나 전문 용어가 사용되지만 설명이 제공됩니다."),
-                "poor": (0, "❌ '대장조회', '통합민원' 등 전문 용어가 남발되어 일반 시민이 이해하기 어렵습니다."),
-                "improvement": "'대장조회' → '내 신청 내역 보기', '통합민원' → '문의하기'로 변경하고, 필요 시 말풍선 설명을 추가하세요."
-            },
-            "N2.2": {
-                "excellent": (4.5, "✅ 메뉴 구조가 사용자의 실제 업무 흐름을 반영하여 직관적입니다."),
-                "good": (3.5, "⚠️ 메뉴 구조는 논리적이지만 일부 항목이 예상과 다른 위치에 있습니다."),
-                "poor": (0, "❌ 조직도 중심으로 구성되어 사용자가 원하는 서비스를 찾기 어렵습니다."),
-                "improvement": "조직 중심 메뉴를 사용자 목적 중심(예: '신청', '조회', '상담')으로 재구성하세요."
-            },
-            "N2.3": {
-                "excellent": (4.5, "✅ 모든 아이콘이 Material Design 등 표준을 따르며, 직관적으로 의미를 파악할 수 있습니다."),
-                "good": (3.5, "⚠️ 대부분의 아이콘은 이해 가능하지만 일부는 의미가 불분명합니다."),
-                "poor": (0, "❌ 추상적이거나 생소한 아이콘이 사용되어 사용자가 혼란스러워합니다."),
-                "improvement": "🏠(홈), 🔍(검색), 📄(문서) 등 보편적 아이콘을 사용하고, 모든 아이콘에 텍스트 레이블을 병기하세요."
-            },
-            "N3.1": {
-                "excellent": (4.5, "✅ 모든 페이지에 '이전' 버튼이 명확히 표시되며, 브라우저 뒤로가기도 정상 작동합니다."),
-                "good": (3.5, "⚠️ 뒤로가기 버튼은 있지만 일부 페이지에서 누락되거나 눈에 띄지 않습니다."),
-                "poor": (0, "❌ 뒤로가기 시 입력한 데이터가 손실되거나, 뒤로가기 버튼이 없어 답답함을 느낍니다."),
-                "improvement": "상단 좌측에 '← 이전' 버튼을 배치하고, 브라우저 뒤로가기와 연동하여 데이터를 보존하세요."
-            },
-            "N3.2": {
-                "excellent": (4.5, "✅ 긴 신청서에서 5분마다 자동 저장되며, '임시 저장' 버튼도 제공됩니다."),
-                "good": (3.5, "⚠️ 임시 저장 기능은 있지만 자동 저장이 없거나 저장 시점을 알 수 없습니다."),
-                "poor": (0, "❌ 임시 저장 기능이 없어 사용자가 실수로 페이지를 닫으면 모든 입력이 날아갑니다."),
-                "improvement": "5분마다 자동 저장하고, '마지막 저장: 2분 전' 메시지를 표시하세요. '임시 저장' 버튼을 우측 하단에 배치하세요."
-            },
-            "N3.3": {
-                "excellent": (4.5, "✅ 사용자가 검색 기록, 즐겨찾기 등을 자유롭게 삭제하고 관리할 수 있습니다."),
-                "good": (3.5, "⚠️ 일부 데이터는 관리 가능하지만 검색 기록 삭제 등 일부 기능이 누락되었습니다."),
-                "poor": (0, "❌ 사용자가 자신의 데이터를 제어할 수 없어 프라이버시 우려가 있습니다."),
-                "improvement": "검색창 우측에 '기록 지우기' 버튼을 추가하고, 설정 페이지에서 모든 활동 데이터를 관리할 수 있게 하세요."
-            },
-            "N4.1": {
-                "excellent": (4.5, "✅ 모든 주요 버튼이 동일한 색상과 크기를 유지하며, 위치도 일관적입니다."),
-                "good": (3.5, "⚠️ 대부분의 버튼은 일관적이지만 일부 페이지에서 다른 스타일이 사용됩니다."),
-                "poor": (0, "❌ 페이지마다 버튼 색상과 위치가 달라 사용자가 혼란스러워합니다."),
-                "improvement": "디자인 시스템을 정의하세요. 예: Primary 버튼(파란색, 우측), Secondary 버튼(회색, 좌측), Danger 버튼(빨간색)."
-            },
-            "N4.2": {
-                "excellent": (4.5, "✅ 브랜드 컬러가 모든 페이지에 일관되게 적용되며, Primary/Secondary 색상이 명확합니다."),
-                "good": (3.5, "⚠️ 색상 체계는 있지만 일부 페이지에서 다른 색상이 혼재되어 있습니다."),
-                "poor": (0, "❌ 페이지마다 색상이 다르고, 브랜드 정체성을 느낄 수 없습니다."),
-                "improvement": "Primary: #0066CC, Secondary: #6C757D, Success: #28A745, Danger: #DC3545, Warning: #FFC107로 통일하세요."
-            },
-            "N4.3": {
-                "excellent": (4.5, "✅ 제목(24px 굵게), 본문(16px 보통), 캡션(14px 얇게) 등 타이포그래피 계층이 명확합니다."),
-                "good": (3.5, "⚠️ 글꼴 크기는 구분되지만 일부 페이지에서 다른 굵기가 사용됩니다."),
-                "poor": (0, "❌ 글꼴 크기와 굵기가 일관성 없이 사용되어 시각적 계층이 불분명합니다."),
-                "improvement": "H1: 32px Bold, H2: 24px Semi-bold, 본문: 16px Regular, 캡션: 14px Light로 통일하세요."
-            },
-            "N5.1": {
-                "excellent": (4.5, "✅ 모든 입력 필드에 '예: 010-1234-5678' 형태의 명확한 가이드가 제공됩니다."),
-                "good": (3.5, "⚠️ 일부 필드에만 가이드가 있거나, 가이드가 불명확합니다."),
-                "poor": (0, "❌ 입력 형식 안내가 없어 사용자가 시행착오를 겪습니다."),
-                "improvement": "입력 필드 아래에 회색 작은 글씨로 '예: 010-1234-5678' 또는 placeholder로 표시하세요."
-            },
-            "N5.2": {
-                "excellent": (4.5, "✅ 입력 중 또는 포커스 아웃 시 즉시 유효성 검사가 수행되고 오류가 표시됩니다."),
-                "good": (3.5, "⚠️ 유효성 검사는 있지만 제출 버튼을 눌러야만 확인됩니다."),
-                "poor": (0, "❌ 제출 후에야 오류를 알 수 있어 사용자가 불편을 느낍니다."),
-                "improvement": "입력 필드에서 포커스가 벗어날 때 즉시 검사하고, 오류 시 빨간색 테두리 + 메시지를 표시하세요."
-            },
-            "N5.3": {
-                "excellent": (4.5, "✅ 삭제, 제출 등 중요한 작업 전 '정말 삭제하시겠습니까?' 확인 메시지가 나타납니다."),
-                "good": (3.5, "⚠️ 일부 중요 작업에만 확인 메시지가 제공됩니다."),
-                "poor": (0, "❌ 삭제 버튼 클릭 즉시 삭제되어 사용자가 실수로 데이터를 잃을 위험이 있습니다."),
-                "improvement": "삭제/제출 버튼 클릭 시 모달 창을 띄우고, '취소' / '확인' 버튼을 제공하세요."
-            },
-            "N6.1": {
-                "excellent": (4.5, "✅ 검색창 클릭 시 최근 5개 검색어가 드롭다운으로 표시되며, 클릭 한 번으로 재검색 가능합니다."),
-                "good": (3.5, "⚠️ 최근 검색어는 표시되지만 수량이 적거나 삭제 기능이 없습니다."),
-                "poor": (0, "❌ 검색어를 매번 새로 입력해야 하여 반복 작업 시 불편합니다."),
-                "improvement": "검색창 포커스 시 최근 5개 검색어를 드롭다운으로 표시하고, 각 항목에 'X' 삭제 버튼을 추가하세요."
-            },
-            "N6.2": {
-                "excellent": (4.5, "✅ 입력 중 실시간으로 연관 검색어가 제안되며, 화살표 키로 선택 가능합니다."),
-                "good": (3.5, "⚠️ 자동완성은 있지만 정확도가 낮거나 반응이 느립니다."),
-                "poor": (0, "❌ 자동완성 기능이 없어 긴 검색어를 끝까지 입력해야 합니다."),
-                "improvement": "Google 스타일 자동완성을 구현하세요. 2글자 이상 입력 시 상위 5개 제안을 드롭다운으로 표시하세요."
-            },
-            "N6.3": {
-                "excellent": (4.5, "✅ 모든 아이콘과 버튼에 마우스를 올리면 툴팁이 나타나 기능을 설명합니다."),
-                "good": (3.5, "⚠️ 일부 아이콘에만 툴팁이 제공되거나, 설명이 불명확합니다."),
-                "poor": (0, "❌ 아이콘만 있고 설명이 없어 사용자가 기능을 추측해야 합니다."),
-                "improvement": "모든 아이콘에 title 속성을 추가하고, hover 시 0.5초 후 툴팁을 표시하세요. 예: '출력', '다운로드', '공유'."
-            },
-            "N7.1": {
-                "excellent": (4.5, "✅ Ctrl+S(저장), Enter(검색), Tab(필드 이동) 등 주요 단축키가 지원되며 안내가 제공됩니다."),
-                "good": (3.5, "⚠️ 일부 단축키는 작동하지만 안내가 없어 사용자가 알기 어렵습니다."),
-                "poor": (0, "❌ 키보드만으로는 작업이 불가능하며, 마우스에 의존해야 합니다."),
-                "improvement": "주요 버튼에 'Ctrl+S로 저장' 힌트를 표시하고, 도움말에 단축키 목록을 제공하세요."
-            },
-            "N7.2": {
-                "excellent": (4.5, "✅ 상단에 '자주 찾는 메뉴'가 있으며, 사용자가 드래그로 순서를 변경하고 추가/삭제할 수 있습니다."),
-                "good": (3.5, "⚠️ 즐겨찾기 기능은 있지만 커스터마이징이 제한적입니다."),
-                "poor": (0, "❌ 즐겨찾기 기능이 없어 자주 쓰는 메뉴를 매번 찾아야 합니다."),
-                "improvement": "각 메뉴 옆에 '★ 즐겨찾기 추가' 버튼을 배치하고, 상단에 즐겨찾기 바를 고정하세요."
-            },
-            "N7.3": {
-                "excellent": (4.5, "✅ 검색 결과를 날짜, 카테고리, 지역 등 다양한 필터로 정렬하고 좁힐 수 있습니다."),
-                "good": (3.5, "⚠️ 기본 필터(날짜)는 있지만 고급 옵션이 부족합니다."),
-                "poor": (0, "❌ 검색 시 필터가 없어 원하는 결과를 찾기 어렵습니다."),
-                "improvement": "좌측 사이드바에 '필터: 날짜, 카테고리, 지역' 체크박스를 추가하고, '정렬: 최신순/인기순'을 제공하세요."
-            },
-            "N8.1": {
-                "excellent": (4.5, "✅ 한 화면에 핵심 정보만 표시되며, 추가 정보는 '더보기'로 접근할 수 있습니다."),
-                "good": (3.5, "⚠️ 정보량은 적절하지만 일부 페이지에서 과도한 텍스트가 표시됩니다."),
-                "poor": (0, "❌ 한 화면에 너무 많은 정보가 빽빽하게 표시되어 압도감을 느낍니다."),
-                "improvement": "정보를 탭이나 아코디언으로 숨기고, 첫 화면에는 주요 CTA와 3~5개 핵심 메뉴만 표시하세요."
-            },
-            "N8.2": {
-                "excellent": (4.5, "✅ 요소 간 여백이 충분하고(20px 이상), 그리드 시스템을 사용하여 정돈된 느낌을 줍니다."),
-                "good": (3.5, "⚠️ 여백은 있지만 일부 영역이 답답하거나 불규칙합니다."),
-                "poor": (0, "❌ 여백 없이 요소들이 붙어 있어 답답하고 가독성이 떨어집니다."),
-                "improvement": "요소 간 최소 20px 여백을 확보하고, 12-column 그리드 시스템을 적용하세요."
-            },
-            "N8.3": {
-                "excellent": (4.5, "✅ 제목이 가장 크고 굵으며, 중요도에 따라 크기와 색상이 차등 적용되어 시선 흐름이 명확합니다."),
-                "good": (3.5, "⚠️ 제목과 본문은 구분되지만 중요도 표시가 불명확합니다."),
-                "poor": (0, "❌ 모든 텍스트가 비슷한 크기와 색상으로 되어 있어 어디를 먼저 봐야 할지 모릅니다."),
-                "improvement": "제목(32px, 검은색), 부제목(24px, 진회색), 본문(16px, 회색)으로 계층을 명확히 하고, 주요 CTA는 큰 버튼으로 강조하세요."
-            },
-            "N9.1": {
-                "excellent": (4.5, "✅ 오류 메시지가 '이메일 형식이 올바르지 않습니다. 예: user@example.com' 처럼 구체적입니다."),
-                "good": (3.5, "⚠️ 오류 메시지는 제공되지만 '잘못된 입력' 등 추상적입니다."),
-                "poor": (0, "❌ 'Error 500: Internal Server Error' 등 기술 용어로만 표시되어 사용자가 이해할 수 없습니다."),
-                "improvement": "기술 용어 대신 '일시적 오류가 발생했습니다. 잠시 후 다시 시도해주세요.' 형태로 변경하세요."
-            },
-            "N9.2": {
-                "excellent": (4.5, "✅ 오류 메시지에 '@ 기호를 포함해주세요' 등 구체적인 해결 방법이 제시됩니다."),
-                "good": (3.5, "⚠️ 해결책이 제공되지만 불명확하거나 링크만 제공됩니다."),
-                "poor": (0, "❌ 문제만 알려주고 해결 방법은 제공하지 않아 사용자가 답답함을 느낍니다."),
-                "improvement": "오류 메시지 아래에 '해결 방법: 전화번호는 010-1234-5678 형식으로 입력해주세요' 안내를 추가하세요."
-            },
-            "N9.3": {
-                "excellent": (4.5, "✅ 오류가 발생한 입력 필드가 빨간색 테두리로 강조되며, 자동으로 스크롤됩니다."),
-                "good": (3.5, "⚠️ 오류 필드는 강조되지만 스크롤되지 않아 찾기 어렵습니다."),
-                "poor": (0, "❌ 오류 위치를 알 수 없어 사용자가 전체 폼을 다시 확인해야 합니다."),
-                "improvement": "오류 필드에 빨간색 테두리를 적용하고, scrollIntoView()로 자동 스크롤하세요."
-            },
-            "N10.1": {
-                "excellent": (4.5, "✅ 헤더에 '도움말' 메뉴가 있으며, FAQ 페이지에 검색 기능이 제공됩니다."),
-                "good": (3.5, "⚠️ FAQ는 있지만 접근이 어렵거나 검색 기능이 없습니다."),
-                "poor": (0, "❌ 도움말이 푸터 깊숙이 숨겨져 있거나 존재하지 않습니다."),
-                "improvement": "상단 헤더 우측에 '❓ 도움말' 버튼을 고정하고, FAQ 페이지에 키워드 검색창을 추가하세요."
-            },
-            "N10.2": {
-                "excellent": (4.5, "✅ 각 페이지/섹션에 '이 페이지에 대한 도움말' 링크가 있으며, 클릭 시 관련 설명이 팝업으로 나타납니다."),
-                "good": (3.5, "⚠️ 일부 페이지에만 도움말이 제공되거나 일반적인 안내만 있습니다."),
-                "poor": (0, "❌ 페이지별 도움말이 없어 사용자가 전체 매뉴얼을 뒤져야 합니다."),
-                "improvement": "각 섹션 제목 옆에 '?' 아이콘을 배치하고, 클릭 시 해당 기능 설명 팝업을 표시하세요."
-            },
-            "N10.3": {
-                "excellent": (4.5, "✅ 첫 방문 시 인터랙티브 가이드 투어가 제공되며, '튜토리얼 건너뛰기' 옵션도 있습니다."),
-                "good": (3.5, "⚠️ 튜토리얼은 있지만 정적 문서 형태로만 제공됩니다."),
-                "poor": (0, "❌ 튜토리얼이 없어 신규 사용자가 사용법을 스스로 파악해야 합니다."),
-                "improvement": "첫 로그인 시 '환영합니다! 3분 가이드를 시작하시겠습니까?' 모달을 표시하고, 주요 기능을 하이라이트하며 설명하세요."
-            }
-        }
-        
-        template = diagnosis_templates.get(item_code, {})
-        
-        if score >= template.get("excellent", (4.5, ""))[0]:
-            diagnosis = template.get("excellent", (0, "평가 중"))[1]
-            level = "excellent"
-        elif score >= template.get("good", (3.5, ""))[0]:
-            diagnosis = template.get("good", (0, "평가 중"))[1]
-            level = "good"
-        else:
-            diagnosis = template.get("poor", (0, "평가 중"))[1]
-            level = "poor"
-        
-        improvement = template.get("improvement", "추가 분석 필요")
+        """각 세부 항목별 구체적 진단 및 개선 방안 생성 (모듈 로드 시 만든 DIAGNOSIS_TABLE 조회)"""
+        level = diagnosis_level(item_code, score)
+        diagnosis, improvement = diagnosis_text(item_code, level)
         
         return {
             "score": round(score, 2),
@@ -420,11 +372,13 @@ class NielsenAnalyzer:
             "improvement": improvement
         }
     
-    def analyze_site(self, site_name: str, q_scores: Dict[str, float]) -> Dict:
-        """특정 사이트의 Nielsen 기반 상세 분석 수행"""
+    def analyze_site(self, site_name: str, q_scores: Dict[str, float],
+                     nielsen_scores: Dict[str, Dict[str, float]] = None) -> Dict:
+        """특정 사이트의 Nielsen 기반 상세 분석 수행 (nielsen_scores: 미리 투영한 결과)"""
         
         # Q1~Q10 → Nielsen 25개 항목 매핑
-        nielsen_scores = self.map_q_to_nielsen(q_scores)
+        if nielsen_scores is None:
+            nielsen_scores = self.map_q_to_nielsen(q_scores)
         
         # 각 항목별 상세 진단 생성
         detailed_report = {}
@@ -465,78 +419,68 @@ class NielsenAnalyzer:
             "original_scores": q_scores
         }
     
-    def analyze_all_sites(self):
-        """49개 기관 전체 Nielsen 상세 분석"""
+    def load_age_group_rows(self) -> Tuple[List[str], np.ndarray]:
+        """
+        연령대 파일의 (기관명, Q1~Q10) 행 모음 → (기관명 목록, [행, 10])
+        행 순서는 연령대 순서 → 파일 내 순서, 빈 응답은 NaN, 없는 문항 컬럼은 3.5
+        """
+        frames = load_age_groups(self.data_dir, AGE_GROUPS)
+        site_names = []
+        q_blocks = []
+        
+        for age_group in AGE_GROUPS:
+            df = frames[age_group]
+            if df is None:
+                print(f"⚠️ 파일 없음: {workbook_path(self.data_dir, age_group)}")
+                continue
+            
+            site_names.extend(df["기관명"].tolist())
+            q_blocks.append(np.column_stack([
+                df[col].astype(np.float64).to_numpy() if col in df.columns else np.full(len(df), 3.5)
+                for col in Q_COLUMNS.values()
+            ]))
+        
+        return site_names, np.vstack(q_blocks) if q_blocks else np.empty((0, len(Q_COLUMNS)))
+    
+    def analyze_all_sites(self, compact: bool = False):
+        """
+        49개 기관 전체 Nielsen 상세 분석
+
+        Args:
+            compact: True 면 진단·개선 문구를 문자열 사전에 한 번만 저장하고 번호로 참조,
+                     들여쓰기 없는 JSON 으로 기록 (output_writer.load_reports / expand_reports 로 기존 형식 복원)
+        """
         
         print("📊 Nielsen 10원칙 기반 상세 분석 시작...")
         
-        # 연령대 파일 로드
-        age_groups = ["20대", "30대", "40대", "50대", "60대이상", "디지털취약계층"]
-        all_sites = []
+        site_names, q_rows = self.load_age_group_rows()
         
-        for age_group in age_groups:
-            file_path = self.data_dir / f"UI_UX 평가시스템_{age_group}.xlsx"
-            if not file_path.exists():
-                print(f"⚠️ 파일 없음: {file_path}")
-                continue
-            
-            df = pd.read_excel(file_path)
-            
-            for _, row in df.iterrows():
-                site_name = row["기관명"]
-                
-                # Q1~Q10 점수 추출
-                q_scores = {
-                    "Q1": row.get("1.원하는 목적을 달성할 수 있었나요?", 3.5),
-                    "Q2": row.get("2.서비스 이용이 편리 했나요?", 3.5),
-                    "Q3": row.get("3. 전문성 없이도 쉽게 이해할 수 있었나요?", 3.5),
-                    "Q4": row.get("4. 어떤 페이지에서 든 메뉴 이동이 쉬웠나요?", 3.5),
-                    "Q5": row.get("5. 잘못 입력했을 경우 경고 메시지가 표시되나요?", 3.5),
-                    "Q6": row.get("6. 당신이 원하는 서비스(신청, 조회 콘텐츠 상세 등) 이용에 대해 친절하게 설명해 주었나요?", 3.5),
-                    "Q7": row.get("7. 시각적으로 서비스의 내용이 잘 구분되어 있나요?", 3.5),
-                    "Q8": row.get("8. 제목, 글머리표, 아이콘, 이미지 등이 일관성 있게 배치되어 통일감 있게 느끼셨나요?", 3.5),
-                    "Q9": row.get("9. 보편적이고 익숙한 구조를 사용하고 있나요?", 3.5),
-                    "Q10": row.get("10. 색상간의 조화가 잘 이루어지고 있나요?", 3.5)
-                }
-                
-                all_sites.append({
-                    "site_name": site_name,
-                    "age_group": age_group,
-                    "q_scores": q_scores
-                })
+        # 기관별 평균 점수 계산 (NaN 제외, 연령대 순서대로 합산)
+        names, means, _ = group_mean(site_names, q_rows) if len(site_names) else ([], np.empty((0, 10)), None)
         
-        # 기관별 평균 점수 계산
-        site_avg = {}
-        for site in all_sites:
-            name = site["site_name"]
-            if name not in site_avg:
-                site_avg[name] = {
-                    "q_totals": {f"Q{i}": 0 for i in range(1, 11)},
-                    "count": 0
-                }
-            
-            for q, score in site["q_scores"].items():
-                site_avg[name]["q_totals"][q] += score
-            site_avg[name]["count"] += 1
+        # 평균 계산 및 Nielsen 분석 (응답이 전혀 없는 문항은 빼서 기본값 3.5 사용)
+        site_scores = [{q: v for q, v in zip(Q_COLUMNS, row) if v == v} for row in means.tolist()]
+        
+        # 전체 기관 Q → Nielsen 투영을 행렬 곱 한 번으로
+        projected = PROJECTION.project(PROJECTION.q_matrix(site_scores))
         
-        # 평균 계산 및 Nielsen 분석
         nielsen_reports = []
         
-        for site_name, data in site_avg.items():
-            avg_scores = {
-                q: data["q_totals"][q] / data["count"]
-                for q in data["q_totals"]
-            }
-            
-            report = self.analyze_site(site_name, avg_scores)
+        for site_name, avg_scores, row in zip(names, site_scores, projected):
+            report = self.analyze_site(site_name, avg_scores, PROJECTION.to_dict(row))
             nielsen_reports.append(report)
             
             print(f"✅ {site_name}: {report['overall_score']}/5.0")
         
         # 결과 저장
         output_file = self.output_dir / "nielsen_detailed_reports.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(nielsen_reports, f, ensure_ascii=False, indent=2)
+        if compact:
+            OutputWriter(minify=True).write(output_file, compact_reports(nielsen_reports))
+        else:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(nielsen_reports, f, ensure_ascii=False, indent=2)
+        
+        refresh_shards(self.output_dir)
         
         print(f"\n💾 Nielsen 상세 분석 완료!")
         print(f"📁 저장 위치: {output_file}")
@@ -546,8 +490,14 @@ class NielsenAnalyzer:
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Nielsen 10원칙 상세 분석")
+    parser.add_argument("--compact", action="store_true", help="진단·개선 문구를 문자열 사전으로 분리해 저장")
+    args = parser.parse_args()
+    
     analyzer = NielsenAnalyzer()
-    reports = analyzer.analyze_all_sites()
+    reports = analyzer.analyze_all_sites(compact=args.compact)
     
     # 상위 5개 기관 샘플 출력
     sorted_reports = sorted(reports, key=lambda x: x["overall_score"], reverse=True)
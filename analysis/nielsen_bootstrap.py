@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기관별 Nielsen 점수 부트스트랩 신뢰구간
+analyze_all_sites 는 기관의 연령대 행을 평균한 점수 하나만 내므로, 0.01점 차이도 순위 차이가 된다.
+기관마다 행(연령대 또는 응답자)을 복원 추출해 평균 → Q → Nielsen 투영 → 종합 점수·순위를
+재표본 수천 번 계산하고, 종합 / 원칙 / 세부 항목 점수와 순위의 구간을 구한다.
+
+- 재표본: 기관마다 가진 행 수만큼 복원 추출 (행 수가 다른 기관도 한 번에 - 빈 칸은 마스크)
+  난수는 [재표본 묶음, 기관, 행] 배열로 한 번에 뽑고, 행별 뽑힌 횟수(bincount) × 원 자료 행렬 곱으로 평균
+  (파이썬 반복은 묶음 단위로만)
+- 점수 계산은 analyze_all_sites 와 같음: NaN 제외 평균, 응답 없는 문항은 3.5,
+  원칙 overall 을 소수 둘째 자리로 반올림한 뒤 원칙 가중치로 합산
+- 순위는 재표본마다 동점 공동 순위 (weight_sweep.competition_ranks)
+- 구간은 백분위 구간 (기본 95%)
+
+    python nielsen_bootstrap.py --resamples 5000                  # data/ 의 연령대 파일 (기관당 연령대 6행)
+    python nielsen_bootstrap.py --respondents raw_20대.csv ...    # 응답자 단위 원자료
+"""
+
+import argparse
+import json
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from nielsen_analyzer import NielsenAnalyzer
+from nielsen_projection import DEFAULT_SCORE, PROJECTION
+from weight_sweep import competition_ranks
+
+
+ITEM_COLUMNS = np.array([col for col, (_, item) in enumerate(PROJECTION.outputs) if item != 'overall'])
+ITEM_CODES = [item for _, item in PROJECTION.outputs if item != 'overall']
+
+
+def site_blocks(site_names, q_rows):
+    """
+    (행별 기관명, [행, Q]) → (기관명 목록 - 처음 나온 순서, [기관, 최대 행 수, Q] NaN 채움, 기관별 행 수)
+    """
+    q_rows = np.asarray(q_rows, dtype=np.float64).reshape(len(site_names), len(PROJECTION.questions))
+    if not len(site_names):
+        return [], np.empty((0, 0, q_rows.shape[1])), np.zeros(0, dtype=np.int64)
+    index = {}
+    codes = np.array([index.setdefault(name, len(index)) for name in site_names], dtype=np.int64)
+    counts = np.bincount(codes, minlength=len(index))
+
+    # 기관 안에서 몇 번째 행인지 (안정 정렬 → 입력 순서 유지)
+    order = np.argsort(codes, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    slots = np.empty(len(codes), dtype=np.int64)
+    slots[order] = np.arange(len(codes)) - np.repeat(starts, counts)
+
+    blocks = np.full((len(index), counts.max(), q_rows.shape[1]), np.nan)
+    blocks[codes, slots] = q_rows
+    return list(index), blocks, counts
+
+
+def _scores(q_means, weights):
+    """[..., Q] 평균 → (종합 [...], 원칙 overall [..., 원칙], 세부 항목 [..., 항목])"""
+    q = np.where(np.isnan(q_means), DEFAULT_SCORE, q_means)
+    projected = PROJECTION.project(q)
+    principles = PROJECTION.principle_overall(projected)
+    overall = np.round(principles, 2) @ weights
+    return overall, principles, projected[..., ITEM_COLUMNS]
+
+
+def bootstrap(blocks, counts, weights, resamples=2000, seed=None, batch=None):
+    """
+    기관별 복원 추출 재표본
+
+    Args:
+        blocks: [기관, 최대 행 수, Q] (site_blocks)
+        counts: 기관별 행 수
+        weights: 원칙 가중치 [원칙]
+        batch: 한 번에 뽑는 재표본 수 (기본: 추출 배열이 약 800만 칸을 넘지 않도록)
+
+    Returns:
+        {'overall': [재표본, 기관], 'principles': [재표본, 기관, 원칙], 'items': [재표본, 기관, 항목],
+         'ranks': [재표본, 기관]}
+    """
+    n_sites, width, n_q = blocks.shape
+    weights = np.asarray(weights, dtype=np.float64)
+    counts = np.asarray(counts)
+    rng = np.random.default_rng(seed)
+    batch = batch or max(1, 8_000_000 // max(1, n_sites * width * n_q))
+
+    slot_valid = np.arange(width)[None, :] < counts[:, None]          # [기관, 행]
+    answered = (~np.isnan(blocks)).astype(np.float64)                   # [기관, 행, Q]
+    filled = np.nan_to_num(blocks)
+    offsets = (np.arange(n_sites) * width)[None, :, None]
+
+    overall = np.empty((resamples, n_sites))
+    principles = np.empty((resamples, n_sites, len(PROJECTION.principles)))
+    items = np.empty((resamples, n_sites, len(ITEM_CODES)))
+
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        # 기관마다 0 ~ (행 수 - 1) 균등 추출, 행이 모자란 기관의 남는 칸은 버림
+        draws = (rng.random((size, n_sites, width)) * counts[None, :, None]).astype(np.int64)
+        draws = draws + offsets + (np.arange(size) * n_sites * width)[:, None, None]
+        # 행별 뽑힌 횟수 [기관, 묶음, 행] → 기관별 행렬 곱으로 합계·응답 수
+        picked = np.bincount(draws[:, slot_valid].ravel(), minlength=size * n_sites * width)
+        picked = picked.reshape(size, n_sites, width).transpose(1, 0, 2).astype(np.float64)
+        total = np.matmul(picked, filled).transpose(1, 0, 2)            # [묶음, 기관, Q]
+        n = np.matmul(picked, answered).transpose(1, 0, 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            q_means = np.where(n > 0, total / np.where(n > 0, n, 1), np.nan)
+
+        end = start + size
+        overall[start:end], principles[start:end], items[start:end] = _scores(q_means, weights)
+
+    return {
+        'overall': overall,
+        'principles': principles,
+        'items': items,
+        'ranks': competition_ranks(overall)
+    }
+
+
+def intervals(samples, confidence=0.95):
+    """재표본 축(0) 백분위 구간 → (하한, 상한)"""
+    alpha = (1.0 - confidence) / 2.0
+    low, high = np.percentile(samples, [100 * alpha, 100 * (1 - alpha)], axis=0)
+    return low, high
+
+
+def summarize(names, counts, estimate, result, confidence=0.95):
+    """
+    점추정 + 재표본 결과 → 기관별 JSON 요약
+
+    estimate: (종합 [기관], 원칙 [기관, 원칙], 항목 [기관, 항목]) - 원 자료 평균으로 계산한 값
+    """
+    point_overall, point_principles, point_items = estimate
+    point_ranks = competition_ranks(point_overall[None, :])[0]
+
+    overall_low, overall_high = intervals(result['overall'], confidence)
+    principle_low, principle_high = intervals(result['principles'], confidence)
+    item_low, item_high = intervals(result['items'], confidence)
+    rank_low, rank_high = intervals(result['ranks'], confidence)
+    overall_std = result['overall'].std(axis=0)
+    rank_median = np.median(result['ranks'], axis=0)
+    same_rank = (result['ranks'] == point_ranks[None, :]).mean(axis=0)
+
+    r = lambda value, digits=2: round(float(value), digits)
+    interval = lambda point, low, high: {'score': r(point), 'low': r(low), 'high': r(high)}
+
+    sites = []
+    for s, name in enumerate(names):
+        sites.append({
+            'site_name': name,
+            'rows': int(counts[s]),
+            'overall': {**interval(point_overall[s], overall_low[s], overall_high[s]),
+                        'std': r(overall_std[s], 3)},
+            'rank': {'rank': int(point_ranks[s]), 'low': int(np.floor(rank_low[s])),
+                     'high': int(np.ceil(rank_high[s])), 'median': r(rank_median[s], 1),
+                     'same_rank_share': r(same_rank[s], 3)},
+            'principles': {code: interval(point_principles[s, p], principle_low[s, p], principle_high[s, p])
+                           for p, code in enumerate(PROJECTION.principles)},
+            'items': {code: interval(point_items[s, i], item_low[s, i], item_high[s, i])
+                      for i, code in enumerate(ITEM_CODES)}
+        })
+    sites.sort(key=lambda entry: entry['rank']['rank'])
+    return sites
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기관별 Nielsen 점수 부트스트랩 신뢰구간')
+    parser.add_argument('--data-dir', default='data', help='연령대 엑셀 파일 폴더')
+    parser.add_argument('--respondents', nargs='+', help='응답자 단위 원자료 (xlsx/CSV) - 지정하면 응답자 단위로 재표본')
+    parser.add_argument('--resamples', type=int, default=2000, help='재표본 수')
+    parser.add_argument('--confidence', type=float, default=0.95, help='신뢰수준')
+    parser.add_argument('--seed', type=int, default=0, help='무작위 시드')
+    parser.add_argument('--output', default='output/nielsen_bootstrap.json', help='저장 경로')
+    args = parser.parse_args()
+
+    analyzer = NielsenAnalyzer(args.data_dir)
+    weights = np.array([info['weight'] for info in analyzer.nielsen_criteria.values()])
+    if args.respondents:
+        from respondent_loader import load_respondent_rows
+        site_names, q_rows = load_respondent_rows(args.respondents)
+        unit = 'respondent'
+    else:
+        site_names, q_rows = analyzer.load_age_group_rows()
+        unit = 'age_group'
+
+    names, blocks, counts = site_blocks(site_names, q_rows)
+    if not names:
+        print("❌ 분석할 데이터가 없습니다")
+        return
+
+    print(f"📊 부트스트랩: 기관 {len(names)}개 × 재표본 {args.resamples}개 ({unit} 단위, 기관당 최대 {blocks.shape[1]}행)")
+    # 점추정: 원 자료 평균 (analyze_all_sites 와 같은 계산, 채움 칸은 NaN 이라 자동 제외)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        point_means = np.nanmean(blocks, axis=1)
+    estimate = _scores(point_means, weights)
+    result = bootstrap(blocks, counts, weights, args.resamples, args.seed)
+    sites = summarize(names, counts, estimate, result, args.confidence)
+
+    output = {
+        'generated_at': datetime.now().isoformat(),
+        'unit': unit,
+        'resamples': args.resamples,
+        'confidence': args.confidence,
+        'site_count': len(names),
+        'sites': sites
+    }
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+
+    widths = [site['overall']['high'] - site['overall']['low'] for site in sites]
+    print(f"✅ 종합 점수 {args.confidence * 100:.0f}% 구간 평균 폭: {np.mean(widths):.3f}점")
+    print("\n🏆 상위 5개 기관 (점수 구간 / 순위 구간)")
+    for site in sites[:5]:
+        overall, rank = site['overall'], site['rank']
+        print(f"   {rank['rank']}. {site['site_name']}: {overall['score']} [{overall['low']}, {overall['high']}], "
+              f"{rank['low']}~{rank['high']}위")
+    print(f"\n💾 {output_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Q1~Q10 → Nielsen 25개 세부 항목 + 10개 원칙 overall 투영
+매핑 규칙을 계수 표(Q_TO_NIELSEN)로 선언하고, 모듈 로드 시 [10 x 35] 계수 행렬로 한 번만 변환
+→ 기관 여러 곳(또는 계수 변형 여러 개)을 행렬 곱 한 번으로 계산
+
+- 없는 Q 는 DEFAULT_SCORE(3.5) 로 채움 (기존 q_scores.get(Q, 3.5) 와 같음)
+- 항목 점수는 Q × 계수, overall 은 두 Q 의 평균(계수 0.5 씩) → 기존 식과 같은 부동소수점 결과
+"""
+
+import numpy as np
+
+QUESTIONS = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6', 'Q7', 'Q8', 'Q9', 'Q10']
+DEFAULT_SCORE = 3.5
+
+# 원칙 → 항목(또는 overall) → [(Q, 계수)]
+Q_TO_NIELSEN = {
+    # N1: 시스템 상태 가시성
+    'N1_visibility': {
+        'N1.1': [('Q7', 0.9)],     # Q7 기반, 약간 보수적
+        'N1.2': [('Q1', 0.85)],    # Q1 기반 (목적 달성 = 진행 상태 파악)
+        'N1.3': [('Q1', 0.9)],
+        'overall': [('Q7', 0.5), ('Q1', 0.5)]
+    },
+    # N2: 현실 세계 일치
+    'N2_real_world': {
+        'N2.1': [('Q3', 1.0)],     # 이해 가능성 = 친화적 용어
+        'N2.2': [('Q9', 1.0)],     # 보편적 구조
+        'N2.3': [('Q9', 0.95)],
+        'overall': [('Q3', 0.5), ('Q9', 0.5)]
+    },
+    # N3: 사용자 제어와 자유
+    'N3_control': {
+        'N3.1': [('Q4', 1.05)],    # 메뉴 이동 = 뒤로가기
+        'N3.2': [('Q2', 0.8)],     # 편리성 기반, 임시저장은 더 까다로움
+        'N3.3': [('Q2', 0.85)],
+        'overall': [('Q4', 0.5), ('Q2', 0.5)]
+    },
+    # N4: 일관성과 표준
+    'N4_consistency': {
+        'N4.1': [('Q8', 1.0)],     # 일관성 직접 연결
+        'N4.2': [('Q10', 1.0)],    # 색상 조화
+        'N4.3': [('Q8', 0.95)],
+        'overall': [('Q8', 0.5), ('Q10', 0.5)]
+    },
+    # N5: 오류 예방
+    'N5_prevention': {
+        'N5.1': [('Q5', 0.9)],     # 경고 메시지 기반
+        'N5.2': [('Q5', 0.85)],    # 실시간 검사는 더 까다로움
+        'N5.3': [('Q5', 1.0)],
+        'overall': [('Q5', 1.0)]
+    },
+    # N6: 기억보다 인식
+    'N6_recognition': {
+        'N6.1': [('Q6', 0.8)],     # 친절한 설명 기반
+        'N6.2': [('Q1', 0.85)],    # 목적 달성 = 검색 용이
+        'N6.3': [('Q6', 0.95)],
+        'overall': [('Q6', 0.5), ('Q1', 0.5)]
+    },
+    # N7: 유연성과 효율성
+    'N7_flexibility': {
+        'N7.1': [('Q2', 0.7)],     # 편리성 기반, 단축키는 어려움
+        'N7.2': [('Q4', 0.9)],     # 메뉴 이동 = 즐겨찾기
+        'N7.3': [('Q2', 0.85)],
+        'overall': [('Q2', 0.5), ('Q4', 0.5)]
+    },
+    # N8: 미니멀 디자인
+    'N8_minimalist': {
+        'N8.1': [('Q7', 1.0)],     # 시각적 구분
+        'N8.2': [('Q7', 0.9)],
+        'N8.3': [('Q10', 1.0)],    # 색상 조화 = 계층 구조
+        'overall': [('Q7', 0.5), ('Q10', 0.5)]
+    },
+    # N9: 오류 인식·진단·복구
+    'N9_error_recovery': {
+        'N9.1': [('Q5', 1.0)],     # 경고 메시지
+        'N9.2': [('Q6', 0.9)],     # 친절한 설명 = 해결책
+        'N9.3': [('Q5', 0.95)],
+        'overall': [('Q5', 0.5), ('Q6', 0.5)]
+    },
+    # N10: 도움말과 문서
+    'N10_help': {
+        'N10.1': [('Q6', 0.85)],   # 친절한 설명
+        'N10.2': [('Q6', 0.9)],
+        'N10.3': [('Q3', 0.8)],    # 이해 가능 = 튜토리얼
+        'overall': [('Q6', 0.5), ('Q3', 0.5)]
+    }
+}
+
+
+class NielsenProjection:
+    """
+    계수 표 → [Q, 출력] 행렬
+
+    outputs: (원칙, 항목 또는 'overall') 목록 - 행렬 열 순서
+    """
+
+    def __init__(self, spec=Q_TO_NIELSEN, questions=QUESTIONS):
+        self.questions = list(questions)
+        self.principles = list(spec)
+        self.outputs = [(principle, item) for principle, items in spec.items() for item in items]
+        q_index = {q: i for i, q in enumerate(self.questions)}
+
+        self.matrix = np.zeros((len(self.questions), len(self.outputs)))
+        for col, (principle, item) in enumerate(self.outputs):
+            for q, coefficient in spec[principle][item]:
+                self.matrix[q_index[q], col] += coefficient
+        self.overall_columns = np.array([self.outputs.index((p, 'overall')) for p in self.principles])
+
+    def q_matrix(self, q_scores_list):
+        """[{Q: 점수}] → [기관, Q] (없는 Q·NaN 은 DEFAULT_SCORE)"""
+        q = np.full((len(q_scores_list), len(self.questions)), DEFAULT_SCORE)
+        for row, q_scores in enumerate(q_scores_list):
+            for col, name in enumerate(self.questions):
+                value = q_scores.get(name)
+                if value is not None and value == value:
+                    q[row, col] = value
+        return q
+
+    def project(self, q, matrix=None):
+        """
+        [기관, Q] (또는 [변형, 기관, Q]) @ [Q, 출력] → [..., 출력]
+
+        matrix: 계수 변형 (None 이면 기본 계수, [변형, Q, 출력] 이면 변형별 결과)
+        """
+        return np.matmul(q, self.matrix if matrix is None else matrix)
+
+    def principle_overall(self, projected):
+        """투영 결과 → 원칙별 overall [..., 10]"""
+        return projected[..., self.overall_columns]
+
+    def weighted_overall(self, projected, weights):
+        """원칙 overall 의 가중합 [..., 10] @ weights[10] (weights 가 [변형, 10] 이면 [..., 변형])"""
+        return self.principle_overall(projected) @ np.asarray(weights, dtype=np.float64).T
+
+    def to_dict(self, row):
+        """투영 결과 1행 → map_q_to_nielsen 형식 {원칙: {항목: 점수, 'overall': 점수}}"""
+        result = {principle: {} for principle in self.principles}
+        for (principle, item), value in zip(self.outputs, row.tolist()):
+            result[principle][item] = value
+        return result
+
+
+PROJECTION = NielsenProjection()
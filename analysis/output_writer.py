@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+분석 결과 파일 출력기
+- JSON 직렬화: orjson 이 있으면 orjson (json.dump(indent=2, ensure_ascii=False) 와 같은 바이트,
+  단 NaN 은 null 로 기록), 없으면 표준 json
+- minify: 들여쓰기·공백 없는 JSON
+- compress: 미리 압축한 .gz / .br 파일을 같은 위치에 함께 생성 (웹 서버 정적 전송용)
+- formats: 하위 도구용 추가 형식 - msgpack (.msgpack), parquet (레코드 목록만 .parquet)
+  msgpack / brotli / pyarrow 는 설치된 경우에만 사용
+- dedupe_all_data / compact_reports: 중복 데이터를 참조로 바꾼 압축 형식 (expand_* 로 원래 형식 복원)
+"""
+
+import gzip
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class OutputWriter:
+    def __init__(self, minify=False, compress=(), formats=(), engine='auto'):
+        self.minify = minify
+        self.compress = list(compress)
+        self.formats = list(formats)
+        self.engine = 'orjson' if engine == 'auto' and orjson is not None else engine
+        if self.engine == 'auto':
+            self.engine = 'json'
+        if self.engine == 'orjson' and orjson is None:
+            raise ValueError("orjson 이 설치되어 있지 않습니다")
+        self._warned = set()
+
+    def _warn(self, name):
+        if name not in self._warned:
+            self._warned.add(name)
+            print(f"   ⚠️  {name} 모듈이 없어 건너뜀")
+
+    def dumps(self, data):
+        if self.engine == 'orjson':
+            return orjson.dumps(data, option=0 if self.minify else orjson.OPT_INDENT_2)
+        if self.minify:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def _write_bytes(self, path, body):
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(body)
+        os.replace(tmp, path)
+        return path
+
+    def write(self, path, data):
+        """path(.json) 와 설정된 형제 파일 기록 → 기록한 경로 목록"""
+        body = self.dumps(data)
+        written = [self._write_bytes(path, body)]
+
+        for kind in self.compress:
+            if kind == 'gz':
+                written.append(self._write_bytes(path.with_name(path.name + '.gz'),
+                                                 gzip.compress(body, compresslevel=9, mtime=0)))
+            elif kind == 'br':
+                if brotli is None:
+                    self._warn('brotli')
+                    continue
+                written.append(self._write_bytes(path.with_name(path.name + '.br'),
+                                                 brotli.compress(body, quality=11)))
+
+        for kind in self.formats:
+            if kind == 'msgpack':
+                if msgpack is None:
+                    self._warn('msgpack')
+                    continue
+                written.append(self._write_bytes(path.with_suffix('.msgpack'),
+                                                 msgpack.packb(data, use_bin_type=True)))
+            elif kind == 'parquet':
+                # 레코드 목록(site_averages 등)만 표 형태로, 중첩 dict 는 'scores.Q1' 처럼 평탄화
+                if not isinstance(data, list):
+                    continue
+                try:
+                    import pandas as pd
+                    pd.json_normalize(data).to_parquet(path.with_suffix('.parquet'))
+                    written.append(path.with_suffix('.parquet'))
+                except ImportError:
+                    self._warn('pyarrow')
+
+        return written
+
+
+def dedupe_all_data(final_data):
+    """
+    analysis_results 의 all_data 를 site_averages[].age_groups 참조로 대체
+
+    all_data 레코드는 site_averages 의 연령대별 항목과 같은 값이므로
+    연령대별 기관 순서(all_data_index)만 남긴다. expand_all_data 로 복원
+    (같은 연령대에 같은 기관명이 두 번 있으면 마지막 행만 남는 점은 site_averages 와 같음)
+    """
+    urls = {site['name']: site['url'] for site in final_data['site_averages']}
+    index = {}
+    url_overrides = {}
+    for item in final_data['all_data']:
+        index.setdefault(item['age_group'], []).append(item['name'])
+        if item['url'] != urls.get(item['name']):
+            url_overrides.setdefault(item['age_group'], {})[item['name']] = item['url']
+
+    compact = {k: v for k, v in final_data.items() if k != 'all_data'}
+    compact['all_data_index'] = index
+    if url_overrides:
+        compact['all_data_urls'] = url_overrides
+    return compact
+
+
+def expand_all_data(doc):
+    """dedupe_all_data 결과 → all_data 가 있는 원래 형식"""
+    if 'all_data' in doc:
+        return doc
+
+    sites = {site['name']: site for site in doc['site_averages']}
+    url_overrides = doc.get('all_data_urls', {})
+    all_data = []
+    for age_group, names in doc['all_data_index'].items():
+        for name in names:
+            site = sites[name]
+            entry = site['age_groups'][age_group]
+            all_data.append({
+                'name': name,
+                'url': url_overrides.get(age_group, {}).get(name, site['url']),
+                'age_group': age_group,
+                'scores': entry['scores'],
+                'convenience_avg': entry['convenience_avg'],
+                'design_avg': entry['design_avg'],
+                'total_avg': entry['total_avg']
+            })
+
+    expanded = {k: v for k, v in doc.items() if k not in ('all_data_index', 'all_data_urls')}
+    expanded['all_data'] = all_data
+    return expanded
+
+
+REPORTS_FORMAT = 'nielsen_reports_compact'
+REPORT_STRING_FIELDS = ('name', 'diagnosis', 'improvement')
+
+
+def compact_reports(reports):
+    """
+    nielsen_detailed_reports 목록 → 문자열 사전 참조 형식
+
+    원칙·항목의 name / diagnosis / improvement 문자열을 strings 목록에 한 번만 저장하고
+    보고서에는 strings 의 번호만 남긴다 (파일 크기가 기관 수 × 25항목이 아니라 고유 문구 수에 비례)
+    """
+    strings = []
+    ids = {}
+
+    def ref(text):
+        if text not in ids:
+            ids[text] = len(strings)
+            strings.append(text)
+        return ids[text]
+
+    def compact_fields(entry):
+        return {key: ref(value) if key in REPORT_STRING_FIELDS else value for key, value in entry.items()}
+
+    compact = []
+    for report in reports:
+        principles = {}
+        for code, principle in report['principles'].items():
+            principles[code] = compact_fields(principle)
+            principles[code]['items'] = {item_code: compact_fields(item)
+                                         for item_code, item in principle['items'].items()}
+        compact.append({**report, 'principles': principles})
+
+    return {'format': REPORTS_FORMAT, 'strings': strings, 'reports': compact}
+
+
+def expand_reports(doc):
+    """compact_reports 결과 → 원래 보고서 목록 (이미 목록이면 그대로)"""
+    if isinstance(doc, list):
+        return doc
+
+    strings = doc['strings']
+
+    def expand_fields(entry):
+        return {key: strings[value] if key in REPORT_STRING_FIELDS else value for key, value in entry.items()}
+
+    reports = []
+    for report in doc['reports']:
+        principles = {}
+        for code, principle in report['principles'].items():
+            principles[code] = expand_fields(principle)
+            principles[code]['items'] = {item_code: expand_fields(item)
+                                         for item_code, item in principle['items'].items()}
+        reports.append({**report, 'principles': principles})
+    return reports
+
+
+def load_reports(path):
+    """nielsen_detailed_reports.json (원래 / 압축 형식 모두) → 보고서 목록"""
+    with open(path, encoding='utf-8') as f:
+        return expand_reports(json.load(f))
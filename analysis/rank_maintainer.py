@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기관 점수 1건 변경 시 순위 증분 갱신
+재평가·관리자 수정으로 한 기관의 점수만 바뀌었을 때 전체를 다시 정렬하지 않고
+정렬 컨테이너(sortedcontainers.SortedList, 없으면 bisect 로 유지하는 리스트)에서
+해당 기관만 빼고 다시 넣는다 → O(log n) 조회·갱신
+
+- 순서: 점수 내림차순, 동점이면 먼저 들어온 기관 먼저 (sorted(reverse=True) 와 같은 순서)
+- update() 는 순위 정보(position, rank, percentile)가 바뀐 기관만 돌려준다
+  (점수가 이동한 구간 + 이전/새 점수의 동점 그룹만 다시 계산)
+- 기관 추가·삭제는 백분위 분모(n-1)가 바뀌므로 전체 기관이 변경 목록에 포함된다
+- rank / percentile 정의는 ranking_index.rank_rows 와 같음
+
+    python rank_maintainer.py --dimension total --site 기관명 --score 4.12
+    → web/data/rankings.sqlite, web/data/rankings/total.json 의 바뀐 행만 갱신
+"""
+
+import argparse
+import json
+import sqlite3
+from bisect import bisect_left, bisect_right, insort
+from pathlib import Path
+
+from ranking_index import DB_NAME, DEFAULT_DATA_DIR, DIMENSION_DIR
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+
+class _BisectList:
+    """SortedList 가 없을 때 쓰는 최소 대체 구현 (삽입·삭제 O(n), 조회 O(log n))"""
+
+    def __init__(self, items=()):
+        self._items = sorted(items)
+
+    def add(self, item):
+        insort(self._items, item)
+
+    def remove(self, item):
+        del self._items[bisect_left(self._items, item)]
+
+    def bisect_left(self, item):
+        return bisect_left(self._items, item)
+
+    def bisect_right(self, item):
+        return bisect_right(self._items, item)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+
+class RankMaintainer:
+    def __init__(self, items=()):
+        """items: 현재 순위 순서의 (기관명, 점수[, URL]) 목록"""
+        self.keys = {}
+        self.urls = {}
+        self._seq = 0
+        for item in items:
+            name, score = item[0], item[1]
+            self.keys[name] = (-score, self._next_seq(), name)
+            self.urls[name] = item[2] if len(item) > 2 else ''
+        container = SortedList if SortedList is not None else _BisectList
+        self.order = container(self.keys.values())
+        self.published = {name: self.rank_info(name) for name in self.keys}
+
+    def _next_seq(self):
+        self._seq += 1
+        return self._seq
+
+    def __len__(self):
+        return len(self.order)
+
+    def score(self, name):
+        return -self.keys[name][0]
+
+    def rank_info(self, name):
+        """(position, rank, percentile) - position 은 1부터, rank 는 동점 공동 순위"""
+        key = self.keys[name]
+        n = len(self.order)
+        position = self.order.bisect_left(key) + 1
+        rank = self.order.bisect_left((key[0],)) + 1
+        lower = n - self.order.bisect_right((key[0], float('inf')))
+        percentile = round(100.0 * lower / (n - 1), 1) if n > 1 else 100.0
+        return position, rank, percentile
+
+    def entry(self, name):
+        position, rank, percentile = self.rank_info(name)
+        return {'position': position, 'rank': rank, 'name': name, 'url': self.urls.get(name, ''),
+                'score': self.score(name), 'percentile': percentile}
+
+    def top(self, n):
+        return [self.entry(self.order[i][2]) for i in range(min(n, len(self.order)))]
+
+    def bottom(self, n):
+        start = max(0, len(self.order) - n)
+        return [self.entry(self.order[i][2]) for i in range(start, len(self.order))] if n else []
+
+    def _tie_span(self, neg_score):
+        return self.order.bisect_left((neg_score,)), self.order.bisect_right((neg_score, float('inf')))
+
+    def _changed(self, names):
+        """names 중 순위 정보가 바뀐 기관 → 변경 목록 (published 갱신)"""
+        changes = []
+        for name in names:
+            info = self.rank_info(name)
+            previous = self.published.get(name)
+            if info != previous:
+                self.published[name] = info
+                change = self.entry(name)
+                change['previous_position'] = previous[0] if previous else None
+                changes.append(change)
+        changes.sort(key=lambda change: change['position'])
+        return changes
+
+    def update(self, name, score, url=None):
+        """
+        기관 점수 변경 (없는 기관이면 추가)
+
+        Returns:
+            순위 정보가 바뀐 기관 목록 (position 순)
+        """
+        if url is not None:
+            self.urls[name] = url
+        if name not in self.keys:
+            self.keys[name] = (-score, self._next_seq(), name)
+            self.urls.setdefault(name, '')
+            self.order.add(self.keys[name])
+            return self._changed(list(self.keys))
+
+        old = self.keys[name]
+        if old[0] == -score:
+            return []
+
+        old_lo, old_hi = self._tie_span(old[0])
+        self.order.remove(old)
+        # 동점 순서는 기존 입력 순서를 유지 (seq 그대로)
+        new = (-score, old[1], name)
+        self.keys[name] = new
+        self.order.add(new)
+        new_index = self.order.bisect_left(new)
+        new_lo, new_hi = self._tie_span(new[0])
+
+        # 이동 구간 + 이전 점수 동점 그룹 + 새 점수 동점 그룹 밖의 기관은 순위 정보가 그대로
+        lo = min(old_lo, new_lo, new_index)
+        hi = min(max(old_hi, new_hi, new_index + 1), len(self.order))
+        return self._changed([self.order[i][2] for i in range(lo, hi)])
+
+    def remove(self, name):
+        """기관 삭제 → 변경 목록 (삭제된 기관은 position=None)"""
+        key = self.keys.pop(name)
+        self.order.remove(key)
+        self.urls.pop(name, None)
+        self.published.pop(name, None)
+        changes = self._changed(list(self.keys))
+        changes.insert(0, {'position': None, 'rank': None, 'name': name, 'url': '',
+                           'score': None, 'percentile': None, 'previous_position': None})
+        return changes
+
+
+def load_dimension(db_path, dimension):
+    """rankings.sqlite 의 한 차원 → RankMaintainer"""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute('SELECT name, score, url FROM rankings WHERE dimension = ? ORDER BY position',
+                        (dimension,)).fetchall()
+    conn.close()
+    return RankMaintainer(rows)
+
+
+def publish_changes(data_dir, dimension, maintainer, changes, k=10):
+    """바뀐 행만 rankings.sqlite 에 반영 + rankings/<차원>.json 상위/하위 목록 갱신"""
+    data_dir = Path(data_dir)
+    conn = sqlite3.connect(data_dir / DB_NAME)
+    with conn:
+        conn.executemany('DELETE FROM rankings WHERE dimension = ? AND name = ?',
+                         [(dimension, change['name']) for change in changes])
+        conn.executemany('INSERT INTO rankings VALUES (?, ?, ?, ?, ?, ?, ?)', [
+            (dimension, change['position'], change['rank'], change['name'], change['url'],
+             change['score'], change['percentile'])
+            for change in changes if change['position'] is not None
+        ])
+        conn.execute('UPDATE dimensions SET count = ? WHERE dimension = ?', (len(maintainer), dimension))
+    conn.close()
+
+    summary_file = data_dir / DIMENSION_DIR / f'{dimension}.json'
+    with open(summary_file, encoding='utf-8') as f:
+        summary = json.load(f)
+    strip = lambda entry: {key: entry[key] for key in ('rank', 'name', 'url', 'score', 'percentile')}
+    summary['count'] = len(maintainer)
+    summary['top'] = [strip(entry) for entry in maintainer.top(k)]
+    summary['bottom'] = [strip(entry) for entry in maintainer.bottom(k)]
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기관 점수 1건 변경 → 순위 색인 증분 갱신')
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help='rankings.sqlite 가 있는 폴더')
+    parser.add_argument('--dimension', default='total', help='순위 차원 (total, convenience, Q1, age_20대, nielsen ...)')
+    parser.add_argument('--site', required=True, help='기관명')
+    parser.add_argument('--score', type=float, help='새 점수')
+    parser.add_argument('--remove', action='store_true', help='기관을 순위에서 삭제')
+    parser.add_argument('--top', type=int, default=10, help='차원별 JSON 의 상위/하위 기관 수')
+    args = parser.parse_args()
+
+    maintainer = load_dimension(Path(args.data_dir) / DB_NAME, args.dimension)
+    if args.remove:
+        changes = maintainer.remove(args.site)
+    elif args.score is None:
+        parser.error('--score 또는 --remove 가 필요합니다')
+    else:
+        changes = maintainer.update(args.site, args.score)
+
+    publish_changes(args.data_dir, args.dimension, maintainer, changes, args.top)
+    print(f"✅ {args.dimension}: 순위 변경 {len(changes)}건 (전체 {len(maintainer)}개 기관)")
+    for change in changes:
+        before = change['previous_position'] if change['previous_position'] is not None else '-'
+        after = change['position'] if change['position'] is not None else '-'
+        print(f"   {before} → {after}  {change['name']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+차원별 순위 색인
+총합 / 편의성 / 디자인 / Q1~Q10 / 연령대별 총합 / 최종 Nielsen 점수 각각에 대해
+기관 순위·백분위를 미리 계산해 두고, PHP API 가 요청마다 전체 JSON 을 읽지 않도록 한다.
+
+    rankings.sqlite        rankings(dimension, position, rank, name, url, score, percentile)
+                           PRIMARY KEY (dimension, position) → 페이지 조회는 인덱스 범위 검색 1번
+    rankings/<차원>.json   차원별 상위/하위 k개 (대시보드용 작은 파일)
+
+- 순위(rank)는 동점 공동 순위 (1, 2, 2, 4 ...), position 은 동점이면 입력 순서
+- 백분위 = 점수가 더 낮은 기관 비율 (0~100)
+- 점수가 없는 기관(None/NaN)은 해당 차원에서 제외
+
+    python ranking_index.py                 # web/data → web/data/rankings.sqlite, web/data/rankings/
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sqlite3
+from bisect import bisect_left
+from pathlib import Path
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / 'web' / 'data'
+DB_NAME = 'rankings.sqlite'
+DIMENSION_DIR = 'rankings'
+
+BASE_DIMENSIONS = [
+    ('total', '종합 점수', 'total_avg'),
+    ('convenience', '편의성', 'convenience_avg'),
+    ('design', '디자인', 'design_avg')
+]
+
+
+def top_k(items, k, key):
+    """key 내림차순 상위 k개 (sorted(reverse=True)[:k] 와 같은 결과, O(n log k))"""
+    return heapq.nlargest(k, items, key=key)
+
+
+def bottom_k(items, k, key):
+    """key 내림차순으로 정렬했을 때의 마지막 k개 (sorted(reverse=True)[-k:] 와 같은 순서)"""
+    indexed = list(enumerate(items))
+    lowest = heapq.nsmallest(k, indexed, key=lambda pair: (key(pair[1]), -pair[0]))
+    return [item for _, item in reversed(lowest)]
+
+
+def _valid(score):
+    return score is not None and not (isinstance(score, float) and math.isnan(score))
+
+
+def collect_dimensions(site_averages, final_agencies=None):
+    """
+    차원별 (기관명, URL, 점수) 목록
+
+    Returns:
+        {차원: {'label': 표시 이름, 'items': [(이름, URL, 점수)]}} - 입력 순서 유지
+    """
+    dimensions = {}
+
+    def add(dimension, label, name, url, score):
+        entry = dimensions.setdefault(dimension, {'label': label, 'items': []})
+        if _valid(score):
+            entry['items'].append((name, url, score))
+
+    for site in site_averages:
+        for dimension, label, field in BASE_DIMENSIONS:
+            add(dimension, label, site['name'], site['url'], site.get(field))
+        for q, score in site.get('scores', {}).items():
+            add(q, q, site['name'], site['url'], score)
+        for age_group, data in site.get('age_groups', {}).items():
+            add(f'age_{age_group}', f'{age_group} 종합 점수', site['name'], site['url'], data.get('total_avg'))
+
+    for agency in final_agencies or []:
+        add('nielsen', '최종 Nielsen 점수', agency['site_name'], agency.get('url', ''),
+            agency.get('final_nielsen_score'))
+
+    return dimensions
+
+
+def rank_rows(items):
+    """(이름, URL, 점수) 목록 → 점수 내림차순 (position, rank, 이름, URL, 점수, 백분위)"""
+    ordered = sorted(items, key=lambda item: item[2], reverse=True)
+    ascending = sorted(item[2] for item in items)
+    n = len(items)
+
+    rows = []
+    rank = 0
+    previous = None
+    for position, (name, url, score) in enumerate(ordered, 1):
+        if score != previous:
+            rank = position
+            previous = score
+        lower = bisect_left(ascending, score)
+        percentile = round(100.0 * lower / (n - 1), 1) if n > 1 else 100.0
+        rows.append((position, rank, name, url, score, percentile))
+    return rows
+
+
+def _row_dict(row):
+    position, rank, name, url, score, percentile = row
+    return {'rank': rank, 'name': name, 'url': url, 'score': score, 'percentile': percentile}
+
+
+def build_index(site_averages, out_dir, final_agencies=None, k=10):
+    """
+    out_dir 에 rankings.sqlite + rankings/<차원>.json 생성
+
+    Returns:
+        {차원: 기관 수}
+    """
+    out_dir = Path(out_dir)
+    dimension_dir = out_dir / DIMENSION_DIR
+    dimension_dir.mkdir(parents=True, exist_ok=True)
+
+    db_path = out_dir / DB_NAME
+    tmp = db_path.with_name(DB_NAME + '.tmp')
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    conn.executescript("""
+        CREATE TABLE dimensions (
+            dimension TEXT PRIMARY KEY,
+            label TEXT NOT NULL,
+            count INTEGER NOT NULL
+        );
+        CREATE TABLE rankings (
+            dimension TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            url TEXT,
+            score REAL NOT NULL,
+            percentile REAL NOT NULL,
+            PRIMARY KEY (dimension, position)
+        ) WITHOUT ROWID;
+        CREATE INDEX rankings_name ON rankings (dimension, name);
+    """)
+
+    counts = {}
+    for dimension, data in collect_dimensions(site_averages, final_agencies).items():
+        rows = rank_rows(data['items'])
+        counts[dimension] = len(rows)
+        conn.execute("INSERT INTO dimensions VALUES (?, ?, ?)", (dimension, data['label'], len(rows)))
+        conn.executemany("INSERT INTO rankings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         [(dimension,) + row for row in rows])
+
+        summary = {
+            'dimension': dimension,
+            'label': data['label'],
+            'count': len(rows),
+            'top': [_row_dict(row) for row in rows[:k]],
+            'bottom': [_row_dict(row) for row in rows[-k:]] if k else []
+        }
+        with open(dimension_dir / f'{dimension}.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    conn.commit()
+    conn.close()
+    os.replace(tmp, db_path)
+
+    for path in dimension_dir.glob('*.json'):
+        if path.stem not in counts:
+            path.unlink()
+    return counts
+
+
+def _load(data_dir, name):
+    path = Path(data_dir) / name
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def refresh_index(data_dir, site_averages=None, k=10):
+    """
+    분석 결과 저장 후 data_dir 의 순위 색인 갱신 (분석기 save 단계에서 호출)
+
+    site_averages 를 넘기지 않으면 data_dir/site_averages.json 을 읽고,
+    최종 Nielsen 점수는 항상 data_dir/final_integrated_scores.json 에서 읽음
+    """
+    if site_averages is None:
+        site_averages = _load(data_dir, 'site_averages.json')
+    if site_averages is None:
+        print("   ⚠️ site_averages.json 없음 - 순위 색인 건너뜀")
+        return None
+    final_data = _load(data_dir, 'final_integrated_scores.json') or {}
+
+    counts = build_index(site_averages, data_dir, final_data.get('agencies'), k)
+    print(f"   ✅ rankings.sqlite, rankings/ ({len(counts)}개 차원)")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='차원별 순위 색인 생성 (SQLite + 차원별 JSON)')
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help='site_averages.json 이 있는 폴더')
+    parser.add_argument('--out-dir', help='출력 폴더 (기본: data-dir)')
+    parser.add_argument('--top', type=int, default=10, help='차원별 JSON 에 넣을 상위/하위 기관 수')
+    args = parser.parse_args()
+
+    site_averages = _load(args.data_dir, 'site_averages.json')
+    if site_averages is None:
+        print(f"❌ {args.data_dir}/site_averages.json 파일이 없습니다")
+        return
+    final_data = _load(args.data_dir, 'final_integrated_scores.json') or {}
+
+    out_dir = args.out_dir or args.data_dir
+    counts = build_index(site_averages, out_dir, final_data.get('agencies'), args.top)
+    print(f"✅ {len(counts)}개 차원 순위 색인 생성")
+    print(f"   💾 {Path(out_dir) / DB_NAME}, {Path(out_dir) / DIMENSION_DIR}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+응답자 단위 원자료 스트리밍 집계
+기관 평균이 이미 계산된 엑셀 대신, 응답자 1명 = 1행인 대용량 원자료(xlsx/CSV)를
+청크 단위로 읽어 기관 × 연령대 × 문항별 개수·평균·분산(Welford)을 누적
+
+- CSV : pandas read_csv(chunksize)
+- xlsx: openpyxl read_only 모드 iter_rows → 청크 DataFrame
+- 메모리 사용량은 입력 크기와 무관하게 (청크 크기 + 기관×연령대×문항 통계) 로 고정
+- 결과는 AgeGroupAnalyzer 와 같은 레코드 / site_averages 구조
+
+필요 컬럼: 기관명, Q1~Q10 (긴 문항명 또는 'Q1'~'Q10'), 선택: 사이트주소, 연령대
+연령대 컬럼이 없으면 파일명(UI_UX 평가시스템_<연령대>...) 또는 --age-group 값 사용
+
+    python respondent_loader.py raw_20대.csv raw_30대.xlsx --output output/respondent_site_averages.json
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregation import json_value, weighted_mean
+from excel_loader import AGE_GROUPS, CONVENIENCE_QUESTIONS, DESIGN_QUESTIONS, Q_COLUMNS
+from score_cube import ScoreCube
+
+SITE_COLUMN = '기관명'
+URL_COLUMN = '사이트주소'
+AGE_COLUMN = '연령대'
+
+
+def _age_group_from_path(path):
+    name = Path(path).stem
+    for age_group in sorted(AGE_GROUPS, key=len, reverse=True):
+        if age_group in name:
+            return age_group
+    return None
+
+
+def normalize_age_group(value, age_groups=AGE_GROUPS):
+    """
+    연령대 표기 정규화 ('60대 이상' → '60대이상', '20' / '20.0' / '25' → '20대', '70대' → '60대이상')
+    age_groups 에 없는 값이면 None
+    """
+    label = re.sub(r'\s+', '', str(value))
+    if label in age_groups:
+        return label
+    match = re.fullmatch(r'(\d+)(?:\.0+)?(대)?(이상)?', label)
+    if match:
+        decade = int(match.group(1)) // 10 * 10
+        label = '60대이상' if decade >= 60 else f'{decade}대'
+        if label in age_groups:
+            return label
+    return None
+
+
+def _normalize_columns(df):
+    """긴 문항명 → Q1~Q10"""
+    rename = {col: q for q, col in Q_COLUMNS.items() if col in df.columns}
+    return df.rename(columns=rename)
+
+
+def iter_xlsx_chunks(path, chunksize=50000):
+    """openpyxl read_only 로 첫 시트를 chunksize 행씩 DataFrame 으로"""
+    import openpyxl
+
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = [str(h) if h is not None else '' for h in next(rows, [])]
+        block = []
+        for row in rows:
+            block.append(row)
+            if len(block) >= chunksize:
+                yield pd.DataFrame(block, columns=header)
+                block = []
+        if block:
+            yield pd.DataFrame(block, columns=header)
+    finally:
+        wb.close()
+
+
+def iter_chunks(path, chunksize=50000):
+    if Path(path).suffix.lower() in ('.xlsx', '.xlsm'):
+        yield from iter_xlsx_chunks(path, chunksize)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, encoding='utf-8-sig')
+
+
+def load_respondent_rows(paths, chunksize=50000):
+    """
+    원자료 파일들 → (기관명 목록, Q1~Q10 [응답자, 10]) - 응답자 단위 재표본 추출용
+    (집계와 달리 모든 응답 행을 메모리에 올림, 빈 응답·숫자가 아닌 값은 NaN)
+    """
+    questions = list(Q_COLUMNS)
+    site_names = []
+    blocks = []
+    for path in paths:
+        for chunk in iter_chunks(path, chunksize):
+            df = _normalize_columns(chunk)
+            df = df[df[SITE_COLUMN].notna()]
+            if df.empty:
+                continue
+            present = [q for q in questions if q in df.columns]
+            scores = df[present].apply(pd.to_numeric, errors='coerce').astype(np.float64)
+            site_names.extend(df[SITE_COLUMN].astype(str).tolist())
+            blocks.append(scores.reindex(columns=questions).to_numpy(np.float64))
+    return site_names, np.vstack(blocks) if blocks else np.empty((0, len(questions)))
+
+
+class RespondentAggregator:
+    """
+    (기관, 연령대) 별 문항 통계 누적
+
+    n / mean / m2 : float64 [그룹, Q1~Q10] - 문항별 응답 수, 평균, 편차 제곱합 (Welford)
+    """
+
+    def __init__(self, age_groups=AGE_GROUPS):
+        self.age_groups = list(age_groups)
+        self.questions = list(Q_COLUMNS)
+        self.keys = {}
+        self.urls = {}
+        self.rows = 0
+        # 알 수 없는 연령대 값 → 건너뛴 응답 수 (rows 에는 포함하지 않음)
+        self.unknown_age_groups = Counter()
+        capacity = 64
+        self.n = np.zeros((capacity, len(self.questions)))
+        self.mean = np.zeros((capacity, len(self.questions)))
+        self.m2 = np.zeros((capacity, len(self.questions)))
+
+    def _group_rows(self, keys):
+        """(기관, 연령대) → 통계 행 번호 (없으면 추가)"""
+        rows = []
+        for key in keys:
+            row = self.keys.get(key)
+            if row is None:
+                row = self.keys[key] = len(self.keys)
+                if row == len(self.n):
+                    self.n, self.mean, self.m2 = (np.vstack([a, np.zeros_like(a)])
+                                                  for a in (self.n, self.mean, self.m2))
+            rows.append(row)
+        return np.array(rows, dtype=np.int64)
+
+    def add_frame(self, df, age_group=None):
+        """응답자 청크 1개 누적 (청크 통계를 Chan 의 병렬 Welford 식으로 합침)"""
+        df = _normalize_columns(df)
+        if AGE_COLUMN not in df.columns:
+            if age_group is None:
+                raise ValueError("연령대 컬럼이 없고 연령대를 알 수 없습니다")
+            df = df.assign(**{AGE_COLUMN: age_group})
+
+        df = df[df[SITE_COLUMN].notna()]
+        if df.empty:
+            return
+
+        # 연령대 표기 정규화, 알 수 없는 값의 응답은 집계하지 않고 값별로 개수만 기록
+        raw_ages = df[AGE_COLUMN].astype(str)
+        labels = {value: normalize_age_group(value, self.age_groups) for value in raw_ages.unique()}
+        ages = raw_ages.map(labels)
+        known = ages.notna()
+        if not known.all():
+            self.unknown_age_groups.update(raw_ages[~known].tolist())
+            df, ages = df[known], ages[known]
+            if df.empty:
+                return
+        self.rows += len(df)
+
+        present = [q for q in self.questions if q in df.columns]
+        scores = df[present].apply(pd.to_numeric, errors='coerce').astype(np.float64)
+        scores = scores.reindex(columns=self.questions)
+        sites = df[SITE_COLUMN].astype(str)
+
+        if URL_COLUMN in df.columns:
+            first = pd.DataFrame({'site': sites, 'url': df[URL_COLUMN]}).dropna().drop_duplicates('site')
+            for site, url in zip(first['site'].tolist(), first['url'].astype(str).tolist()):
+                self.urls.setdefault(site, url)
+
+        grouped = scores.groupby([sites, ages], sort=False)
+        count = grouped.count()
+        chunk_mean = grouped.mean()
+        chunk_m2 = grouped.var(ddof=0) * count
+
+        rows = self._group_rows(count.index.tolist())
+        n_b = count.to_numpy(np.float64)
+        mean_b = np.nan_to_num(chunk_mean.to_numpy(np.float64))
+        m2_b = np.nan_to_num(chunk_m2.to_numpy(np.float64))
+
+        n_a = self.n[rows]
+        mean_a = self.mean[rows]
+        total = n_a + n_b
+        safe = np.where(total > 0, total, 1.0)
+        delta = mean_b - mean_a
+        self.mean[rows] = np.where(total > 0, mean_a + delta * n_b / safe, 0.0)
+        self.m2[rows] = self.m2[rows] + m2_b + delta ** 2 * n_a * n_b / safe
+        self.n[rows] = total
+
+    def add_file(self, path, age_group=None, chunksize=50000):
+        age_group = age_group or _age_group_from_path(path)
+        for chunk in iter_chunks(path, chunksize):
+            self.add_frame(chunk, age_group)
+
+    def _ordered_keys(self):
+        """연령대 순서 → 기관 최초 등장 순서 (AgeGroupAnalyzer all_data 와 같은 순서)"""
+        order = {age_group: i for i, age_group in enumerate(self.age_groups)}
+        return sorted(self.keys, key=lambda key: order[key[1]])
+
+    def records(self):
+        """process_age_group 과 같은 형식의 (기관, 연령대) 레코드 목록"""
+        conv = [self.questions.index(q) for q in CONVENIENCE_QUESTIONS]
+        design = [self.questions.index(q) for q in DESIGN_QUESTIONS]
+
+        results = []
+        for site, age_group in self._ordered_keys():
+            row = self.keys[(site, age_group)]
+            n = self.n[row]
+            means = np.where(n > 0, self.mean[row], np.nan)
+            results.append({
+                'name': site,
+                'url': self.urls.get(site, ''),
+                'age_group': age_group,
+                'scores': {q: json_value(v, 2) for q, v in zip(self.questions, means.tolist())},
+                'convenience_avg': json_value(weighted_mean(means[conv]), 2),
+                'design_avg': json_value(weighted_mean(means[design]), 2),
+                'total_avg': json_value(weighted_mean(means), 2)
+            })
+        return results
+
+    def stats(self):
+        """(기관, 연령대, 문항) 별 응답 수·평균·표준편차"""
+        result = {}
+        for site, age_group in self._ordered_keys():
+            row = self.keys[(site, age_group)]
+            n = self.n[row]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                std = np.sqrt(np.where(n > 1, self.m2[row] / np.maximum(n - 1, 1), np.nan))
+            result.setdefault(site, {})[age_group] = {
+                q: {
+                    'n': int(n_q),
+                    'mean': round(float(m), 4) if n_q > 0 else None,
+                    'std': round(float(s), 4) if n_q > 1 else None
+                }
+                for q, n_q, m, s in zip(self.questions, n.tolist(), self.mean[row].tolist(), std.tolist())
+            }
+        return result
+
+    def site_averages(self, weighted=False):
+        """
+        AgeGroupAnalyzer.calculate_site_averages 와 같은 구조
+
+        weighted=True 면 기관별 연령대 평균을 연령대 응답자 수로 가중
+        """
+        weights = None
+        if weighted:
+            weights = {key: float(self.n[row].max()) for key, row in self.keys.items()}
+        return ScoreCube.from_records(self.records(), self.age_groups, self.questions, weights).site_averages()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='응답자 단위 원자료 스트리밍 집계')
+    parser.add_argument('files', nargs='+', help='응답자 원자료 (.csv / .xlsx)')
+    parser.add_argument('--age-group', help='연령대 컬럼·파일명으로 알 수 없을 때 사용할 연령대')
+    parser.add_argument('--chunksize', type=int, default=50000, help='청크당 행 수')
+    parser.add_argument('--output', default='output/respondent_site_averages.json', help='site_averages 출력 파일')
+    parser.add_argument('--stats', help='문항별 응답 수·평균·표준편차 출력 파일')
+    parser.add_argument('--weighted', action='store_true', help='기관 평균을 연령대 응답자 수로 가중')
+    args = parser.parse_args()
+
+    aggregator = RespondentAggregator()
+    for path in args.files:
+        print(f"🔍 {path} 집계 중...")
+        aggregator.add_file(path, args.age_group, args.chunksize)
+
+    if aggregator.unknown_age_groups:
+        skipped = ', '.join(f"'{value}' {count:,}건" for value, count in aggregator.unknown_age_groups.most_common())
+        print(f"⚠️  알 수 없는 연령대 값 - 집계에서 제외: {skipped}")
+
+    site_averages = aggregator.site_averages(args.weighted)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(site_averages, f, ensure_ascii=False, indent=2)
+    print(f"✅ 응답 {aggregator.rows:,}건 → {len(site_averages)}개 기관 ({len(aggregator.keys)}개 기관×연령대)")
+    print(f"   💾 {args.output}")
+
+    if args.stats:
+        with open(args.stats, 'w', encoding='utf-8') as f:
+            json.dump(aggregator.stats(), f, ensure_ascii=False, indent=2)
+        print(f"   💾 {args.stats}")
+
+
+if __name__ == '__main__':
+    main()
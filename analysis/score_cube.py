@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기관 × 연령대 × 문항 점수 큐브
+- values   [기관, 연령대, Q1~Q10]
+- averages [기관, 연령대, (총합, 편의성, 디자인)]
+- mask     [기관, 연령대] 해당 연령대 평가 여부 (없으면 False, 값은 NaN)
+- weights  [기관, 연령대] 응답자 수 가중치 (None 이면 연령대 단순 평균)
+
+결측 문항은 NaN 으로 두고 aggregation.cube_summary 로 NaN 을 제외한 가중 평균을 낸다.
+
+기관 평균 / 문항 평균 / 연령대 간 격차 / 순위를 축 단위 연산으로 계산한다.
+메모리 안에서는 float64 로 계산해 기존 JSON 과 같은 값을 유지하고,
+score_cube.npz 에는 float32 로 저장 (비압축 → load_cube(mmap=True) 로 메모리 매핑)
+"""
+
+import warnings
+import zipfile
+
+import numpy as np
+
+from aggregation import cube_summary, json_value
+
+AVERAGE_FIELDS = ['total_avg', 'convenience_avg', 'design_avg']
+
+
+class ScoreCube:
+    def __init__(self, sites, urls, age_groups, questions, values, averages, mask, weights=None):
+        self.sites = list(sites)
+        self.urls = list(urls)
+        self.age_groups = list(age_groups)
+        self.questions = list(questions)
+        self.values = values
+        self.averages = averages
+        self.mask = mask
+        self.weights = weights
+
+    @classmethod
+    def from_records(cls, records, age_groups, questions, weights=None):
+        """
+        process_age_group 레코드 → 큐브
+
+        기관 순서는 처음 나온 순서, URL 은 첫 레코드 기준,
+        같은 기관·연령대가 여러 번 나오면 마지막 레코드 기준 (calculate_site_averages 와 동일)
+        점수가 None 인 문항은 NaN
+
+        Args:
+            weights: {연령대: 응답자 수} 또는 {(기관, 연령대): 응답자 수}
+                     평가가 있는 칸의 가중치가 없으면 ValueError (0 으로 두면 그 연령대가 평균에서 빠지므로)
+        """
+        site_index = {}
+        urls = []
+        for record in records:
+            if record['name'] not in site_index:
+                site_index[record['name']] = len(site_index)
+                urls.append(record['url'])
+
+        age_index = {age_group: i for i, age_group in enumerate(age_groups)}
+        shape = (len(site_index), len(age_groups))
+        values = np.full(shape + (len(questions),), np.nan, dtype=np.float64)
+        averages = np.full(shape + (len(AVERAGE_FIELDS),), np.nan, dtype=np.float64)
+        mask = np.zeros(shape, dtype=bool)
+
+        for record in records:
+            s = site_index[record['name']]
+            a = age_index[record['age_group']]
+            values[s, a] = [record['scores'][q] for q in questions]
+            averages[s, a] = [record[field] for field in AVERAGE_FIELDS]
+            mask[s, a] = True
+
+        weight_array = None
+        if weights:
+            weight_array = np.zeros(shape, dtype=np.float64)
+            missing = set()
+            for name, s in site_index.items():
+                for age_group, a in age_index.items():
+                    weight = weights.get((name, age_group), weights.get(age_group))
+                    if weight is None:
+                        if mask[s, a]:
+                            missing.add(age_group)
+                        continue
+                    weight_array[s, a] = weight
+            if missing:
+                missing = [age_group for age_group in age_groups if age_group in missing]
+                raise ValueError(f"가중치가 없는 연령대: {', '.join(missing)}")
+
+        return cls(site_index, urls, age_groups, questions, values, averages, mask, weight_array)
+
+    def summary(self):
+        """문항·평균 필드를 한 큐브로 묶어 기관별·연령대별·전체 평균을 한 번에 (cube_summary 결과)"""
+        stacked = np.concatenate([np.asarray(self.values, dtype=np.float64),
+                                  np.asarray(self.averages, dtype=np.float64)], axis=2)
+        return cube_summary(stacked, self.mask, self.weights)
+
+    def site_means(self):
+        """기관별 (문항 평균 [기관, Q], 총합·편의성·디자인 평균 [기관, 3])"""
+        site = self.summary()['site']
+        q = len(self.questions)
+        return site[:, :q], site[:, q:]
+
+    def age_means(self):
+        """연령대별 문항 평균 [연령대, Q]"""
+        return self.summary()['age'][:, :len(self.questions)]
+
+    def age_gap(self):
+        """연령대 간 문항 평균 차이 [연령대, 연령대, Q] (행 - 열)"""
+        means = self.age_means()
+        return means[:, None, :] - means[None, :, :]
+
+    def site_age_spread(self):
+        """기관별 문항의 연령대 간 최대-최소 차이 [기관, Q]"""
+        masked = np.where(self.mask[:, :, None], self.values, np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmax(masked, axis=1) - np.nanmin(masked, axis=1)
+
+    def ranking(self, field='total_avg'):
+        """field 평균 내림차순 기관 인덱스 (동점은 기존 순서 유지)"""
+        _, averages = self.site_means()
+        scores = averages[:, AVERAGE_FIELDS.index(field)]
+        return np.argsort(-scores, kind='stable')
+
+    def site_averages(self):
+        """AgeGroupAnalyzer.calculate_site_averages 와 같은 구조의 목록 (총합 평균 내림차순)"""
+        q_means, averages = self.site_means()
+        result = []
+        for s, (name, url) in enumerate(zip(self.sites, self.urls)):
+            age_groups = {}
+            for a in np.flatnonzero(self.mask[s]).tolist():
+                total_avg, convenience_avg, design_avg = self.averages[s, a].tolist()
+                age_groups[self.age_groups[a]] = {
+                    'total_avg': json_value(total_avg),
+                    'convenience_avg': json_value(convenience_avg),
+                    'design_avg': json_value(design_avg),
+                    'scores': {q: json_value(v) for q, v in zip(self.questions, self.values[s, a].tolist())}
+                }
+
+            total_avg, convenience_avg, design_avg = averages[s].tolist()
+            result.append({
+                'name': name,
+                'url': url,
+                'total_avg': json_value(total_avg, 2),
+                'convenience_avg': json_value(convenience_avg, 2),
+                'design_avg': json_value(design_avg, 2),
+                'scores': {q: json_value(v, 2) for q, v in zip(self.questions, q_means[s].tolist())},
+                'age_groups': age_groups
+            })
+
+        # 파이썬 정렬(안정 정렬)로 기존 출력 순서를 그대로 유지 (평균이 없는 기관은 맨 뒤)
+        result.sort(key=lambda x: x['total_avg'] if x['total_avg'] is not None else float('-inf'), reverse=True)
+        return result
+
+    def save(self, path):
+        np.savez(
+            path,
+            values=self.values.astype(np.float32),
+            averages=self.averages.astype(np.float32),
+            mask=self.mask,
+            sites=np.array(self.sites, dtype=str),
+            urls=np.array(self.urls, dtype=str),
+            age_groups=np.array(self.age_groups, dtype=str),
+            questions=np.array(self.questions, dtype=str),
+            **({'weights': self.weights.astype(np.float32)} if self.weights is not None else {})
+        )
+
+
+def _mmap_member(path, info):
+    """비압축 npz 멤버를 np.memmap 으로 (로컬 파일 헤더 뒤 .npy 헤더 다음이 데이터, 빈 배열이면 None)"""
+    with open(path, 'rb') as f:
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_len = int.from_bytes(header[26:28], 'little')
+        extra_len = int.from_bytes(header[28:30], 'little')
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if not shape or 0 in shape:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                     order='F' if fortran else 'C')
+
+
+def load_cube(path, mmap=True):
+    """score_cube.npz → ScoreCube (mmap=True 면 values/averages/mask 를 메모리 매핑)"""
+    arrays = {}
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            name = info.filename[:-4]
+            if mmap and info.compress_type == zipfile.ZIP_STORED and name in ('values', 'averages', 'mask', 'weights'):
+                arrays[name] = _mmap_member(path, info)
+            if arrays.get(name) is None:
+                with zf.open(info) as f:
+                    arrays[name] = np.lib.format.read_array(f)
+
+    return ScoreCube(
+        arrays['sites'].tolist(),
+        arrays['urls'].tolist(),
+        arrays['age_groups'].tolist(),
+        arrays['questions'].tolist(),
+        arrays['values'],
+        arrays['averages'],
+        arrays['mask'],
+        arrays.get('weights')
+    )
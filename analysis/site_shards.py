@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹 대시보드용 기관별 분할 파일 생성
+web/data 의 통합 JSON(site_averages, nielsen_detailed_reports 등)을 기관 1곳 = 파일 1개로 나누고,
+첫 화면에 필요한 요약만 담은 색인을 만든다.
+
+    data/sites/index.json    기관명, id, 대표 점수(Q1~Q10 포함), 분할 파일 이름·크기·해시, 묶음 파일 위치
+                             + 연령대별 요약 → 대시보드 첫 화면은 이 파일 하나만 읽음
+    data/sites/<id>.json     기관 1곳의 전체 상세 데이터
+    data/sites/sites.ndjson  모든 분할 파일을 한 줄씩 이어 붙인 묶음 (offset/length 로 Range 요청 가능)
+
+- id 는 기관명 해시 → 기관이 추가·삭제돼도 기존 기관의 파일 이름은 유지
+- 내용이 같은 분할 파일은 다시 쓰지 않음 (FTP 업로드 시 바뀐 파일만 올리면 됨)
+- 색인에 없는 오래된 분할 파일은 삭제
+- age_analyzer / nielsen_analyzer / final_integrator 가 결과 저장 후 output/sites 에 자동 생성 (refresh_shards)
+
+    python site_shards.py                       # web/data → web/data/sites
+    python site_shards.py --data-dir ../public/data
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from output_writer import expand_reports
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / 'web' / 'data'
+BUNDLE_NAME = 'sites.ndjson'
+
+
+def site_id(name):
+    return hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]
+
+
+def _load(data_dir, name):
+    path = Path(data_dir) / name
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _by_name(items, key):
+    """목록 → {기관명: 항목} (같은 이름이 여러 번 있으면 첫 항목)"""
+    result = {}
+    for item in items or []:
+        result.setdefault(item.get(key), item)
+    return result
+
+
+def collect_sites(data_dir):
+    """
+    기관별 상세 데이터 모음
+
+    Returns:
+        [(기관명, {섹션: 데이터})] - site_averages 순서 다음에 나머지 파일에만 있는 기관
+    """
+    site_averages = _load(data_dir, 'site_averages.json') or []
+    final_data = _load(data_dir, 'final_integrated_scores.json') or {}
+    mapped = _load(data_dir, 'nielsen_mapped_results.json') or {}
+
+    sections = {
+        'site_average': _by_name(site_averages, 'name'),
+        'nielsen_report': _by_name(expand_reports(_load(data_dir, 'nielsen_detailed_reports.json') or []), 'site_name'),
+        'integrated_nielsen': _by_name(_load(data_dir, 'integrated_nielsen_scores.json'), 'site_name'),
+        'final_integrated': _by_name(final_data.get('agencies'), 'site_name'),
+        'krds_image_analysis': _by_name(mapped.get('agencies'), 'agency')
+    }
+
+    names = []
+    seen = set()
+    for section in sections.values():
+        for name in section:
+            if name is not None and name not in seen:
+                seen.add(name)
+                names.append(name)
+
+    return [(name, {key: section[name] for key, section in sections.items() if name in section})
+            for name in names]
+
+
+def _headline(name, detail):
+    average = detail.get('site_average', {})
+    final = detail.get('final_integrated', {})
+    report = detail.get('nielsen_report', {})
+    integrated = detail.get('integrated_nielsen', {})
+    return {
+        'name': name,
+        'url': average.get('url') or final.get('url', ''),
+        'total_avg': average.get('total_avg'),
+        'convenience_avg': average.get('convenience_avg'),
+        'design_avg': average.get('design_avg'),
+        'scores': average.get('scores'),
+        'final_nielsen_score': final.get('final_nielsen_score'),
+        'nielsen_score': report.get('overall_score'),
+        'nielsen_average': integrated.get('nielsen_average'),
+        'data_sources': final.get('data_sources', [])
+    }
+
+
+def _write_if_changed(path, body):
+    """내용이 다를 때만 기록 → 기록 여부"""
+    if path.exists() and path.stat().st_size == len(body) and path.read_bytes() == body:
+        return False
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(body)
+    os.replace(tmp, path)
+    return True
+
+
+def build_shards(data_dir=DEFAULT_DATA_DIR, out_dir=None):
+    """
+    분할 파일 + 색인 생성
+
+    Returns:
+        (색인 dict, 새로 쓴 분할 파일 수, 삭제한 분할 파일 수)
+    """
+    out_dir = Path(out_dir) if out_dir else Path(data_dir) / 'sites'
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    bundle = []
+    offset = 0
+    written = 0
+    for name, detail in collect_sites(data_dir):
+        sid = site_id(name)
+        body = json.dumps({'id': sid, 'name': name, **detail}, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+        if _write_if_changed(out_dir / f'{sid}.json', body):
+            written += 1
+
+        entry = {'id': sid, **_headline(name, detail)}
+        entry.update({
+            'file': f'{sid}.json',
+            'bytes': len(body),
+            'sha256': hashlib.sha256(body).hexdigest()[:16],
+            'offset': offset,
+        })
+        entries.append(entry)
+        bundle.append(body + b'\n')
+        offset += len(body) + 1
+
+    _write_if_changed(out_dir / BUNDLE_NAME, b''.join(bundle))
+
+    keep = {entry['file'] for entry in entries}
+    removed = 0
+    for path in out_dir.glob('*.json'):
+        if path.name != 'index.json' and path.name not in keep:
+            path.unlink()
+            removed += 1
+
+    index = {
+        'generated_at': datetime.now().isoformat(),
+        'count': len(entries),
+        'bundle': BUNDLE_NAME,
+        'age_group_summary': _load(data_dir, 'age_group_summary.json') or {},
+        'sites': entries
+    }
+    with open(out_dir / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    return index, written, removed
+
+
+def refresh_shards(data_dir):
+    """분석 결과 저장 후 data_dir/sites 갱신 (분석기 save 단계에서 호출)"""
+    index, written, removed = build_shards(data_dir)
+    print(f"   ✅ sites/ ({index['count']}개 기관, 변경 {written}개, 삭제 {removed}개)")
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기관별 분할 데이터 파일 + 색인 생성')
+    parser.add_argument('--data-dir', default=str(DEFAULT_DATA_DIR), help='통합 JSON 이 있는 폴더 (web/data)')
+    parser.add_argument('--out-dir', help='분할 파일 폴더 (기본: <data-dir>/sites)')
+    args = parser.parse_args()
+
+    print(f"🔍 {args.data_dir} 기관별 분할 중...")
+    index, written, removed = build_shards(args.data_dir, args.out_dir)
+    out_dir = Path(args.out_dir) if args.out_dir else Path(args.data_dir) / 'sites'
+    index_size = (out_dir / 'index.json').stat().st_size
+    print(f"✅ {index['count']}개 기관 → 색인 {index_size / 1024:.1f} KB")
+    print(f"   💾 변경된 분할 파일 {written}개, 삭제 {removed}개 ({out_dir})")
+
+
+if __name__ == '__main__':
+    main()
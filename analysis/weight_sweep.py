@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nielsen 원칙 가중치 민감도 분석
+NielsenAnalyzer.nielsen_criteria 의 원칙 가중치(0.10, 0.12, 0.11 ...)를 바꿨을 때
+기관 종합 점수·순위가 어떻게 움직이는지, 가중치 변형 수천 개를 한 번에 계산한다.
+(변형마다 analyze_all_sites 를 다시 실행할 필요 없음)
+
+- 입력: nielsen_detailed_reports.json 의 원칙별 overall_score [기관, 원칙] (압축 형식도 가능)
+- 종합 점수 = 원칙 점수 @ 가중치 → [변형, 기관] 행렬 곱 한 번
+- 순위 = 1 + 점수가 더 높은 기관 수 (동점 공동 순위), 변형 묶음 단위로 비교
+- 가중치 변형: simplex_grid (격자) / dirichlet_weights (현재 가중치 중심 무작위) / load_weights (직접 지정)
+  모든 변형은 합이 1 이 되도록 정규화 (현재 가중치도 합 1)
+
+    python weight_sweep.py --dirichlet 5000 --concentration 50
+    python weight_sweep.py --grid 5
+    python weight_sweep.py --weights my_weights.json
+"""
+
+import argparse
+import itertools
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from output_writer import load_reports
+
+DEFAULT_REPORTS = Path(__file__).parent.parent / 'web' / 'data' / 'nielsen_detailed_reports.json'
+
+
+def principle_scores(reports):
+    """
+    보고서 목록 → (기관명 목록, 원칙 코드 목록, 원칙 이름 목록, 현재 가중치 [원칙], 원칙 점수 [기관, 원칙])
+    """
+    codes = list(reports[0]['principles']) if reports else []
+    names = [reports[0]['principles'][code]['name'] for code in codes] if reports else []
+    weights = np.array([reports[0]['principles'][code]['weight'] for code in codes], dtype=np.float64)
+    scores = np.array([[report['principles'][code]['overall_score'] for code in codes] for report in reports],
+                      dtype=np.float64).reshape(len(reports), len(codes))
+    return [report['site_name'] for report in reports], codes, names, weights, scores
+
+
+def normalize(weights):
+    """[변형, 원칙] → 행 합 1 (음수·합 0 인 행은 오류)"""
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    if (weights < 0).any():
+        raise ValueError('가중치는 0 이상이어야 합니다')
+    totals = weights.sum(axis=1, keepdims=True)
+    if (totals <= 0).any():
+        raise ValueError('가중치 합이 0 인 변형이 있습니다')
+    return weights / totals
+
+
+def simplex_grid(n_principles, parts):
+    """
+    합이 1 인 격자 가중치 (각 가중치 = 0, 1/parts, ..., 1) - 변형 수 C(parts + 원칙 수 - 1, 원칙 수 - 1)
+
+    예: 원칙 10개, parts=5 → 2002개
+    """
+    rows = []
+    # 칸막이 위치 조합 → 각 원칙 몫
+    for bars in itertools.combinations(range(parts + n_principles - 1), n_principles - 1):
+        edges = (-1,) + bars + (parts + n_principles - 1,)
+        rows.append([edges[i + 1] - edges[i] - 1 for i in range(n_principles)])
+    return np.array(rows, dtype=np.float64) / parts
+
+
+def dirichlet_weights(base, n, concentration=50.0, seed=None):
+    """현재 가중치 중심 디리클레 무작위 변형 [n, 원칙] (concentration 이 클수록 현재 가중치에 가까움)"""
+    base = normalize(base)[0]
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(base * concentration, size=n)
+
+
+def load_weights(path, codes):
+    """
+    직접 지정한 가중치 파일 (JSON)
+    - [[w1, ..., w10], ...]  원칙 순서대로
+    - [{원칙 코드: 가중치}, ...]  빠진 원칙은 0
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    rows = [[row.get(code, 0.0) for code in codes] if isinstance(row, dict) else row for row in data]
+    weights = np.array(rows, dtype=np.float64)
+    if weights.ndim != 2 or weights.shape[1] != len(codes):
+        raise ValueError(f'가중치는 변형마다 {len(codes)}개여야 합니다')
+    return weights
+
+
+def competition_ranks(scores, chunk=None):
+    """
+    [변형, 기관] 점수 → 순위 (1 + 점수가 더 높은 기관 수)
+
+    chunk: 한 번에 비교할 변형 수 (기본: 비교 행렬이 약 1600만 칸을 넘지 않도록)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n_variants, n_sites = scores.shape
+    chunk = chunk or max(1, 16_000_000 // max(1, n_sites * n_sites))
+    ranks = np.empty(scores.shape, dtype=np.int32)
+    for start in range(0, n_variants, chunk):
+        block = scores[start:start + chunk]
+        ranks[start:start + chunk] = 1 + (block[:, None, :] > block[:, :, None]).sum(axis=2)
+    return ranks
+
+
+def _corr(x, y):
+    """열별 피어슨 상관 [변형, a] × [변형, b] → [a, b] (분산 0 인 열은 0)"""
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    denom = np.sqrt((x * x).sum(axis=0))[:, None] * np.sqrt((y * y).sum(axis=0))[None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = np.where(denom > 0, (x.T @ y) / np.where(denom > 0, denom, 1.0), 0.0)
+    return corr
+
+
+def sweep(scores, weights, base_weights, top=10):
+    """
+    가중치 변형 전체의 종합 점수·순위 계산과 요약
+
+    Args:
+        scores: 원칙 점수 [기관, 원칙]
+        weights: 가중치 변형 [변형, 원칙] (정규화 전이어도 됨)
+        base_weights: 현재 가중치 [원칙]
+        top: 상위권 유지 비율을 볼 순위
+
+    Returns:
+        {'weights', 'overall', 'ranks', 'base_overall', 'base_ranks', 'site', 'principle', 'variant'}
+        site: 기관별 순위 안정성 배열, principle: 원칙별 민감도 배열, variant: 변형별 순위 변동 배열
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    weights = normalize(weights)
+    base = normalize(base_weights)
+
+    overall = scores @ weights.T                       # [기관, 변형]
+    overall = overall.T                                # [변형, 기관]
+    ranks = competition_ranks(overall)
+    base_overall = (scores @ base.T)[:, 0]
+    base_ranks = competition_ranks(base_overall[None, :])[0]
+
+    shift = ranks - base_ranks                         # [변형, 기관]
+    displacement = np.abs(shift).mean(axis=1)          # [변형]
+
+    # 원칙 가중치 ↔ 기관 순위 상관 [원칙, 기관]
+    rank_corr = _corr(weights, ranks.astype(np.float64))
+    # 원칙 가중치 ↔ 변형 전체 평균 순위 변동 [원칙]
+    displacement_corr = _corr(weights, displacement[:, None])[:, 0]
+
+    return {
+        'weights': weights,
+        'overall': overall,
+        'ranks': ranks,
+        'base_overall': base_overall,
+        'base_ranks': base_ranks,
+        'site': {
+            'mean_rank': ranks.mean(axis=0),
+            'std_rank': ranks.std(axis=0),
+            'min_rank': ranks.min(axis=0),
+            'max_rank': ranks.max(axis=0),
+            'p5_rank': np.percentile(ranks, 5, axis=0),
+            'p95_rank': np.percentile(ranks, 95, axis=0),
+            'same_rank_share': (shift == 0).mean(axis=0),
+            'top_share': (ranks <= top).mean(axis=0),
+            'min_score': overall.min(axis=0),
+            'max_score': overall.max(axis=0)
+        },
+        'principle': {
+            'min_weight': weights.min(axis=0),
+            'max_weight': weights.max(axis=0),
+            # 원칙 점수의 기관 간 편차 = 가중치를 올렸을 때 순위를 뒤바꿀 수 있는 정도
+            'score_spread': scores.std(axis=0),
+            'rank_corr': rank_corr,
+            'mean_abs_rank_corr': np.abs(rank_corr).mean(axis=1),
+            'displacement_corr': displacement_corr
+        },
+        'variant': {
+            'displacement': displacement,
+            'max_shift': np.abs(shift).max(axis=1),
+            'changed_sites': (shift != 0).sum(axis=1)
+        }
+    }
+
+
+def summarize(result, site_names, codes, principle_names, top=10, worst=10):
+    """sweep 결과 → JSON 저장용 요약"""
+    site = result['site']
+    principle = result['principle']
+    variant = result['variant']
+    r = lambda value, digits=3: round(float(value), digits)
+
+    sites = []
+    for i, name in enumerate(site_names):
+        corr = principle['rank_corr'][:, i]
+        strongest = int(np.argmax(np.abs(corr)))
+        sites.append({
+            'site_name': name,
+            'base_score': r(result['base_overall'][i], 2),
+            'base_rank': int(result['base_ranks'][i]),
+            'mean_rank': r(site['mean_rank'][i], 2),
+            'std_rank': r(site['std_rank'][i], 2),
+            'min_rank': int(site['min_rank'][i]),
+            'max_rank': int(site['max_rank'][i]),
+            'rank_90': [r(site['p5_rank'][i], 1), r(site['p95_rank'][i], 1)],
+            'same_rank_share': r(site['same_rank_share'][i]),
+            f'top{top}_share': r(site['top_share'][i]),
+            'score_range': [r(site['min_score'][i], 2), r(site['max_score'][i], 2)],
+            # 이 기관 순위에 가장 큰 영향을 주는 원칙 (양수 상관 = 가중치를 올리면 순위 숫자가 커짐 = 하락)
+            'most_sensitive_to': codes[strongest],
+            'sensitivity_corr': r(corr[strongest])
+        })
+    sites.sort(key=lambda entry: entry['base_rank'])
+
+    principles = []
+    for p, code in enumerate(codes):
+        principles.append({
+            'code': code,
+            'name': principle_names[p],
+            'weight_range': [r(principle['min_weight'][p]), r(principle['max_weight'][p])],
+            'score_spread': r(principle['score_spread'][p]),
+            'mean_abs_rank_corr': r(principle['mean_abs_rank_corr'][p]),
+            'displacement_corr': r(principle['displacement_corr'][p])
+        })
+    principles.sort(key=lambda entry: entry['mean_abs_rank_corr'], reverse=True)
+
+    order = np.argsort(-variant['displacement'], kind='stable')[:worst]
+    variants = [{
+        'index': int(v),
+        'weights': {code: r(result['weights'][v, p], 4) for p, code in enumerate(codes)},
+        'mean_rank_shift': r(variant['displacement'][v]),
+        'max_rank_shift': int(variant['max_shift'][v]),
+        'changed_sites': int(variant['changed_sites'][v])
+    } for v in order]
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'variant_count': int(len(result['weights'])),
+        'site_count': len(site_names),
+        'mean_rank_shift': r(variant['displacement'].mean()),
+        'unchanged_variant_share': r((variant['changed_sites'] == 0).mean()),
+        'sites': sites,
+        'principles': principles,
+        'most_disruptive_variants': variants
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Nielsen 원칙 가중치 민감도 분석')
+    parser.add_argument('--reports', default=str(DEFAULT_REPORTS), help='nielsen_detailed_reports.json 경로')
+    parser.add_argument('--dirichlet', type=int, help='현재 가중치 중심 무작위 변형 수')
+    parser.add_argument('--concentration', type=float, default=50.0, help='디리클레 집중도 (클수록 현재 가중치에 가까움)')
+    parser.add_argument('--seed', type=int, default=0, help='무작위 시드')
+    parser.add_argument('--grid', type=int, help='격자 분할 수 (가중치 = 0, 1/n, ..., 1)')
+    parser.add_argument('--weights', help='직접 지정한 가중치 JSON 파일')
+    parser.add_argument('--top', type=int, default=10, help='상위권 유지 비율을 볼 순위')
+    parser.add_argument('--output', default='output/nielsen_weight_sweep.json', help='요약 저장 경로')
+    args = parser.parse_args()
+
+    reports = load_reports(args.reports)
+    site_names, codes, principle_names, base_weights, scores = principle_scores(reports)
+
+    variants = []
+    if args.weights:
+        variants.append(load_weights(args.weights, codes))
+    if args.grid:
+        variants.append(simplex_grid(len(codes), args.grid))
+    if args.dirichlet or not variants:
+        variants.append(dirichlet_weights(base_weights, args.dirichlet or 1000, args.concentration, args.seed))
+    weights = np.vstack(variants)
+
+    print(f"📊 가중치 변형 {len(weights)}개 × 기관 {len(site_names)}개 분석...")
+    result = sweep(scores, weights, base_weights, args.top)
+    summary = summarize(result, site_names, codes, principle_names, args.top)
+
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ 평균 순위 변동: {summary['mean_rank_shift']}위 (순위 변화 없는 변형 {summary['unchanged_variant_share'] * 100:.1f}%)")
+    print("\n🎯 순위에 영향이 큰 원칙")
+    for entry in summary['principles'][:3]:
+        print(f"   {entry['name']} ({entry['code']}): 평균 |상관| {entry['mean_abs_rank_corr']}")
+    print("\n🔀 순위가 가장 불안정한 기관")
+    for entry in sorted(summary['sites'], key=lambda entry: entry['std_rank'], reverse=True)[:5]:
+        print(f"   {entry['site_name']}: 기준 {entry['base_rank']}위, 범위 {entry['min_rank']}~{entry['max_rank']}위")
+    print(f"\n💾 {output_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,33 +2,139 @@
 /**
  * AutoAnalyzer API - Get Rankings
  * 상위/하위 5개 기관 데이터 반환
+ *
+ * 차원별 순위 (analysis/ranking_index.py 가 만든 rankings.sqlite 사용):
+ *   ?dimension=total&offset=0&limit=10   순위 구간 (total, convenience, design, Q1~Q10, age_<연령대>, nielsen)
+ *   ?dimension=Q3&site=기관명            한 기관의 순위·백분위
+ *   ?dimensions=1                        사용 가능한 차원 목록
+ * SQLite(PDO) 를 쓸 수 없으면 data/rankings/<차원>.json 의 상위/하위 목록으로 응답
  */
 
 header('Content-Type: application/json; charset=utf-8');
 header('Access-Control-Allow-Origin: *');
 header('Access-Control-Allow-Methods: GET');
 
+function openRankingDb($dbFile) {
+    if (!file_exists($dbFile) || !class_exists('PDO') || !in_array('sqlite', PDO::getAvailableDrivers())) {
+        return null;
+    }
+    $db = new PDO('sqlite:' . $dbFile, null, null, [PDO::SQLITE_ATTR_OPEN_FLAGS => PDO::SQLITE_OPEN_READONLY]);
+    $db->setAttribute(PDO::ATTR_ERRMODE, PDO::ERRMODE_EXCEPTION);
+    return $db;
+}
+
 try {
-    $dataFile = '../data/rankings.json';
-    
+    $dimension = isset($_GET['dimension']) ? $_GET['dimension'] : null;
+    $listDimensions = isset($_GET['dimensions']);
+
+    // 기존 응답: 총합 기준 상위/하위 5개
+    if ($dimension === null && !$listDimensions) {
+        $dataFile = '../data/rankings.json';
+
+        if (!file_exists($dataFile)) {
+            throw new Exception('데이터 파일을 찾을 수 없습니다');
+        }
+
+        $data = file_get_contents($dataFile);
+        $json = json_decode($data, true);
+
+        if ($json === null) {
+            throw new Exception('JSON 파싱 오류');
+        }
+
+        echo json_encode([
+            'success' => true,
+            'data' => $json
+        ], JSON_UNESCAPED_UNICODE | JSON_PRETTY_PRINT);
+        exit;
+    }
+
+    $db = openRankingDb('../data/rankings.sqlite');
+
+    if ($listDimensions) {
+        if ($db === null) {
+            throw new Exception('순위 색인을 사용할 수 없습니다');
+        }
+        $rows = $db->query('SELECT dimension, label, count FROM dimensions ORDER BY dimension')->fetchAll(PDO::FETCH_ASSOC);
+        echo json_encode(['success' => true, 'data' => $rows], JSON_UNESCAPED_UNICODE);
+        exit;
+    }
+
+    $offset = isset($_GET['offset']) ? max(0, intval($_GET['offset'])) : 0;
+    $limit = isset($_GET['limit']) ? min(100, max(1, intval($_GET['limit']))) : 10;
+    $site = isset($_GET['site']) ? $_GET['site'] : null;
+
+    if ($db !== null) {
+        $stmt = $db->prepare('SELECT label, count FROM dimensions WHERE dimension = ?');
+        $stmt->execute([$dimension]);
+        $info = $stmt->fetch(PDO::FETCH_ASSOC);
+        if (!$info) {
+            http_response_code(404);
+            throw new Exception('알 수 없는 순위 차원입니다');
+        }
+
+        if ($site !== null) {
+            $stmt = $db->prepare('SELECT rank, name, url, score, percentile FROM rankings WHERE dimension = ? AND name = ?');
+            $stmt->execute([$dimension, $site]);
+            $rows = $stmt->fetchAll(PDO::FETCH_ASSOC);
+        } else {
+            $stmt = $db->prepare('SELECT rank, name, url, score, percentile FROM rankings WHERE dimension = ? AND position > ? ORDER BY position LIMIT ?');
+            $stmt->bindValue(1, $dimension);
+            $stmt->bindValue(2, $offset, PDO::PARAM_INT);
+            $stmt->bindValue(3, $limit, PDO::PARAM_INT);
+            $stmt->execute();
+            $rows = $stmt->fetchAll(PDO::FETCH_ASSOC);
+        }
+
+        echo json_encode([
+            'success' => true,
+            'dimension' => $dimension,
+            'label' => $info['label'],
+            'count' => intval($info['count']),
+            'offset' => $offset,
+            'data' => $rows
+        ], JSON_UNESCAPED_UNICODE);
+        exit;
+    }
+
+    // SQLite 를 쓸 수 없는 서버: 차원별 상위/하위 파일
+    if (!preg_match('/^[\p{L}\p{N}_]+$/u', $dimension)) {
+        http_response_code(400);
+        throw new Exception('잘못된 순위 차원입니다');
+    }
+    $dataFile = '../data/rankings/' . $dimension . '.json';
     if (!file_exists($dataFile)) {
-        throw new Exception('데이터 파일을 찾을 수 없습니다');
+        http_response_code(404);
+        throw new Exception('알 수 없는 순위 차원입니다');
     }
-    
-    $data = file_get_contents($dataFile);
-    $json = json_decode($data, true);
-    
+    $json = json_decode(file_get_contents($dataFile), true);
     if ($json === null) {
         throw new Exception('JSON 파싱 오류');
     }
-    
+
+    $rows = $json['top'];
+    if ($site !== null) {
+        $rows = array_values(array_filter(array_merge($json['top'], $json['bottom']), function($row) use ($site) {
+            return $row['name'] === $site;
+        }));
+        $rows = array_slice($rows, 0, 1);
+    } else {
+        $rows = array_slice($rows, $offset, $limit);
+    }
+
     echo json_encode([
         'success' => true,
-        'data' => $json
-    ], JSON_UNESCAPED_UNICODE | JSON_PRETTY_PRINT);
-    
+        'dimension' => $dimension,
+        'label' => $json['label'],
+        'count' => $json['count'],
+        'offset' => $offset,
+        'data' => $rows
+    ], JSON_UNESCAPED_UNICODE);
+
 } catch (Exception $e) {
-    http_response_code(500);
+    if (http_response_code() < 400) {
+        http_response_code(500);
+    }
     echo json_encode([
         'success' => false,
         'error' => $e->getMessage()
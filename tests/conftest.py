@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""
+테스트 공통 설정
+analysis/ 모듈은 서로를 최상위 모듈로 import 하므로 (python age_analyzer.py 처럼 폴더 안에서 실행)
+저장소 루트(validation 패키지)와 analysis/ 를 모두 경로에 추가
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / 'analysis'):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""age_analyzer - 증분 실행(저장된 부분 집계 재사용)과 --full 전체 재계산 결과가 같은지"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import age_analyzer
+from age_analyzer import AgeGroupAnalyzer
+from excel_loader import ExcelCache, workbook_path
+
+DATA_DIR = Path(age_analyzer.__file__).parent / 'data'
+RESULT_FILES = ['analysis_results.json', 'site_averages.json', 'rankings.json', 'age_group_summary.json']
+
+
+@pytest.fixture(scope='module')
+def excel_cache(tmp_path_factory):
+    return ExcelCache(tmp_path_factory.mktemp('excel_cache'))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    target = tmp_path / 'data'
+    shutil.copytree(DATA_DIR, target)
+    return target
+
+
+def make_analyzer(root, data_dir, excel_cache):
+    analyzer = AgeGroupAnalyzer()
+    analyzer.data_dir = data_dir
+    analyzer.output_dir = root / 'output'
+    analyzer.output_dir.mkdir(parents=True, exist_ok=True)
+    analyzer.partials_dir = root / 'partials'
+    analyzer.excel_cache = excel_cache
+    return analyzer
+
+
+def results(output_dir):
+    """결과 JSON 4개 (생성 시각 제외)"""
+    loaded = {}
+    for name in RESULT_FILES:
+        with open(output_dir / name, encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data.pop('generated_at', None)
+        loaded[name] = data
+    return loaded
+
+
+def full_results(tmp_path, data_dir, excel_cache):
+    analyzer = make_analyzer(tmp_path / 'full', data_dir, excel_cache)
+    assert analyzer.run(full=True)
+    return results(analyzer.output_dir)
+
+
+def test_incremental_matches_full(tmp_path, data_dir, excel_cache):
+    analyzer = make_analyzer(tmp_path / 'incremental', data_dir, excel_cache)
+    assert analyzer.run()
+
+    assert results(analyzer.output_dir) == full_results(tmp_path, data_dir, excel_cache)
+    for name in ('rankings.sqlite', 'rankings', 'sites/index.json'):
+        assert (analyzer.output_dir / name).exists()
+
+
+def test_changed_workbook_reprocesses_only_that_age_group(tmp_path, data_dir, excel_cache):
+    root = tmp_path / 'incremental'
+    assert make_analyzer(root, data_dir, excel_cache).run()
+
+    # 20대 파일 내용을 30대 파일로 바꿈 → 20대만 다시 처리
+    shutil.copyfile(workbook_path(data_dir, '30대'), workbook_path(data_dir, '20대'))
+    analyzer = make_analyzer(root, data_dir, excel_cache)
+    _, _, _, changed = analyzer.analyze_incremental()
+    assert changed == ['20대']
+
+    # 부분 집계만 갱신된 상태(저장 전 중단)에서도 다음 실행이 결과를 다시 저장
+    assert make_analyzer(root, data_dir, excel_cache).run()
+    assert results(root / 'output') == full_results(tmp_path, data_dir, excel_cache)
+
+
+def test_partials_version_change_reprocesses_everything(tmp_path, data_dir, excel_cache, monkeypatch):
+    root = tmp_path / 'incremental'
+    assert make_analyzer(root, data_dir, excel_cache).run()
+
+    analyzer = make_analyzer(root, data_dir, excel_cache)
+    assert analyzer.analyze_incremental()[3] == []
+
+    monkeypatch.setattr(age_analyzer, 'PARTIALS_VERSION', age_analyzer.PARTIALS_VERSION + 1)
+    analyzer = make_analyzer(root, data_dir, excel_cache)
+    assert analyzer.analyze_incremental()[3] == analyzer.age_groups
+
+
+def test_unchanged_run_rebuilds_missing_rankings_index(tmp_path, data_dir, excel_cache):
+    root = tmp_path / 'incremental'
+    assert make_analyzer(root, data_dir, excel_cache).run()
+    before = results(root / 'output')
+
+    shutil.rmtree(root / 'output' / 'rankings')
+    (root / 'output' / 'rankings.sqlite').unlink()
+    assert make_analyzer(root, data_dir, excel_cache).run()
+
+    assert (root / 'output' / 'rankings.sqlite').exists()
+    assert (root / 'output' / 'rankings' / 'total.json').exists()
+    assert results(root / 'output') == before
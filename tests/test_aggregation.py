@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""aggregation / score_cube / heuristic_nielsen_mapper - NaN 인식 가중 집계와 결측·0점 처리"""
+
+import math
+
+import numpy as np
+import pytest
+
+from aggregation import cube_summary, group_mean, json_value, weighted_mean
+from heuristic_nielsen_mapper import HeuristicToNielsenMapper
+from score_cube import ScoreCube
+
+AGE_GROUPS = ['20대', '30대', '40대']
+QUESTIONS = ['Q1', 'Q2']
+
+
+def record(name, age_group, q1, q2):
+    scores = {'Q1': q1, 'Q2': q2}
+    valid = [v for v in (q1, q2) if v is not None]
+    mean = sum(valid) / len(valid) if valid else None
+    return {'name': name, 'url': f'https://{name}.go.kr', 'age_group': age_group, 'scores': scores,
+            'total_avg': mean, 'convenience_avg': q1, 'design_avg': q2}
+
+
+def test_weighted_mean_skips_missing_values():
+    assert weighted_mean([3.0, None, 5.0]) == 4.0
+    assert weighted_mean([3.0, 0.0]) == 1.5
+    assert math.isnan(weighted_mean([None, None]))
+    assert weighted_mean([3.0, 5.0, None], weights=[1, 3, 10]) == 4.5
+
+
+def test_weighted_mean_sums_in_python_order():
+    values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]
+    assert weighted_mean(values) == sum(values) / len(values)
+
+
+def test_group_mean_keeps_first_seen_order():
+    keys, mean, weight = group_mean(['b', 'a', 'b'], [[1.0, np.nan], [2.0, 4.0], [3.0, 6.0]])
+    assert keys == ['b', 'a']
+    assert mean.tolist() == [[2.0, 6.0], [2.0, 4.0]]
+    assert weight.tolist() == [[2.0, 1.0], [1.0, 1.0]]
+
+
+def test_cube_summary_ignores_masked_cells():
+    cube = np.array([[[1.0], [9.0]], [[3.0], [np.nan]]])
+    mask = np.array([[True, False], [True, True]])
+    summary = cube_summary(cube, mask)
+    assert summary['site'].ravel().tolist() == [1.0, 3.0]
+    assert summary['age'][0, 0] == 2.0
+    assert math.isnan(summary['age'][1, 0])
+    assert summary['overall'].tolist() == [2.0]
+
+
+def test_json_value():
+    assert json_value(float('nan')) is None
+    assert json_value(None) is None
+    assert json_value(0.0) == 0.0
+    assert json_value(3.14159, 2) == 3.14
+
+
+def test_score_cube_site_averages_use_only_evaluated_groups():
+    records = [record('a', '20대', 4.0, 2.0), record('a', '30대', 2.0, None), record('b', '40대', 3.0, 3.0)]
+    averages = ScoreCube.from_records(records, AGE_GROUPS, QUESTIONS).site_averages()
+
+    # 총합 평균 내림차순 (a: 연령대 총합 3.0, 2.0 의 평균)
+    assert [site['name'] for site in averages] == ['b', 'a']
+    a = averages[1]
+    assert a['scores'] == {'Q1': 3.0, 'Q2': 2.0}
+    assert a['total_avg'] == 2.5
+    assert set(a['age_groups']) == {'20대', '30대'}
+    assert a['age_groups']['30대']['scores']['Q2'] is None
+
+
+def test_score_cube_weights():
+    records = [record('a', '20대', 4.0, 4.0), record('a', '30대', 2.0, 2.0)]
+    averages = ScoreCube.from_records(records, AGE_GROUPS, QUESTIONS,
+                                      {'20대': 3, '30대': 1, '40대': 5}).site_averages()
+    assert averages[0]['scores'] == {'Q1': 3.5, 'Q2': 3.5}
+
+    # (기관, 연령대) 가중치가 연령대 가중치보다 우선
+    averages = ScoreCube.from_records(records, AGE_GROUPS, QUESTIONS,
+                                      {('a', '20대'): 1, '20대': 3, '30대': 1}).site_averages()
+    assert averages[0]['scores'] == {'Q1': 3.0, 'Q2': 3.0}
+
+
+def test_score_cube_rejects_missing_weights_for_evaluated_groups():
+    records = [record('a', '20대', 4.0, 4.0), record('a', '30대', 2.0, 2.0), record('b', '40대', 3.0, 3.0)]
+    with pytest.raises(ValueError, match='30대, 40대'):
+        ScoreCube.from_records(records, AGE_GROUPS, QUESTIONS, {'20대': 3})
+
+    # 평가가 없는 연령대의 가중치는 없어도 됨
+    cube = ScoreCube.from_records(records[:2], AGE_GROUPS, QUESTIONS, {'20대': 3, '30대': 1})
+    assert cube.weights.tolist() == [[3.0, 1.0, 0.0]]
+
+
+def test_heuristic_mapper_keeps_zero_scores_and_skips_missing():
+    mapper = HeuristicToNielsenMapper()
+    item, info = next((item, info) for item, info in mapper.mapping.items() if info['nielsen'] == [8])
+    others = [other for other, other_info in mapper.mapping.items() if 8 in other_info['nielsen'] and other != item]
+
+    def principle_8(scores):
+        data = {'total_agencies': 1,
+                'agencies': [{'agency': '기관', 'overall_average': 3.0, 'scores': scores}]}
+        return mapper.map_heuristic_to_nielsen(data)['agencies'][0]['nielsen_scores']['N8']
+
+    base = {other: 4.0 for other in others}
+    weighted = [4.0 * mapper.mapping[other]['weight'] for other in others]
+
+    # 0.0 은 실제 점수 → 평균에 포함, None 은 제외
+    with_zero = principle_8({**base, item: 0.0})
+    assert with_zero == round(sum(weighted) / (len(weighted) + 1), 2)
+    missing = principle_8({**base, item: None})
+    assert missing == round(sum(weighted) / len(weighted), 2)
+    assert with_zero < missing
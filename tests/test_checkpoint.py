@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""validation.checkpoint - 중단 후 이어서 실행(--resume)과 결과 문서 생성"""
+
+import json
+
+from validation.checkpoint import Checkpoint, completed_urls, finalize
+
+
+def site(n):
+    return {'url': f'https://site{n}.go.kr', 'name': f'기관{n}'}
+
+
+def result(n, cached=False):
+    return {'url': site(n)['url'], 'overall': 3.0 + n / 10, 'cached': cached}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / 'run.ndjson'
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(3)
+        checkpoint(1, site(1), result(1), None)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"status": "ok", "index": 2, "url": "https://site2')
+
+    assert completed_urls(path) == {site(1)['url']}
+
+
+def test_missing_checkpoint_has_no_completed_urls(tmp_path):
+    assert completed_urls(tmp_path / 'none.ndjson') == set()
+
+
+def test_resume_retries_failed_sites(tmp_path):
+    path = tmp_path / 'run.ndjson'
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(3)
+        checkpoint(2, site(2), result(2), None)
+        checkpoint(1, site(1), None, ('http_500', 'HTTP 500'))
+
+    done = completed_urls(path)
+    pending = [n for n in (1, 2, 3) if site(n)['url'] not in done]
+    assert pending == [1, 3]
+
+    # 이어서 실행: 실패했던 1 은 성공, 3 은 실패
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(3)
+        checkpoint(1, site(1), result(1, cached=True), None)
+        checkpoint(3, site(3), None, ('timeout', '타임아웃'))
+
+    output = tmp_path / 'run.json'
+    meta = finalize(path, output)
+    doc = json.loads(output.read_text(encoding='utf-8'))
+
+    assert [r['url'] for r in doc['results']] == [site(1)['url'], site(2)['url']]
+    assert doc['results'] == [result(1, cached=True), result(2)]
+    assert doc['metadata'] == meta
+    assert meta['total_sites'] == 3
+    assert meta['success'] == 2
+    assert meta['failed'] == 1
+    assert meta['failures'] == {'timeout': 1}
+    assert meta['failed_urls'] == {site(3)['url']: 'timeout'}
+    assert meta['cache_hits'] == 1
+    assert meta['cache_misses'] == 2
+    assert 'pending' not in meta
+
+
+def test_finalize_reports_pending_sites(tmp_path):
+    path = tmp_path / 'run.ndjson'
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(5)
+        checkpoint(1, site(1), result(1), None)
+
+    meta = finalize(path, tmp_path / 'run.json')
+    assert meta['pending'] == 4
+    assert meta['success_rate'] == '20.0%'
+
+
+def test_finalize_matches_json_dump_layout(tmp_path):
+    path = tmp_path / 'run.ndjson'
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(2)
+        checkpoint(1, site(1), result(1), None)
+        checkpoint(2, site(2), result(2), None)
+
+    listing = tmp_path / 'list.json'
+    finalize(path, listing, layout='list')
+    expected = json.dumps([result(1), result(2)], ensure_ascii=False, indent=2)
+    assert listing.read_text(encoding='utf-8') == expected
+
+    document = tmp_path / 'doc.json'
+    meta = finalize(path, document)
+    expected = json.dumps({'metadata': meta, 'results': [result(1), result(2)]}, ensure_ascii=False, indent=2)
+    assert document.read_text(encoding='utf-8') == expected
+
+
+def test_finalize_empty_checkpoint(tmp_path):
+    path = tmp_path / 'run.ndjson'
+    with Checkpoint(path) as checkpoint:
+        checkpoint.start(0)
+
+    output = tmp_path / 'run.json'
+    meta = finalize(path, output, layout='list')
+    assert json.loads(output.read_text(encoding='utf-8')) == []
+    assert meta['success_rate'] == '0.0%'
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""validation.drift - 스냅샷 내 URL 중복 제거, 스냅샷 간 조인·검정, 처리 상태 저장"""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from validation.consistency import SCORE_COLUMNS
+from validation.drift import DriftTracker, paired_t, read_snapshot
+
+OVERALL = SCORE_COLUMNS.index('overall')
+
+
+def write_snapshot(path, rows):
+    """rows: [(url, overall)] → {results: [...]} 스냅샷"""
+    results = [{'url': url, 'name': url, 'category': '공공기관', 'overall': overall} for url, overall in rows]
+    path.write_text(json.dumps({'metadata': {}, 'results': results}), encoding='utf-8')
+    return path
+
+
+def test_paired_t_known_values():
+    # 변화량 1, 2, 3 → 평균 2, 표준편차 1, t = 2√3, 자유도 2
+    mean, sd, t, p = paired_t(3, 6.0, 14.0)
+    assert mean == pytest.approx(2.0)
+    assert sd == pytest.approx(1.0)
+    assert t == pytest.approx(2 * math.sqrt(3))
+    assert p == pytest.approx(0.0742, abs=1e-4)
+    assert paired_t(1, 1.0, 1.0) is None
+
+
+def test_paired_t_constant_shift_is_certain():
+    assert paired_t(4, 2.0, 1.0)[3] == 0.0
+    assert paired_t(4, 0.0, 0.0)[3] == pytest.approx(1.0)
+
+
+def test_read_snapshot_keeps_last_result_per_normalized_url(tmp_path):
+    path = write_snapshot(tmp_path / 'validation_20260101_000000.json', [
+        ('https://www.a.go.kr/', 3.0),
+        ('https://b.go.kr', 4.0),
+        ('http://a.go.kr', 3.5),
+    ])
+    keys, categories, scores = read_snapshot(path)
+
+    assert keys == ['b.go.kr', 'a.go.kr']
+    assert categories == ['공공기관', '공공기관']
+    assert scores.shape == (2, len(SCORE_COLUMNS))
+    assert scores[:, OVERALL].tolist() == [4.0, 3.5]
+    assert np.isnan(scores[0, SCORE_COLUMNS.index('design')])
+
+
+def test_add_joins_on_normalized_url_and_counts_each_site_once(tmp_path):
+    tracker = DriftTracker(min_samples=3)
+    first = write_snapshot(tmp_path / 'validation_20260101_000000.json',
+                           [(f'https://s{i}.go.kr', 3.0) for i in range(4)])
+    report = tracker.add(first)
+    assert (report['sites'], report['matched'], report['new']) == (4, 0, 4)
+
+    # 같은 사이트가 두 번 있어도 표본은 사이트 하나 (마지막 결과)
+    second = write_snapshot(tmp_path / 'validation_20260102_000000.json',
+                            [(f'https://www.s{i}.go.kr/', 3.5) for i in range(4)]
+                            + [('https://s0.go.kr', 3.5), ('https://new.go.kr', 2.0)])
+    report = tracker.add(second)
+    overall = report['items']['overall']
+
+    assert (report['sites'], report['matched'], report['new']) == (5, 4, 1)
+    assert overall['n'] == 4
+    assert overall['changed'] == 4
+    assert overall['mean_delta'] == pytest.approx(0.5)
+    assert overall['drift'] is True
+    assert report['drift_items'] == ['overall']
+    assert tracker.latest[tracker.index['s0.go.kr'], OVERALL] == 3.5
+
+
+def test_missing_scores_keep_previous_value(tmp_path):
+    tracker = DriftTracker()
+    tracker.add(write_snapshot(tmp_path / 'validation_20260101_000000.json', [('https://a.go.kr', 3.0)]))
+    tracker.add(write_snapshot(tmp_path / 'validation_20260102_000000.json', [('https://a.go.kr', None)]))
+    assert tracker.latest[tracker.index['a.go.kr'], OVERALL] == 3.0
+
+
+def test_state_round_trip_skips_seen_files(tmp_path):
+    state = tmp_path / 'state.json'
+    snapshot = write_snapshot(tmp_path / 'validation_20260101_000000.json', [('https://a.go.kr', 3.0)])
+
+    tracker = DriftTracker()
+    report = tracker.add(snapshot)
+    tracker.save(state)
+
+    loaded = DriftTracker.load(state)
+    assert loaded.is_seen(snapshot)
+    assert loaded.is_processed(report['digest'])
+    assert loaded.index == tracker.index
+    np.testing.assert_array_equal(loaded.latest, tracker.latest)
+
+    # 내용이 바뀌면 크기가 달라져 다시 처리 대상
+    write_snapshot(snapshot, [('https://a.go.kr', 3.25), ('https://b.go.kr', 4.0)])
+    assert not loaded.is_seen(snapshot)
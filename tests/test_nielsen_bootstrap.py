@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""nielsen_bootstrap - 점추정이 Nielsen 상세 보고서 점수와 같은지, 재표본·빈 입력 처리"""
+
+import json
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import nielsen_analyzer
+from nielsen_analyzer import NielsenAnalyzer
+from nielsen_bootstrap import ITEM_CODES, _scores, bootstrap, site_blocks, summarize
+from nielsen_projection import PROJECTION
+
+ANALYSIS_DIR = Path(nielsen_analyzer.__file__).parent
+REPORTS = ANALYSIS_DIR / 'output' / 'nielsen_detailed_reports.json'
+N_Q = len(PROJECTION.questions)
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    # NielsenAnalyzer 는 현재 폴더에 output/ 을 만듦
+    monkeypatch.chdir(tmp_path)
+    return NielsenAnalyzer(ANALYSIS_DIR / 'data')
+
+
+def weights_of(analyzer):
+    return np.array([info['weight'] for info in analyzer.nielsen_criteria.values()])
+
+
+def point_estimate(blocks, weights):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return _scores(np.nanmean(blocks, axis=1), weights)
+
+
+def test_point_estimate_equals_report_scores(analyzer):
+    names, blocks, counts = site_blocks(*analyzer.load_age_group_rows())
+    overall, principles, items = point_estimate(blocks, weights_of(analyzer))
+
+    with open(REPORTS, encoding='utf-8') as f:
+        reports = {report['site_name']: report for report in json.load(f)}
+    assert sorted(names) == sorted(reports)
+
+    for s, name in enumerate(names):
+        report = reports[name]
+        assert round(float(overall[s]), 2) == report['overall_score']
+        for p, code in enumerate(PROJECTION.principles):
+            assert round(float(principles[s, p]), 2) == report['principles'][code]['overall_score']
+        for i, (principle, item) in enumerate(o for o in PROJECTION.outputs if o[1] != 'overall'):
+            assert ITEM_CODES[i] == item
+            assert round(float(items[s, i]), 2) == report['principles'][principle]['items'][item]['score']
+
+
+def test_site_blocks_pads_by_site_in_first_seen_order():
+    rows = np.arange(5 * N_Q, dtype=np.float64).reshape(5, N_Q)
+    names, blocks, counts = site_blocks(['b', 'a', 'b', 'c', 'b'], rows)
+
+    assert names == ['b', 'a', 'c']
+    assert counts.tolist() == [3, 1, 1]
+    assert blocks.shape == (3, 3, N_Q)
+    np.testing.assert_array_equal(blocks[0], rows[[0, 2, 4]])
+    np.testing.assert_array_equal(blocks[1, 0], rows[1])
+    assert np.isnan(blocks[1, 1:]).all()
+
+
+def test_site_blocks_empty_input():
+    names, blocks, counts = site_blocks([], [])
+    assert names == []
+    assert blocks.shape == (0, 0, N_Q)
+    assert counts.shape == (0,)
+
+
+def test_bootstrap_is_reproducible_and_batch_independent():
+    rng = np.random.default_rng(0)
+    rows = rng.uniform(1, 5, size=(30, N_Q))
+    rows[rng.random(rows.shape) < 0.1] = np.nan
+    names = [f's{i % 7}' for i in range(30)]
+    _, blocks, counts = site_blocks(names, rows)
+    weights = np.full(len(PROJECTION.principles), 0.1)
+
+    first = bootstrap(blocks, counts, weights, resamples=64, seed=5)
+    again = bootstrap(blocks, counts, weights, resamples=64, seed=5)
+    for key in ('overall', 'principles', 'items', 'ranks'):
+        np.testing.assert_array_equal(first[key], again[key])
+
+    # 묶음 크기와 무관하게 같은 난수열 → 같은 재표본 (행렬 곱 합산 순서 차이만 허용)
+    batched = bootstrap(blocks, counts, weights, resamples=64, seed=5, batch=7)
+    for key in ('overall', 'principles', 'items'):
+        np.testing.assert_allclose(first[key], batched[key], rtol=1e-12)
+    assert first['overall'].shape == (64, 7)
+    assert first['items'].shape == (64, 7, len(ITEM_CODES))
+
+
+def test_single_row_sites_have_zero_width_intervals():
+    rows = np.array([[4.0] * N_Q, [2.0] * N_Q, [3.0] * N_Q, [3.5] * N_Q])
+    names, blocks, counts = site_blocks(['a', 'b', 'c', 'c'], rows)
+    weights = np.full(len(PROJECTION.principles), 0.1)
+
+    estimate = point_estimate(blocks, weights)
+    sites = summarize(names, counts, estimate, bootstrap(blocks, counts, weights, resamples=200, seed=1))
+    by_name = {site['site_name']: site for site in sites}
+
+    assert [site['site_name'] for site in sites] == ['a', 'c', 'b']
+    for name in ('a', 'b'):
+        overall = by_name[name]['overall']
+        assert overall['low'] == overall['score'] == overall['high']
+        assert overall['std'] == 0.0
+    assert by_name['a']['rank'] == {'rank': 1, 'low': 1, 'high': 1, 'median': 1.0, 'same_rank_share': 1.0}
+    assert by_name['c']['overall']['low'] < by_name['c']['overall']['high']
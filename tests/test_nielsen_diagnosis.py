@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""nielsen_analyzer 진단 표 - 모듈 로드 시 만든 DIAGNOSIS_TABLE 조회가 기존 if/elif 템플릿 조회와 같은지"""
+
+import math
+from pathlib import Path
+
+import pytest
+
+import nielsen_analyzer
+from nielsen_analyzer import DIAGNOSIS_TEMPLATES, NielsenAnalyzer
+
+ANALYSIS_DIR = Path(nielsen_analyzer.__file__).parent
+# 진단 표·계수 행렬 도입 전 코드로 만든 결과 (저장소에 커밋된 파일)
+LEGACY_REPORTS = ANALYSIS_DIR / 'output' / 'nielsen_detailed_reports.json'
+
+
+def legacy_diagnosis(item_code, score):
+    """진단 표 도입 전 generate_detailed_diagnosis 의 조회 방식 그대로"""
+    template = DIAGNOSIS_TEMPLATES.get(item_code, {})
+
+    if score >= template.get("excellent", (4.5, ""))[0]:
+        diagnosis = template.get("excellent", (0, "평가 중"))[1]
+        level = "excellent"
+    elif score >= template.get("good", (3.5, ""))[0]:
+        diagnosis = template.get("good", (0, "평가 중"))[1]
+        level = "good"
+    else:
+        diagnosis = template.get("poor", (0, "평가 중"))[1]
+        level = "poor"
+
+    return {
+        "score": round(score, 2),
+        "level": level,
+        "diagnosis": diagnosis,
+        "improvement": template.get("improvement", "추가 분석 필요")
+    }
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    # NielsenAnalyzer 는 현재 폴더에 output/ 을 만듦
+    monkeypatch.chdir(tmp_path)
+    return NielsenAnalyzer(ANALYSIS_DIR / 'data')
+
+
+SCORES = [-1.0, 0.0, 1.2, 3.0, 3.4999999, 3.5, 3.5000001, 4.0, 4.4999999, 4.5, 4.5000001, 5.0, 7.0,
+          math.nextafter(3.5, 0), math.nextafter(4.5, 0), math.nextafter(4.5, 9)]
+
+
+@pytest.mark.parametrize('item_code', sorted(DIAGNOSIS_TEMPLATES) + ['N11.1', ''])
+def test_diagnosis_table_matches_legacy_lookup(analyzer, item_code):
+    for score in SCORES:
+        assert analyzer.generate_detailed_diagnosis(item_code, score) == legacy_diagnosis(item_code, score)
+
+
+def test_nan_score_is_poor_like_legacy(analyzer):
+    result = analyzer.generate_detailed_diagnosis('N1.1', float('nan'))
+    legacy = legacy_diagnosis('N1.1', float('nan'))
+    assert result['level'] == legacy['level'] == 'poor'
+    assert result['diagnosis'] == legacy['diagnosis']
+    assert math.isnan(result['score'])
+
+
+def test_full_reports_equal_legacy_output(analyzer, tmp_path):
+    analyzer.output_dir = tmp_path / 'reports'
+    analyzer.output_dir.mkdir()
+    analyzer.analyze_all_sites()
+
+    produced = (analyzer.output_dir / 'nielsen_detailed_reports.json').read_bytes()
+    assert produced == LEGACY_REPORTS.read_bytes()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""nielsen_projection - 계수 행렬 투영이 기존 Q → Nielsen 매핑 식과 같은 값인지"""
+
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import nielsen_analyzer
+from nielsen_analyzer import NielsenAnalyzer
+from nielsen_projection import PROJECTION, QUESTIONS
+
+DATA_DIR = Path(nielsen_analyzer.__file__).parent / 'data'
+
+
+def legacy_map_q_to_nielsen(q_scores):
+    """계수 표 도입 전 NielsenAnalyzer.map_q_to_nielsen 의 식 그대로"""
+    q = lambda name: q_scores.get(name, 3.5)
+    return {
+        "N1_visibility": {"N1.1": q("Q7") * 0.9, "N1.2": q("Q1") * 0.85, "N1.3": q("Q1") * 0.9,
+                          "overall": (q("Q7") + q("Q1")) / 2},
+        "N2_real_world": {"N2.1": q("Q3"), "N2.2": q("Q9"), "N2.3": q("Q9") * 0.95,
+                          "overall": (q("Q3") + q("Q9")) / 2},
+        "N3_control": {"N3.1": q("Q4") * 1.05, "N3.2": q("Q2") * 0.8, "N3.3": q("Q2") * 0.85,
+                       "overall": (q("Q4") + q("Q2")) / 2},
+        "N4_consistency": {"N4.1": q("Q8"), "N4.2": q("Q10"), "N4.3": q("Q8") * 0.95,
+                           "overall": (q("Q8") + q("Q10")) / 2},
+        "N5_prevention": {"N5.1": q("Q5") * 0.9, "N5.2": q("Q5") * 0.85, "N5.3": q("Q5"),
+                          "overall": q("Q5")},
+        "N6_recognition": {"N6.1": q("Q6") * 0.8, "N6.2": q("Q1") * 0.85, "N6.3": q("Q6") * 0.95,
+                           "overall": (q("Q6") + q("Q1")) / 2},
+        "N7_flexibility": {"N7.1": q("Q2") * 0.7, "N7.2": q("Q4") * 0.9, "N7.3": q("Q2") * 0.85,
+                           "overall": (q("Q2") + q("Q4")) / 2},
+        "N8_minimalist": {"N8.1": q("Q7"), "N8.2": q("Q7") * 0.9, "N8.3": q("Q10"),
+                          "overall": (q("Q7") + q("Q10")) / 2},
+        "N9_error_recovery": {"N9.1": q("Q5"), "N9.2": q("Q6") * 0.9, "N9.3": q("Q5") * 0.95,
+                              "overall": (q("Q5") + q("Q6")) / 2},
+        "N10_help": {"N10.1": q("Q6") * 0.85, "N10.2": q("Q6") * 0.9, "N10.3": q("Q3") * 0.8,
+                     "overall": (q("Q6") + q("Q3")) / 2},
+    }
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    # NielsenAnalyzer 는 현재 폴더에 output/ 을 만듦
+    monkeypatch.chdir(tmp_path)
+    return NielsenAnalyzer(DATA_DIR)
+
+
+def random_q_scores(rng):
+    """일부 문항이 빠진 무작위 Q 점수"""
+    return {q: round(rng.uniform(1.0, 5.0), rng.choice([1, 2, 6]))
+            for q in QUESTIONS if rng.random() > 0.15}
+
+
+def test_projection_equals_legacy_formulas_exactly():
+    rng = random.Random(21)
+    q_scores_list = [random_q_scores(rng) for _ in range(2000)]
+    projected = PROJECTION.project(PROJECTION.q_matrix(q_scores_list))
+
+    for q_scores, row in zip(q_scores_list, projected):
+        assert PROJECTION.to_dict(row) == legacy_map_q_to_nielsen(q_scores)
+
+
+def test_map_q_to_nielsen_equals_legacy(analyzer):
+    rng = random.Random(3)
+    for _ in range(200):
+        q_scores = random_q_scores(rng)
+        assert analyzer.map_q_to_nielsen(q_scores) == legacy_map_q_to_nielsen(q_scores)
+    assert analyzer.map_q_to_nielsen({}) == legacy_map_q_to_nielsen({})
+
+
+def test_missing_and_nan_answers_use_default_score():
+    q = PROJECTION.q_matrix([{'Q1': float('nan'), 'Q2': None, 'Q3': 4.0}])
+    assert q[0].tolist() == [3.5, 3.5, 4.0] + [3.5] * 7
+
+
+def test_batched_coefficient_variants():
+    q = PROJECTION.q_matrix([{q: 4.0 for q in QUESTIONS}, {q: 2.0 for q in QUESTIONS}])
+    variants = np.stack([PROJECTION.matrix, PROJECTION.matrix * 2])
+    projected = PROJECTION.project(q, variants)
+
+    assert projected.shape == (2, 2, len(PROJECTION.outputs))
+    np.testing.assert_array_equal(projected[0], PROJECTION.project(q))
+    np.testing.assert_array_equal(projected[1], PROJECTION.project(q) * 2)
+
+
+def test_weighted_overall_uses_principle_overall_columns():
+    q = PROJECTION.q_matrix([{'Q5': 5.0}])
+    weights = np.eye(len(PROJECTION.principles))
+    principles = PROJECTION.weighted_overall(PROJECTION.project(q), weights)[0]
+    legacy = legacy_map_q_to_nielsen({'Q5': 5.0})
+    assert principles.tolist() == [legacy[p]['overall'] for p in PROJECTION.principles]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""rank_maintainer - 증분 갱신한 순위가 ranking_index.rank_rows 전체 재계산과 같은지"""
+
+import json
+import random
+import sqlite3
+
+import pytest
+
+import rank_maintainer
+from rank_maintainer import RankMaintainer, load_dimension, publish_changes
+from ranking_index import DB_NAME, build_index, rank_rows
+
+
+@pytest.fixture(params=['sortedcontainers', 'bisect'])
+def container(request, monkeypatch):
+    """SortedList 와 대체 구현(_BisectList) 모두 확인"""
+    if request.param == 'bisect':
+        monkeypatch.setattr(rank_maintainer, 'SortedList', None)
+    elif rank_maintainer.SortedList is None:
+        pytest.skip('sortedcontainers 미설치')
+
+
+def expected_state(items):
+    """items: 입력 순서의 (이름, 점수) → {이름: (position, rank, percentile)}"""
+    return {name: (position, rank, percentile)
+            for position, rank, name, _, _, percentile in rank_rows([(name, '', score) for name, score in items])}
+
+
+def state(maintainer):
+    return {name: maintainer.rank_info(name) for name in maintainer.keys}
+
+
+def test_initial_state_matches_rank_rows(container):
+    items = [('a', 3.0), ('b', 4.0), ('c', 3.0), ('d', 2.5), ('e', 4.0)]
+    maintainer = RankMaintainer(items)
+    assert state(maintainer) == expected_state(items)
+    assert [entry['name'] for entry in maintainer.top(3)] == ['b', 'e', 'a']
+    assert [entry['name'] for entry in maintainer.bottom(2)] == ['c', 'd']
+
+
+def test_random_updates_match_full_recompute(container):
+    rng = random.Random(7)
+    scores = [round(rng.uniform(2.0, 5.0), 1) for _ in range(40)]
+    items = [(f'기관{i}', score) for i, score in enumerate(scores)]
+    maintainer = RankMaintainer(items)
+
+    for _ in range(300):
+        before = expected_state(items)
+        i = rng.randrange(len(items))
+        # 동점이 자주 생기도록 0.1 단위 점수
+        new_score = round(rng.uniform(2.0, 5.0), 1)
+        changes = maintainer.update(items[i][0], new_score)
+        items[i] = (items[i][0], new_score)
+
+        after = expected_state(items)
+        assert state(maintainer) == after
+        # 변경 목록 = 순위 정보가 실제로 바뀐 기관만, position 순
+        assert {change['name'] for change in changes} == {name for name in after if after[name] != before[name]}
+        assert [change['position'] for change in changes] == sorted(change['position'] for change in changes)
+        for change in changes:
+            assert change['previous_position'] == before[change['name']][0]
+
+
+def test_add_and_remove_match_full_recompute(container):
+    items = [('a', 3.0), ('b', 4.0), ('c', 3.5)]
+    maintainer = RankMaintainer(items)
+
+    changes = maintainer.update('d', 3.5, url='https://d.go.kr')
+    items.append(('d', 3.5))
+    assert state(maintainer) == expected_state(items)
+    assert {change['name'] for change in changes} == {'a', 'c', 'd'}
+    assert maintainer.entry('d')['url'] == 'https://d.go.kr'
+
+    changes = maintainer.remove('b')
+    items = [item for item in items if item[0] != 'b']
+    assert state(maintainer) == expected_state(items)
+    assert changes[0]['name'] == 'b' and changes[0]['position'] is None
+
+
+def test_unchanged_score_reports_nothing(container):
+    maintainer = RankMaintainer([('a', 3.0), ('b', 4.0)])
+    assert maintainer.update('a', 3.0) == []
+
+
+def site(name, total):
+    return {'name': name, 'url': f'https://{name}.go.kr', 'total_avg': total,
+            'convenience_avg': total, 'design_avg': total, 'scores': {}, 'age_groups': {}}
+
+
+def test_publish_changes_matches_rebuilt_index(tmp_path, container):
+    sites = [site(f's{i}', 3.0 + (i % 5) / 10) for i in range(12)]
+    incremental = tmp_path / 'incremental'
+    build_index(sites, incremental, k=3)
+
+    maintainer = load_dimension(incremental / DB_NAME, 'total')
+    changes = maintainer.update('s4', 2.9)
+    publish_changes(incremental, 'total', maintainer, changes, k=3)
+
+    sites[4]['total_avg'] = 2.9
+    rebuilt = tmp_path / 'rebuilt'
+    build_index(sites, rebuilt, k=3)
+
+    query = 'SELECT * FROM rankings WHERE dimension = ? ORDER BY position'
+    rows = [sqlite3.connect(path / DB_NAME).execute(query, ('total',)).fetchall() for path in (incremental, rebuilt)]
+    assert rows[0] == rows[1]
+
+    summaries = [json.loads((path / 'rankings' / 'total.json').read_text(encoding='utf-8'))
+                 for path in (incremental, rebuilt)]
+    assert summaries[0] == summaries[1]
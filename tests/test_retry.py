@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""validation.retry + ValidationClient.fetch - 재시도 정책과 호스트별 회로 차단기 상태 전이"""
+
+import asyncio
+
+import pytest
+
+from validation import retry
+from validation.client import ValidationClient
+from validation.retry import CircuitBreaker, RetryPolicy, is_retryable
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """retry 모듈의 time.monotonic 을 직접 움직이는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(retry.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize('failure, expected', [
+    ('timeout', True), ('connection', True), ('http_429', True), ('http_500', True),
+    ('http_503', True), ('http_404', False), ('http_400', False), ('schema', False),
+    ('circuit_open', False)
+])
+def test_is_retryable(failure, expected):
+    assert is_retryable(failure) is expected
+
+
+def test_timeouts_are_retried_only_when_enabled():
+    assert not RetryPolicy().should_retry('timeout')
+    assert RetryPolicy(retry_timeouts=True).should_retry('timeout')
+    assert RetryPolicy().should_retry('http_502')
+    assert not RetryPolicy(retry_timeouts=True).should_retry('http_404')
+
+
+def test_delay_is_capped_full_jitter():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(5.0, 2 ** attempt)
+
+
+def test_breaker_opens_after_threshold_and_half_opens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    host = 'a.go.kr'
+
+    assert breaker.allow(host)
+    breaker.record_failure(host)
+    assert breaker.allow(host)
+    breaker.record_failure(host)
+    assert not breaker.allow(host)
+    assert breaker.opened == 1
+
+    # reset_timeout 이후 시험 요청 1개만 허용
+    clock[0] += 61
+    assert breaker.allow(host)
+    assert not breaker.allow(host)
+
+    # 시험 요청 성공 → closed
+    breaker.record_success(host)
+    assert breaker.allow(host)
+    assert breaker.allow(host)
+
+
+def test_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    host = 'a.go.kr'
+    breaker.record_failure(host)
+    breaker.record_failure(host)
+
+    clock[0] += 61
+    assert breaker.allow(host)
+    breaker.record_failure(host)
+    assert breaker.opened == 2
+    assert not breaker.allow(host)
+
+    clock[0] += 61
+    assert breaker.allow(host)
+
+
+def test_uncounted_failures_do_not_open_but_end_trials(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    host = 'a.go.kr'
+
+    # 4xx·schema 는 연속 실패로 세지 않음
+    for _ in range(5):
+        breaker.record_failure(host, counted=False)
+    assert breaker.allow(host)
+    assert breaker.opened == 0
+
+    # half-open 시험 요청이 4xx 로 끝나도 시험 상태가 남지 않고 다시 open
+    breaker.record_failure(host)
+    breaker.record_failure(host)
+    clock[0] += 61
+    assert breaker.allow(host)
+    breaker.record_failure(host, counted=False)
+    assert not breaker.allow(host)
+    clock[0] += 61
+    assert breaker.allow(host)
+
+
+def test_hosts_are_independent():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure('a.go.kr')
+    assert not breaker.allow('a.go.kr')
+    assert breaker.allow('b.go.kr')
+
+
+def make_client(outcomes, **policy):
+    """request() 가 outcomes 의 실패 분류(None 이면 성공)를 차례로 돌려주는 클라이언트"""
+    client = ValidationClient(retry=RetryPolicy(base_delay=0.0, **policy))
+    calls = []
+
+    async def request(site):
+        failure = outcomes[min(len(calls), len(outcomes) - 1)]
+        calls.append(failure)
+        if failure is None:
+            return {'url': site['url']}, None, {}
+        return None, (failure, failure), None
+
+    client.request = request
+    return client, calls
+
+
+def fetch(client, url='https://a.go.kr/x'):
+    return asyncio.run(client.fetch({'url': url}))
+
+
+def test_failing_site_makes_every_attempt_and_keeps_real_failure():
+    client, calls = make_client(['http_500'])
+    result, error, _ = fetch(client)
+
+    assert result is None
+    assert error[0] == 'http_500'
+    assert len(calls) == 3
+    assert client.retries == 2
+    # 다음 사이트부터 차단
+    assert fetch(client, 'https://a.go.kr/y')[1][0] == 'circuit_open'
+    assert len(calls) == 3
+
+
+def test_connection_errors_retry_until_success():
+    client, calls = make_client(['connection', 'connection', None])
+    result, error, _ = fetch(client)
+
+    assert error is None
+    assert result == {'url': 'https://a.go.kr/x'}
+    assert len(calls) == 3
+    assert client.breaker.allow('a.go.kr')
+
+
+def test_timeout_is_not_retried_by_default():
+    client, calls = make_client(['timeout'])
+    assert fetch(client)[1][0] == 'timeout'
+    assert len(calls) == 1
+
+    client, calls = make_client(['timeout'], retry_timeouts=True)
+    assert fetch(client)[1][0] == 'timeout'
+    assert len(calls) == 3
+
+
+def test_client_errors_are_not_retried():
+    client, calls = make_client(['http_404'])
+    assert fetch(client)[1][0] == 'http_404'
+    assert len(calls) == 1
+    assert client.retries == 0
@@ -0,0 +1,4 @@
+"""
+/api/analyze 검증 실행 도구 모음
+analyze_batch / analyze_extended / analyze_large_scale 스크립트가 공유하는 클라이언트
+"""
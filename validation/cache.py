@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/api/analyze 응답 캐시 (SQLite)
+키 = URL + 가중치 버전(/api/weights) [+ 대상 페이지 HTML 다이제스트]
+- TTL 이 지난 항목은 조회 시 무시
+- 전체 크기가 상한을 넘으면 가장 오래 조회되지 않은 항목부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+
+
+class ResponseCache:
+    """URL·가중치 버전별 분석 응답 저장소"""
+
+    def __init__(self, path, ttl=7 * 24 * 3600, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                weights_version TEXT NOT NULL,
+                html_digest TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                analysis_time REAL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+
+        # 만료 항목 정리
+        self.conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def key(url, weights_version, html_digest=None):
+        raw = '\n'.join([url, weights_version, html_digest or ''])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """(응답 dict, 최초 분석 시간) 또는 None"""
+        row = self.conn.execute(
+            "SELECT body, analysis_time, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, analysis_time, created_at = row
+        if created_at < time.time() - self.ttl:
+            self._delete(key)
+            return None
+
+        self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return json.loads(zlib.decompress(body)), analysis_time
+
+    def put(self, key, url, weights_version, html_digest, data, analysis_time):
+        body = zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+
+        self._delete(key)
+        self.conn.execute(
+            "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, url, weights_version, html_digest, body, len(body), analysis_time, now, now)
+        )
+        self.total_bytes += len(body)
+        self._evict()
+        self.conn.commit()
+
+    def _delete(self, key):
+        row = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.total_bytes -= row[0]
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            rows = self.conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 32"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.total_bytes -= size
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+
+def weights_version(payload):
+    """/api/weights 응답 → 버전 문자열 (버전 번호 + 가중치 내용 해시)"""
+    digest = hashlib.sha256(
+        json.dumps(payload.get('weights'), sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()[:12]
+    return f"{payload.get('version', 'unknown')}+{digest}"
+
+
+def html_digest(body):
+    return hashlib.sha256(body).hexdigest()
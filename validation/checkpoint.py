@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검증 실행 체크포인트 (append-only NDJSON)
+- 사이트 분석이 끝날 때마다 한 줄씩 기록하고 fsync → 중단되어도 완료분은 보존
+- --resume 시 이미 성공한 URL 은 건너뜀
+- finalize: 체크포인트를 스트리밍으로 읽어 {metadata, results} 문서 생성
+
+레코드 형식:
+    {"status": "start", "total_sites": 100, "started_at": "..."}
+    {"status": "ok", "index": 3, "url": "...", "result": {...}}
+    {"status": "failed", "index": 4, "url": "...", "failure": "http_500", "error": "HTTP 500"}
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+
+class Checkpoint:
+    """NDJSON 체크포인트 기록기 (with 문으로 사용)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self, total_sites, **info):
+        self._write({
+            'status': 'start',
+            'total_sites': total_sites,
+            'started_at': datetime.now().isoformat(),
+            **info
+        })
+
+    def __call__(self, idx, site, result, error):
+        """ValidationClient.run 의 결과 콜백"""
+        if result is not None:
+            self._write({'status': 'ok', 'index': idx, 'url': site['url'], 'result': result})
+        else:
+            failure, message = error
+            self._write({'status': 'failed', 'index': idx, 'url': site['url'],
+                         'failure': failure, 'error': message})
+
+
+def iter_records(path):
+    """(바이트 오프셋, 레코드) 순회, 중단으로 잘린 마지막 줄은 무시"""
+    with open(path, 'rb') as f:
+        offset = 0
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if record is not None:
+                yield offset, record
+            offset += len(line)
+
+
+def completed_urls(path):
+    """체크포인트에서 이미 성공한 URL 집합"""
+    if not Path(path).exists():
+        return set()
+    return {r['url'] for _, r in iter_records(path) if r['status'] == 'ok'}
+
+
+def scan(path):
+    """
+    체크포인트 요약 (결과 본문은 메모리에 올리지 않음)
+
+    Returns:
+        (URL별 최종 성공 레코드 (index, offset, 캐시 여부) 목록, 실패 URL → 실패 분류, 마지막 start 레코드)
+    """
+    ok = {}
+    failed = {}
+    start = None
+
+    for offset, record in iter_records(path):
+        status = record['status']
+        if status == 'start':
+            start = record
+        elif status == 'ok':
+            ok[record['url']] = (record['index'], offset, bool(record['result'].get('cached')))
+            failed.pop(record['url'], None)
+        elif record['url'] not in ok:
+            failed[record['url']] = record.get('failure', 'unknown')
+
+    return sorted(ok.values()), failed, start
+
+
+def finalize(path, output_file, metadata=None, layout='document'):
+    """
+    체크포인트 → validation 결과 파일
+
+    layout='document' 는 {metadata, results}, 'list' 는 results 배열만 저장
+    (json.dump(indent=2) 와 같은 모양으로 한 건씩 기록)
+    """
+    entries, failed, start = scan(path)
+
+    success = len(entries)
+    cache_hits = sum(1 for _, _, cached in entries if cached)
+    total = (start or {}).get('total_sites') or success + len(failed)
+    meta = {
+        'total_sites': total,
+        'success': success,
+        'failed': len(failed),
+        'failures': dict(Counter(failed.values())),
+        'failed_urls': failed,
+        'cache_hits': cache_hits,
+        'cache_misses': success + len(failed) - cache_hits,
+        'success_rate': f"{success / total * 100:.1f}%" if total else "0.0%",
+        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S")
+    }
+    if total > success + len(failed):
+        meta['pending'] = total - success - len(failed)
+    meta.update(metadata or {})
+    meta['checkpoint'] = str(path)
+
+    indent = '    ' if layout == 'document' else '  '
+    with open(path, 'rb') as src, open(output_file, 'w', encoding='utf-8') as out:
+        if layout == 'document':
+            out.write('{\n  "metadata": ')
+            out.write(json.dumps(meta, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+            out.write(',\n  "results": [')
+        else:
+            out.write('[')
+
+        for n, (_, offset, _) in enumerate(entries):
+            src.seek(offset)
+            result = json.loads(src.readline())['result']
+            body = json.dumps(result, ensure_ascii=False, indent=2).replace('\n', '\n' + indent)
+            out.write((',' if n else '') + '\n' + indent + body)
+
+        out.write(('\n' + indent[:-2] if entries else '') + ']')
+        if layout == 'document':
+            out.write('\n}')
+
+    return meta
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검증 체크포인트(NDJSON) → 결과 JSON 변환')
+    parser.add_argument('checkpoint', help='체크포인트 파일 (.ndjson)')
+    parser.add_argument('--output', help='결과 파일 (기본: 체크포인트와 같은 이름의 .json)')
+    parser.add_argument('--list', action='store_true', help='results 배열만 저장 (analyze_batch 형식)')
+    args = parser.parse_args()
+
+    output_file = Path(args.output) if args.output else Path(args.checkpoint).with_suffix('.json')
+    meta = finalize(args.checkpoint, output_file, layout='list' if args.list else 'document')
+
+    print(f"✅ {output_file}")
+    print(f"   성공: {meta['success']}개 / 실패: {meta['failed']}개 ({meta['success_rate']})")
+
+
+if __name__ == '__main__':
+    main()
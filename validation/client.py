@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 배치 검증 클라이언트
+aiohttp 세션 하나(keep-alive 커넥션 풀)로 /api/analyze 를 동시에 호출하고
+사이트별 결과를 체크포인트(NDJSON)에 기록한 뒤 validation_*.json 형식으로 저장
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from validation.cache import ResponseCache, html_digest, weights_version
+from validation.checkpoint import Checkpoint, completed_urls, finalize
+from validation.metrics import RunMetrics, make_trace_config, phase_durations
+from validation.ratelimit import AdaptiveConcurrency, TokenBucket
+from validation.registry import DEFAULT_REGISTRY, load_sites, parse_shard, shard
+from validation.retry import CircuitBreaker, RetryPolicy, is_retryable
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_API_URL = 'http://localhost:3000/api/analyze'
+DEFAULT_CACHE_FILE = BASE_DIR / '.validation_cache.sqlite'
+
+# 결과 필드 → predicted_score 내 (그룹, 항목 키)
+ITEM_FIELDS = {
+    'N1_1': ('convenience_items', 'N1.1_현재_위치'),
+    'N3_2': ('convenience_items', 'N3.2_나가기'),
+    'N5_1': ('convenience_items', 'N5.1_입력_검증'),
+    'N9_1': ('design_items', 'N9.1_오류_메시지'),
+    'N5_3': ('convenience_items', 'N5.3_제약_조건'),
+    'N9_3': ('design_items', 'N9.3_오류_예방'),
+    'N6_1': ('convenience_items', 'N6.1_보이는_옵션'),
+    'N6_3': ('convenience_items', 'N6.3_기억_부담'),
+    'N7_1': ('convenience_items', 'N7.1_단축키'),
+    'N10_1': ('convenience_items', 'N10.1_도움말_접근성'),
+}
+
+
+def normalize_site(site):
+    """(url, name) 또는 (url, name, category, size) → dict"""
+    if isinstance(site, dict):
+        return site
+    url, name, *rest = site
+    category, size = (list(rest) + [None, None])[:2]
+    return {'url': url, 'name': name, 'category': category, 'size': size}
+
+
+def extract_result(site, data, elapsed, concurrency=None):
+    """분석 응답 → 검증 결과 레코드 (predicted_score 누락 시 KeyError)"""
+    ps = data['predicted_score']
+
+    result = {'name': site['name'], 'url': site['url']}
+    if site.get('category') is not None:
+        result['category'] = site['category']
+        result['size'] = site['size']
+
+    result['overall'] = ps['overall']
+    result['convenience'] = ps['convenience']
+    result['design'] = ps['design']
+    for field, (group, key) in ITEM_FIELDS.items():
+        result[field] = ps[group][key]['score']
+    result['analysis_time'] = elapsed
+    if concurrency is not None:
+        result['concurrency'] = concurrency
+
+    return result
+
+
+class ValidationClient:
+    """/api/analyze 동시 호출 클라이언트 (async with 로 사용)"""
+
+    def __init__(self, api_url=DEFAULT_API_URL, concurrency=5, timeout=25,
+                 session_id=None, max_concurrency=None, rate=None, target_p95=None,
+                 max_error_rate=0.1, cache=None, refresh=False, digest_html=False,
+                 retry=None, breaker=None, record=None):
+        self.api_url = api_url
+        self.concurrency = concurrency
+        self.max_concurrency = max(concurrency, max_concurrency or concurrency)
+        self.timeout = timeout
+        self.session_id = session_id
+        self.rate = rate
+        self.target_p95 = target_p95 or timeout / 2
+        self.max_error_rate = max_error_rate
+
+        # 응답 캐시 (ResponseCache), refresh=True 면 조회 없이 갱신만
+        self.cache = cache
+        self.refresh = refresh
+        self.digest_html = digest_html
+        self.weights_version = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.retries = 0
+
+        # 원본 응답 녹화 파일 (replay_server --recordings 입력)
+        self.record = record
+        self._recorder = None
+
+        # 요청 단계별 지연 히스토그램 (캐시 적중은 제외)
+        self.metrics = RunMetrics()
+
+        self.session = None
+        self.limiter = None
+        self.bucket = None
+
+    async def __aenter__(self):
+        # 세션 헤더는 분석 서버 요청에만 붙인다 (HTML 다이제스트 요청은 외부 사이트로 나감)
+        self._auth_headers = {'X-Session-ID': self.session_id} if self.session_id else {}
+
+        # 커넥션 수 = 최대 동시 요청 수, 유휴 커넥션은 재사용
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[make_trace_config()]
+        )
+        self.limiter = AdaptiveConcurrency(
+            initial=self.concurrency,
+            maximum=self.max_concurrency,
+            target_p95=self.target_p95,
+            max_error_rate=self.max_error_rate
+        )
+        self.bucket = TokenBucket(self.rate, burst=self.concurrency)
+
+        if self.record:
+            self._recorder = open(self.record, 'a', encoding='utf-8')
+
+        if self.cache is not None:
+            self.weights_version = await self.fetch_weights_version()
+            if self.weights_version is None:
+                print("⚠️  /api/weights 조회 실패 - 캐시 사용 안 함")
+                self.cache = None
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        if self._recorder is not None:
+            self._recorder.close()
+
+    def _record(self, url, status, elapsed, body):
+        if self._recorder is not None:
+            self._recorder.write(json.dumps(
+                {'url': url, 'status': status, 'elapsed': elapsed, 'body': body},
+                ensure_ascii=False
+            ) + '\n')
+            self._recorder.flush()
+
+    async def fetch_weights_version(self):
+        weights_url = self.api_url.rsplit('/api/', 1)[0] + '/api/weights'
+        try:
+            async with self.session.get(weights_url, headers=self._auth_headers) as response:
+                if response.status != 200:
+                    return None
+                return weights_version(await response.json(content_type=None))
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+            return None
+
+    async def fetch_html_digest(self, url):
+        """대상 페이지 HTML 해시 (실패 시 None → 캐시 우회)"""
+        try:
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return html_digest(await response.read())
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            return None
+
+    async def analyze(self, site):
+        """
+        사이트 1개 분석 (캐시 적중 시 API 호출 생략)
+
+        Returns:
+            (result, error) - 성공 시 error 는 None, 실패 시 result 는 None 이고
+            error 는 (실패 분류, 메시지) - 분류는 validation/retry.py 참고
+        """
+        if self.cache is None:
+            result, error, _ = await self.fetch(site)
+            return result, error
+
+        digest = None
+        if self.digest_html:
+            digest = await self.fetch_html_digest(site['url'])
+            if digest is None:
+                self.cache_misses += 1
+                result, error, _ = await self.fetch(site)
+                return result, error
+
+        key = self.cache.key(site['url'], self.weights_version, digest)
+        if not self.refresh:
+            hit = self.cache.get(key)
+            if hit is not None:
+                data, analysis_time = hit
+                try:
+                    result = extract_result(site, data, analysis_time)
+                    result['cached'] = True
+                    self.cache_hits += 1
+                    return result, None
+                except (KeyError, TypeError):
+                    pass
+
+        self.cache_misses += 1
+        result, error, data = await self.fetch(site)
+        if result is not None:
+            self.cache.put(key, site['url'], self.weights_version, digest, data, result['analysis_time'])
+        return result, error
+
+    async def fetch(self, site):
+        """
+        재시도·회로 차단을 적용한 request()
+
+        회로 차단은 첫 시도 전에만 확인 - 이미 시작한 사이트의 재시도는 --retries 만큼 모두 하고
+        마지막 실제 실패 분류(http_5xx, connection 등)를 돌려줌
+        """
+        host = urlsplit(site['url']).hostname
+        if not self.breaker.allow(host):
+            return None, ('circuit_open', "회로 차단 (연속 실패 호스트)"), None
+
+        for attempt in range(self.retry.max_attempts):
+            result, error, data = await self.request(site)
+            if result is not None:
+                self.breaker.record_success(host)
+                return result, None, data
+
+            # 타임아웃은 재시도하지 않더라도 호스트 실패로 집계, 4xx·schema 는 시험 요청만 종료
+            self.breaker.record_failure(host, counted=is_retryable(error[0]))
+            if not self.retry.should_retry(error[0]):
+                return result, error, data
+
+            if attempt + 1 < self.retry.max_attempts:
+                self.retries += 1
+                await asyncio.sleep(self.retry.delay(attempt))
+
+        return result, error, data
+
+    async def request(self, site):
+        """/api/analyze 1회 호출 → (result, error, 응답 원문 dict)"""
+        await self.bucket.acquire()
+        token = await self.limiter.acquire()
+        concurrency = token[0]
+
+        outcome = 'error'
+        stamps = {}
+        start_time = time.perf_counter()
+        try:
+            async with self.session.post(self.api_url, json={'url': site['url']},
+                                         headers=self._auth_headers,
+                                         trace_request_ctx=stamps) as response:
+                if response.status != 200:
+                    if response.status == 429 or response.status >= 500:
+                        outcome = 'overload'
+                    self._record(site['url'], response.status, time.perf_counter() - start_time, None)
+                    return None, (f"http_{response.status}", f"HTTP {response.status}"), None
+                raw = await response.read()
+                body_done = time.perf_counter()
+                data = json.loads(raw)
+                decoded = time.perf_counter()
+                self._record(site['url'], 200, decoded - start_time, data)
+            result = extract_result(site, data, time.perf_counter() - start_time, concurrency)
+            phases = phase_durations(stamps, body_done, decoded) if 'start' in stamps else None
+            if phases is not None:
+                self.metrics.record(site, phases)
+                result['phases'] = {phase: round(seconds, 4) for phase, seconds in phases.items()}
+            outcome = 'ok'
+            return result, None, data
+        except asyncio.TimeoutError:
+            outcome = 'overload'
+            return None, ('timeout', f"타임아웃 ({self.timeout}초 초과)"), None
+        except aiohttp.ClientError as e:
+            return None, ('connection', f"오류: {str(e)[:50]}"), None
+        except (KeyError, TypeError, ValueError):
+            return None, ('schema', "오류: predicted_score 없음"), None
+        finally:
+            await self.limiter.release(token, time.perf_counter() - start_time, outcome)
+
+    async def run(self, sites, on_result=None):
+        """
+        전체 사이트 동시 분석
+
+        on_result(idx, site, result, error) 는 사이트가 끝날 때마다 호출된다
+        (idx 는 입력 순서, 1부터). 반환값은 (성공 수, 실패 수).
+        """
+        total = len(sites)
+        success = 0
+        failed = 0
+
+        async def worker(idx, site):
+            return idx, site, await self.analyze(site)
+
+        tasks = [asyncio.create_task(worker(idx, site)) for idx, site in sites]
+
+        for done, future in enumerate(asyncio.as_completed(tasks), 1):
+            idx, site, (result, error) = await future
+            label = site['name']
+            if site.get('category'):
+                label += f" ({site['category']}/{site['size']})"
+
+            if result is not None:
+                success += 1
+                source = '캐시' if result.get('cached') else f"{result['analysis_time']:.1f}초"
+                print(f"[{done}/{total}] ✅ {label} ({source}): 종합 {result['overall']:.2f}")
+            else:
+                failed += 1
+                print(f"[{done}/{total}] ❌ {label}: {error[1]}")
+
+            if on_result is not None:
+                on_result(idx, site, result, error)
+
+        return success, failed
+
+
+def run_validation(sites, **options):
+    """동기 진입점: {metadata, results} 문서 반환 (options 는 ValidationClient 인자)"""
+    sites = [normalize_site(s) for s in sites]
+    results = []
+    failures = Counter()
+    failed_urls = {}
+
+    def collect(idx, site, result, error):
+        if result is not None:
+            results.append((idx, result))
+        else:
+            failures[error[0]] += 1
+            failed_urls[site['url']] = error[0]
+
+    async def _run():
+        async with ValidationClient(**options) as client:
+            counts = await client.run(list(enumerate(sites, 1)), collect)
+            return counts, client.limiter.summary(), client.retries, client.metrics
+
+    started = time.perf_counter()
+    (success, failed), concurrency, retries, metrics = asyncio.run(_run())
+    elapsed = time.perf_counter() - started
+
+    results.sort(key=lambda x: x[0])
+    total = len(sites)
+    return {
+        'metadata': {
+            'total_sites': total,
+            'success': success,
+            'failed': failed,
+            'failures': dict(failures),
+            'failed_urls': failed_urls,
+            'success_rate': f"{success / total * 100:.1f}%" if total else "0.0%",
+            'concurrency': concurrency,
+            'retries': retries,
+            'latency': metrics.summary(elapsed),
+            'elapsed': round(elapsed, 2),
+            'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S")
+        },
+        'results': [r for _, r in results]
+    }
+
+
+def build_parser(description, concurrency=5, timeout=25, max_concurrency=16):
+    """프리셋 스크립트 공통 CLI 옵션"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--api-url', default=DEFAULT_API_URL, help='분석 API 주소')
+    parser.add_argument('--concurrency', type=int, default=concurrency, help='초기 동시 요청 수')
+    parser.add_argument('--max-concurrency', type=int, default=max_concurrency,
+                        help='적응형 동시성 상한 (--concurrency 와 같으면 고정)')
+    parser.add_argument('--rate', type=float, help='초당 최대 요청 수 (기본: 제한 없음)')
+    parser.add_argument('--target-p95', type=float, help='동시성 증가 조건 p95 지연(초, 기본: timeout/2)')
+    parser.add_argument('--max-error-rate', type=float, default=0.1, help='동시성 증가 조건 오류율')
+    parser.add_argument('--timeout', type=float, default=timeout, help='요청당 제한 시간(초)')
+    parser.add_argument('--session-id', default=os.environ.get('ANALYZER_SESSION_ID'),
+                        help='X-Session-ID 헤더 (기본: $ANALYZER_SESSION_ID)')
+    parser.add_argument('--output', help='결과 파일 경로')
+    parser.add_argument('--record', metavar='NDJSON', help='원본 응답을 녹화 (replay_server --recordings 입력)')
+    parser.add_argument('--registry', default=str(DEFAULT_REGISTRY), help='사이트 레지스트리 (JSON/CSV)')
+    parser.add_argument('--shard', help='i/N - 정규화 URL 해시 기준 N 개 중 i 번째 조각만 실행')
+    parser.add_argument('--cache', default=str(DEFAULT_CACHE_FILE), help='응답 캐시 SQLite 파일')
+    parser.add_argument('--no-cache', action='store_true', help='응답 캐시 사용 안 함')
+    parser.add_argument('--refresh', action='store_true', help='캐시를 무시하고 다시 분석 (결과는 캐시에 갱신)')
+    parser.add_argument('--cache-ttl', type=float, default=168, help='캐시 유효 시간(시간)')
+    parser.add_argument('--cache-max-mb', type=float, default=256, help='캐시 최대 크기(MB)')
+    parser.add_argument('--cache-html-digest', action='store_true',
+                        help='대상 페이지 HTML 해시를 캐시 키에 포함 (페이지가 바뀌면 재분석)')
+    parser.add_argument('--retries', type=int, default=2, help='재시도 가능한 실패의 최대 재시도 횟수')
+    parser.add_argument('--backoff', type=float, default=1.0, help='재시도 백오프 기본 대기(초)')
+    parser.add_argument('--retry-timeouts', action='store_true',
+                        help='타임아웃도 재시도 (기본: 타임아웃은 재시도하지 않음)')
+    parser.add_argument('--breaker-threshold', type=int, default=2,
+                        help='호스트 회로 차단까지의 연속 실패 횟수 (차단되면 같은 호스트의 다음 사이트는 요청하지 않음)')
+    parser.add_argument('--breaker-reset', type=float, default=60.0, help='회로 차단 유지 시간(초)')
+    parser.add_argument('--metrics', metavar='PROM',
+                        help='Prometheus 텍스트 파일 경로 (기본: 결과 파일과 같은 이름의 .prom)')
+    parser.add_argument('--resume', metavar='CHECKPOINT',
+                        help='중단된 실행의 체크포인트(.ndjson)를 이어서 실행 (성공한 URL 은 건너뜀)')
+    return parser
+
+
+def run_preset(preset, prefix, description, concurrency=5, timeout=25, argv=None):
+    """
+    프리셋 실행: 레지스트리에서 preset 사이트 선택 → 분석(체크포인트 기록) → 결과 파일 생성
+
+    결과는 validation_<prefix>_<timestamp>[_shard<i>of<N>].ndjson 에 한 건씩 추가되고,
+    끝나면 같은 이름의 .json({metadata, results})으로 정리된다.
+    단계별 지연 히스토그램은 metadata['latency'] 와 같은 이름의 .prom 파일로 내보낸다.
+    prefix 가 None 이면 결과 목록만 validation_results.json 에 저장 (analyze_batch 형식)
+
+    Returns:
+        (결과 파일 경로, metadata)
+    """
+    args = build_parser(description, concurrency, timeout).parse_args(argv)
+    sites = load_sites(preset, args.registry)
+
+    suffix = ''
+    if args.shard:
+        index, count = parse_shard(args.shard)
+        sites = shard(sites, index, count)
+        suffix = f"_shard{index}of{count}"
+
+    if args.resume:
+        checkpoint_file = Path(args.resume)
+    elif prefix is None:
+        checkpoint_file = BASE_DIR / f"validation_results{suffix}.ndjson"
+        checkpoint_file.unlink(missing_ok=True)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        checkpoint_file = BASE_DIR / f"validation_{prefix}_{timestamp}{suffix}.ndjson"
+
+    output_file = Path(args.output) if args.output else checkpoint_file.with_suffix('.json')
+    metrics_file = Path(args.metrics) if args.metrics else output_file.with_suffix('.prom')
+
+    done = completed_urls(checkpoint_file)
+    pending = [(idx, site) for idx, site in enumerate(sites, 1) if site['url'] not in done]
+
+    print("=" * 80)
+    print(f"🚀 {description}")
+    print(f"  총 사이트: {len(sites)}개 / 동시 요청: {args.concurrency}~{args.max_concurrency}개")
+    if args.shard:
+        print(f"  샤드: {args.shard}")
+    if done:
+        print(f"  이어하기: 완료 {len(sites) - len(pending)}개 건너뜀, 남은 {len(pending)}개")
+    print(f"  체크포인트: {checkpoint_file}")
+    print("=" * 80)
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache, ttl=args.cache_ttl * 3600,
+                              max_bytes=int(args.cache_max_mb * 1024 * 1024))
+
+    client = ValidationClient(
+        api_url=args.api_url,
+        concurrency=args.concurrency,
+        max_concurrency=args.max_concurrency,
+        timeout=args.timeout,
+        session_id=args.session_id,
+        rate=args.rate,
+        target_p95=args.target_p95,
+        max_error_rate=args.max_error_rate,
+        cache=cache,
+        refresh=args.refresh,
+        digest_html=args.cache_html_digest,
+        retry=RetryPolicy(max_attempts=args.retries + 1, base_delay=args.backoff,
+                          retry_timeouts=args.retry_timeouts),
+        breaker=CircuitBreaker(args.breaker_threshold, args.breaker_reset),
+        record=args.record
+    )
+
+    async def _run():
+        async with client:
+            await client.run(pending, checkpoint)
+
+    started = time.perf_counter()
+    with Checkpoint(checkpoint_file) as checkpoint:
+        checkpoint.start(len(sites), description=description)
+        try:
+            asyncio.run(_run())
+        except KeyboardInterrupt:
+            print(f"\n⚠️  중단됨 - 이어서 실행: --resume {checkpoint_file}")
+            raise
+        finally:
+            if cache is not None:
+                cache.close()
+    elapsed = time.perf_counter() - started
+
+    metadata = finalize(
+        checkpoint_file,
+        output_file,
+        metadata={
+            'concurrency': client.limiter.summary(),
+            'elapsed': round(elapsed, 2),
+            'retries': client.retries,
+            'circuit_opened': client.breaker.opened,
+            'latency': client.metrics.summary(elapsed),
+            'resumed': len(sites) - len(pending),
+            'shard': args.shard
+        },
+        layout='list' if prefix is None else 'document'
+    )
+    metrics_file.write_text(
+        client.metrics.prometheus({'preset': preset or 'all', 'shard': args.shard or '1/1'}),
+        encoding='utf-8'
+    )
+
+    total = metadata['total_sites'] or 1
+    print("\n" + "=" * 80)
+    print("🎉 분석 완료!")
+    print(f"  성공: {metadata['success']}개 ({metadata['success'] / total * 100:.1f}%)")
+    print(f"  실패: {metadata['failed']}개 ({metadata['failed'] / total * 100:.1f}%)")
+    for failure, count in metadata['failures'].items():
+        print(f"    - {failure}: {count}개")
+    print(f"  재시도: {metadata['retries']}회 / 회로 차단: {metadata['circuit_opened']}회")
+    print(f"  캐시: 적중 {metadata['cache_hits']}개 / 미적중 {metadata['cache_misses']}개")
+    print(f"  소요 시간: {metadata['elapsed']:.1f}초")
+    print(f"  동시성: 최종 {metadata['concurrency']['final']} / 최대 {metadata['concurrency']['peak']}")
+    overall = metadata['latency'].get('all')
+    if overall:
+        total_ms = {k: overall['total'][k] * 1000 for k in ('p50', 'p90', 'p99')}
+        print(f"  지연: p50 {total_ms['p50']:.0f}ms / p90 {total_ms['p90']:.0f}ms / p99 {total_ms['p99']:.0f}ms"
+              f" (TTFB p50 {overall['ttfb']['p50'] * 1000:.0f}ms) / 처리량 {overall['throughput']:.2f}개/초")
+    print(f"  메트릭: {metrics_file}")
+    print(f"  결과 파일: {output_file}")
+    print("=" * 80)
+
+    return output_file, metadata
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+중복 항목 / 검색 의존 항목 일관성 검사
+validation_*.json (목록·문서 형식) 과 체크포인트 NDJSON 을 스트리밍으로 읽어
+사이트-실행 단위 NumPy 배열에 쌓은 뒤 모든 항목 쌍을 한 번에 계산
+
+    중복 쌍      N1.1 ↔ N3.2, N5.1 ↔ N9.1, N5.3 ↔ N9.3  (차이, 일치율, 상관계수)
+    검색 의존    N6.1, N6.3, N7.1, N10.1              (평균, 동시 변동, 종합 점수와의 상관)
+    업종별 분포  위 지표를 category 별로
+
+    python -m validation.consistency                       # 저장소의 validation_*.json 전체
+    python -m validation.consistency a.json b.ndjson --json consistency.json
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+
+from validation.client import BASE_DIR, ITEM_FIELDS
+
+SCORE_COLUMNS = ['overall', 'convenience', 'design'] + list(ITEM_FIELDS)
+DUPLICATE_PAIRS = [('N1_1', 'N3_2'), ('N5_1', 'N9_1'), ('N5_3', 'N9_3')]
+SEARCH_ITEMS = ['N6_1', 'N6_3', 'N7_1', 'N10_1']
+UNKNOWN_CATEGORY = '미분류'
+
+_RESULTS_ARRAY = re.compile(r'"results"\s*:\s*\[')
+_NAME_CATEGORY = re.compile(r'\(([^()]+)\)\s*$')
+
+
+def _label(field):
+    return field.replace('_', '.')
+
+
+def iter_results(path, chunk_size=1 << 20):
+    """
+    결과 레코드를 하나씩 반환 (파일 전체를 메모리에 올리지 않음)
+
+    .ndjson: 체크포인트의 status 'ok' 레코드
+    .json  : 최상위 목록 또는 {"results": [...]} 의 원소를 raw_decode 로 순서대로 파싱
+    """
+    path = Path(path)
+    if path.suffix == '.ndjson':
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('status') == 'ok':
+                    yield record['result']
+        return
+
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buf = f.read(chunk_size)
+        eof = not buf
+
+        # 결과 배열 시작 위치 찾기
+        while True:
+            stripped = buf.lstrip()
+            if stripped.startswith('['):
+                pos = len(buf) - len(stripped) + 1
+                break
+            match = _RESULTS_ARRAY.search(buf)
+            if match:
+                pos = match.end()
+                break
+            if eof:
+                return
+            more = f.read(chunk_size)
+            eof = not more
+            buf += more
+
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            try:
+                if pos >= len(buf):
+                    raise ValueError
+                record, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise ValueError(f"결과 배열이 끝나지 않음: {path}")
+                more = f.read(chunk_size)
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+                continue
+            yield record
+            pos = end
+            if pos > chunk_size:
+                buf = buf[pos:]
+                pos = 0
+
+
+def result_category(record):
+    """결과 레코드의 업종 (이전 목록 형식은 이름 끝 괄호: "KASA (공공기관)")"""
+    if record.get('category'):
+        return record['category']
+    match = _NAME_CATEGORY.search(record.get('name', ''))
+    return match.group(1) if match else UNKNOWN_CATEGORY
+
+
+class ScoreTable:
+    """
+    사이트-실행 단위 점수 배열
+
+    scores     float32 [행, SCORE_COLUMNS] (누락 값은 NaN)
+    category   int32 [행] → categories[code]
+    source     int32 [행] → sources[code]
+    """
+
+    def __init__(self, capacity=1024):
+        self.scores = np.full((capacity, len(SCORE_COLUMNS)), np.nan, dtype=np.float32)
+        self.category = np.zeros(capacity, dtype=np.int32)
+        self.source = np.zeros(capacity, dtype=np.int32)
+        self.categories = []
+        self.sources = []
+        self.size = 0
+        self._category_codes = {}
+
+    def _grow(self):
+        capacity = len(self.scores) * 2
+        scores = np.full((capacity, len(SCORE_COLUMNS)), np.nan, dtype=np.float32)
+        scores[:self.size] = self.scores[:self.size]
+        self.scores = scores
+        self.category = np.resize(self.category, capacity)
+        self.source = np.resize(self.source, capacity)
+
+    def _category_code(self, record):
+        category = result_category(record)
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def add_file(self, path):
+        source = len(self.sources)
+        self.sources.append(str(path))
+        for record in iter_results(path):
+            if self.size == len(self.scores):
+                self._grow()
+            row = self.scores[self.size]
+            for col, field in enumerate(SCORE_COLUMNS):
+                value = record.get(field)
+                if value is not None:
+                    row[col] = value
+            self.category[self.size] = self._category_code(record)
+            self.source[self.size] = source
+            self.size += 1
+
+    def column(self, field):
+        return self.scores[:self.size, SCORE_COLUMNS.index(field)]
+
+    def columns(self, fields):
+        return self.scores[:self.size][:, [SCORE_COLUMNS.index(f) for f in fields]].astype(np.float64)
+
+
+def load_scores(paths):
+    table = ScoreTable()
+    for path in paths:
+        table.add_file(path)
+    return table
+
+
+def _pair_correlation(a, b):
+    """열별 피어슨 상관계수 (a, b: [행, k], 둘 다 유효한 행만, 분산 0 이면 None)"""
+    valid = ~(np.isnan(a) | np.isnan(b))
+    n = valid.sum(axis=0)
+    a = np.where(valid, a, 0.0)
+    b = np.where(valid, b, 0.0)
+    safe_n = np.maximum(n, 1)
+    mean_a = a.sum(axis=0) / safe_n
+    mean_b = b.sum(axis=0) / safe_n
+    da = np.where(valid, a - mean_a, 0.0)
+    db = np.where(valid, b - mean_b, 0.0)
+    denom = np.sqrt((da ** 2).sum(axis=0) * (db ** 2).sum(axis=0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = (da * db).sum(axis=0) / denom
+    return [round(float(x), 4) if n_i > 1 and d > 0 else None for x, n_i, d in zip(r, n, denom)]
+
+
+def _per_category(codes, valid, values, n_categories):
+    """category 별 (유효 개수, values 합계) - values/valid: [행, k]"""
+    counts = np.stack([np.bincount(codes, weights=valid[:, k], minlength=n_categories)
+                       for k in range(valid.shape[1])], axis=1)
+    sums = np.stack([np.bincount(codes, weights=np.where(valid[:, k], values[:, k], 0.0), minlength=n_categories)
+                     for k in range(valid.shape[1])], axis=1)
+    return counts, sums
+
+
+def check(table):
+    """일관성 지표 계산 → JSON 직렬화 가능한 dict"""
+    n_categories = len(table.categories)
+    codes = table.category[:table.size]
+
+    # 중복 쌍: [행, 쌍] 배열로 한 번에
+    left = table.columns([a for a, _ in DUPLICATE_PAIRS])
+    right = table.columns([b for _, b in DUPLICATE_PAIRS])
+    diff = left - right
+    valid = ~np.isnan(diff)
+    absdiff = np.abs(np.where(valid, diff, 0.0))
+    matched = valid & (absdiff == 0)
+
+    n = valid.sum(axis=0)
+    safe_n = np.maximum(n, 1)
+    correlation = _pair_correlation(left, right)
+    pairs = []
+    for k, (a, b) in enumerate(DUPLICATE_PAIRS):
+        pairs.append({
+            'pair': f"{_label(a)}-{_label(b)}",
+            'n': int(n[k]),
+            'match_rate': round(float(matched[:, k].sum() / safe_n[k]), 4),
+            'mismatches': int(n[k] - matched[:, k].sum()),
+            'mean_abs_diff': round(float(absdiff[:, k].sum() / safe_n[k]), 4),
+            'max_abs_diff': float(absdiff[:, k].max()) if n[k] else None,
+            'mean_diff': round(float(np.where(valid[:, k], diff[:, k], 0.0).sum() / safe_n[k]), 4),
+            'correlation': correlation[k]
+        })
+
+    # 검색 의존 항목
+    search = table.columns(SEARCH_ITEMS)
+    search_valid = ~np.isnan(search)
+    overall = table.columns(['overall'])
+    complete = search_valid.all(axis=1)
+    # 검색 기능 하나로 같이 움직이는 항목(N6.1, N7.1, N10.1)이 모두 같은 값인 비율
+    linked = search[complete][:, [0, 2, 3]]
+    comoving = float((linked == linked[:, :1]).all(axis=1).mean()) if complete.any() else None
+
+    search_n = search_valid.sum(axis=0)
+    search_means = np.where(search_valid, search, 0.0).sum(axis=0) / np.maximum(search_n, 1)
+    overall_corr = _pair_correlation(search, np.repeat(overall, len(SEARCH_ITEMS), axis=1))
+
+    corr_matrix = []
+    for i in range(len(SEARCH_ITEMS)):
+        row = _pair_correlation(np.repeat(search[:, i:i + 1], len(SEARCH_ITEMS), axis=1), search)
+        corr_matrix.append(row)
+
+    search_items = [{
+        'item': _label(item),
+        'n': int(search_n[k]),
+        'mean': round(float(search_means[k]), 4) if search_n[k] else None,
+        'overall_correlation': overall_corr[k]
+    } for k, item in enumerate(SEARCH_ITEMS)]
+
+    # 업종별 분포
+    pair_counts, match_sums = _per_category(codes, valid, matched.astype(np.float64), n_categories)
+    _, absdiff_sums = _per_category(codes, valid, absdiff, n_categories)
+    search_counts, search_sums = _per_category(codes, search_valid, search, n_categories)
+    rows_per_category = np.bincount(codes, minlength=n_categories)
+
+    categories = {}
+    for c, name in enumerate(table.categories):
+        pc = np.maximum(pair_counts[c], 1)
+        sc = np.maximum(search_counts[c], 1)
+        categories[name] = {
+            'n': int(rows_per_category[c]),
+            'match_rate': {pair['pair']: round(float(match_sums[c, k] / pc[k]), 4)
+                           for k, pair in enumerate(pairs)},
+            'mean_abs_diff': {pair['pair']: round(float(absdiff_sums[c, k] / pc[k]), 4)
+                              for k, pair in enumerate(pairs)},
+            'search_means': {_label(item): round(float(search_sums[c, k] / sc[k]), 4)
+                             for k, item in enumerate(SEARCH_ITEMS)}
+        }
+
+    return {
+        'rows': table.size,
+        'files': table.sources,
+        'duplicate_pairs': pairs,
+        'search_dependency': {
+            'items': search_items,
+            'correlation_matrix': {
+                'items': [_label(i) for i in SEARCH_ITEMS],
+                'values': corr_matrix
+            },
+            'comoving_rate': round(comoving, 4) if comoving is not None else None
+        },
+        'categories': categories
+    }
+
+
+def print_summary(report):
+    """요약 표 출력"""
+    print("\n" + "=" * 80)
+    print(f"🔍 중복 항목 일관성 검사 (사이트-실행 {report['rows']}건, 파일 {len(report['files'])}개)")
+    print("=" * 80)
+    print(f"{'항목 쌍':<12}{'표본':>6}{'일치율':>9}{'불일치':>7}{'평균차':>8}{'최대차':>7}{'상관':>8}")
+    for p in report['duplicate_pairs']:
+        corr = f"{p['correlation']:.3f}" if p['correlation'] is not None else '-'
+        max_diff = f"{p['max_abs_diff']:.1f}" if p['max_abs_diff'] is not None else '-'
+        print(f"{p['pair']:<12}{p['n']:>6}{p['match_rate'] * 100:>8.1f}%{p['mismatches']:>7}"
+              f"{p['mean_abs_diff']:>8.2f}{max_diff:>7}{corr:>8}")
+
+    search = report['search_dependency']
+    comoving = search['comoving_rate']
+    if comoving is not None:
+        print(f"\n📊 검색 의존 항목 (N6.1·N7.1·N10.1 동시 일치율: {comoving * 100:.1f}%)")
+    else:
+        print("\n📊 검색 의존 항목")
+    for item in search['items']:
+        mean = f"{item['mean']:.2f}" if item['mean'] is not None else '-'
+        corr = f"{item['overall_correlation']:.3f}" if item['overall_correlation'] is not None else '-'
+        print(f"  {item['item']:<6} 평균 {mean:>5} / 종합 점수 상관 {corr}")
+
+    print("\n📂 업종별")
+    pair_names = [p['pair'] for p in report['duplicate_pairs']]
+    print(f"  {'업종':<8}{'표본':>5}  " + '  '.join(f"{name:>9}" for name in pair_names) + "  검색항목 평균")
+    for name, c in sorted(report['categories'].items(), key=lambda x: -x[1]['n']):
+        rates = '  '.join(f"{c['match_rate'][p] * 100:>8.1f}%" for p in pair_names)
+        search_mean = np.mean(list(c['search_means'].values()))
+        print(f"  {name:<8}{c['n']:>5}  {rates}  {search_mean:.2f}")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='중복 항목 일관성 검사')
+    parser.add_argument('files', nargs='*', help='validation_*.json / 체크포인트 .ndjson (기본: 저장소의 validation_*.json)')
+    parser.add_argument('--json', metavar='OUTPUT', help='전체 지표를 JSON 으로 저장')
+    args = parser.parse_args()
+
+    files = args.files or sorted(str(p) for p in BASE_DIR.glob('validation_*.json'))
+    report = check(load_scores(files))
+    print_summary(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 {args.json}")
+
+
+if __name__ == '__main__':
+    main()
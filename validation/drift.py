@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검증 스냅샷 간 점수 변화(drift) 탐지
+validation_*.json 스냅샷을 시간 순서로 누적하면서, 새 스냅샷마다
+정규화 URL 해시 인덱스로 직전 점수와 조인해 항목별 변화량을 한 번에 계산
+
+- 상태 파일(.validation_drift.json)에 URL 별 최신 점수와 처리한 스냅샷을 저장하므로
+  매번 새로 추가된 스냅샷만 읽는다 (같은 경로라도 내용이 바뀌면 새 스냅샷)
+- 처리한 파일의 (크기, 수정 시각)도 저장 → 그대로인 파일은 열지 않고 건너뛰고,
+  새 파일·바뀐 파일만 해시를 계산해 다이제스트로 중복 확인
+- 항목별 / 업종×항목별 대응표본 t 검정, p < alpha 이고 평균 변화가 min_delta 이상이면 drift
+
+    python -m validation.drift                       # 저장소의 validation_*.json 중 새 스냅샷
+    python -m validation.drift validation_large_scale_20260205_101500.json --alpha 0.01
+    python -m validation.drift --reset               # 상태 초기화 후 전체 재계산
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from validation.client import BASE_DIR
+from validation.consistency import SCORE_COLUMNS, iter_results, result_category
+from validation.registry import normalize_url
+
+DEFAULT_STATE_FILE = BASE_DIR / '.validation_drift.json'
+
+_FILE_TIMESTAMP = re.compile(r'(\d{8}_\d{6})')
+
+
+def _betacf(a, b, x):
+    """불완전 베타 함수 연분수 전개 (Numerical Recipes betacf)"""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > 1e-300 else 1e-300)
+    h = d
+    for m in range(1, 201):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > 1e-300 else 1e-300)
+        c = 1.0 + aa / c
+        c = c if abs(c) > 1e-300 else 1e-300
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > 1e-300 else 1e-300)
+        c = 1.0 + aa / c
+        c = c if abs(c) > 1e-300 else 1e-300
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a, b, x):
+    """정규화 불완전 베타 함수 I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1.0 - x))
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def t_test_pvalue(t, df):
+    """양측 t 검정 p 값"""
+    if math.isinf(t):
+        return 0.0
+    return _betainc(df / 2.0, 0.5, df / (df + t * t))
+
+
+def paired_t(n, total, total_sq):
+    """
+    대응표본 t 검정 (변화량의 개수·합·제곱합에서)
+
+    Returns:
+        (평균 변화, 표준편차, t, p) - 표본 2개 미만이면 None
+    """
+    if n < 2:
+        return None
+    mean = total / n
+    var = max(0.0, (total_sq - n * mean * mean) / (n - 1))
+    sd = math.sqrt(var)
+    if sd < 1e-12:
+        # 모든 사이트가 같은 양만큼 변함: 0 이면 변화 없음, 아니면 확정적 변화
+        t = 0.0 if abs(mean) < 1e-12 else math.copysign(math.inf, mean)
+    else:
+        t = mean / (sd / math.sqrt(n))
+    return mean, sd, t, t_test_pvalue(t, n - 1)
+
+
+def snapshot_timestamp(path):
+    """파일명의 YYYYMMDD_HHMMSS, 없으면 수정 시각"""
+    match = _FILE_TIMESTAMP.search(Path(path).name)
+    if match:
+        return match.group(1)
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y%m%d_%H%M%S")
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_stat(path):
+    """(크기, 수정 시각 ns) - 이미 처리한 파일인지 해시 없이 확인"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def read_snapshot(path):
+    """
+    스냅샷 → (정규화 URL 목록, 업종 목록, float64 점수 배열 [사이트, SCORE_COLUMNS])
+    같은 URL 이 여러 번 있으면 마지막 결과만 사용 (URL 하나 = 행 하나)
+    """
+    rows_by_key = {}
+    for record in iter_results(path):
+        key = normalize_url(record['url'])
+        rows_by_key.pop(key, None)
+        rows_by_key[key] = (result_category(record),
+                            [np.nan if record.get(f) is None else record[f] for f in SCORE_COLUMNS])
+    keys = list(rows_by_key)
+    categories = [category for category, _ in rows_by_key.values()]
+    rows = [row for _, row in rows_by_key.values()]
+    scores = np.array(rows, dtype=np.float64).reshape(len(rows), len(SCORE_COLUMNS))
+    return keys, categories, scores
+
+
+class DriftTracker:
+    """
+    URL 별 최신 점수 상태 + 스냅샷 단위 drift 계산
+
+    index     정규화 URL → latest 행 번호 (해시 인덱스)
+    latest    float64 [사이트, SCORE_COLUMNS]
+    snapshots 처리한 스냅샷 요약 (파일, 다이제스트, 시각, 결과)
+    digests   처리한 스냅샷 다이제스트 집합
+    seen      파일 절대 경로 → [크기, 수정 시각 ns] (처리했거나 이미 처리한 내용으로 확인한 파일)
+    """
+
+    def __init__(self, alpha=0.05, min_delta=0.1, min_samples=3):
+        self.alpha = alpha
+        self.min_delta = min_delta
+        self.min_samples = min_samples
+        self.index = {}
+        self.categories = []
+        self.latest = np.empty((0, len(SCORE_COLUMNS)), dtype=np.float64)
+        self.snapshots = []
+        self.digests = set()
+        self.seen = {}
+
+    @classmethod
+    def load(cls, path, **options):
+        tracker = cls(**options)
+        if Path(path).exists():
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('columns') == SCORE_COLUMNS:
+                tracker.index = {key: i for i, key in enumerate(state['urls'])}
+                tracker.categories = state['categories']
+                tracker.latest = np.array(
+                    [[np.nan if v is None else v for v in row] for row in state['latest']],
+                    dtype=np.float64
+                ).reshape(len(state['urls']), len(SCORE_COLUMNS))
+                tracker.snapshots = state['snapshots']
+                tracker.digests = {snapshot['digest'] for snapshot in tracker.snapshots}
+                tracker.seen = state.get('seen', {})
+        return tracker
+
+    def save(self, path):
+        urls = [None] * len(self.index)
+        for key, i in self.index.items():
+            urls[i] = key
+        state = {
+            'columns': SCORE_COLUMNS,
+            'urls': urls,
+            'categories': self.categories,
+            'latest': [[None if math.isnan(v) else v for v in row] for row in self.latest.tolist()],
+            'snapshots': self.snapshots,
+            'seen': self.seen
+        }
+        tmp = Path(f"{path}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def is_seen(self, path):
+        """크기·수정 시각이 지난번과 같은 파일이면 True (해시 계산 없음)"""
+        return self.seen.get(os.path.abspath(path)) == file_stat(path)
+
+    def mark_seen(self, path):
+        self.seen[os.path.abspath(path)] = file_stat(path)
+
+    def is_processed(self, digest):
+        return digest in self.digests
+
+    def _drift(self, n, total, total_sq):
+        test = paired_t(n, total, total_sq)
+        if test is None:
+            return {'n': int(n)}
+        mean, sd, t, p = test
+        return {
+            'n': int(n),
+            'mean_delta': round(mean, 4),
+            'sd': round(sd, 4),
+            't': None if math.isinf(t) else round(t, 3),
+            'p': round(p, 6),
+            'drift': bool(n >= self.min_samples and p < self.alpha and abs(mean) >= self.min_delta)
+        }
+
+    def add(self, path, digest=None):
+        """새 스냅샷 처리 → drift 보고서 (상태는 새 점수로 갱신)"""
+        digest = digest or file_digest(path)
+        keys, categories, scores = read_snapshot(path)
+
+        # 해시 인덱스 조인: 이전 점수가 있는 행만 비교
+        prev_rows = np.array([self.index.get(key, -1) for key in keys], dtype=np.int64)
+        matched = prev_rows >= 0
+        current = scores[matched]
+        previous = self.latest[prev_rows[matched]]
+        delta = current - previous
+        valid = ~np.isnan(delta)
+        delta0 = np.where(valid, delta, 0.0)
+
+        n = valid.sum(axis=0)
+        totals = delta0.sum(axis=0)
+        squares = (delta0 ** 2).sum(axis=0)
+        changed = (valid & (delta0 != 0)).sum(axis=0)
+
+        items = {}
+        for k, field in enumerate(SCORE_COLUMNS):
+            items[field] = {**self._drift(n[k], totals[k], squares[k]), 'changed': int(changed[k])}
+
+        # 업종 × 항목: bincount 로 개수·합·제곱합을 한 번에
+        matched_categories = [c for c, m in zip(categories, matched) if m]
+        names = sorted(set(matched_categories))
+        codes = np.array([names.index(c) for c in matched_categories], dtype=np.int64)
+        by_category = {}
+        if names:
+            cat_n = np.stack([np.bincount(codes, weights=valid[:, k], minlength=len(names))
+                              for k in range(len(SCORE_COLUMNS))], axis=1)
+            cat_sum = np.stack([np.bincount(codes, weights=delta0[:, k], minlength=len(names))
+                                for k in range(len(SCORE_COLUMNS))], axis=1)
+            cat_sq = np.stack([np.bincount(codes, weights=delta0[:, k] ** 2, minlength=len(names))
+                               for k in range(len(SCORE_COLUMNS))], axis=1)
+            for c, name in enumerate(names):
+                flagged = {}
+                for k, field in enumerate(SCORE_COLUMNS):
+                    result = self._drift(cat_n[c, k], cat_sum[c, k], cat_sq[c, k])
+                    if result.get('drift'):
+                        flagged[field] = result
+                by_category[name] = {'n': int((codes == c).sum()), 'drift': flagged}
+
+        # 상태 갱신 (새 URL 은 행 추가, 기존 URL 은 최신 점수로 덮어씀)
+        new_keys = [key for key, m in zip(keys, matched) if not m]
+        if new_keys:
+            start = len(self.index)
+            for offset, key in enumerate(new_keys):
+                self.index[key] = start + offset
+            self.latest = np.vstack([self.latest, scores[~matched]])
+            self.categories.extend(c for c, m in zip(categories, matched) if not m)
+        self.latest[prev_rows[matched]] = np.where(np.isnan(current), previous, current)
+
+        report = {
+            'file': str(path),
+            'digest': digest,
+            'timestamp': snapshot_timestamp(path),
+            'sites': len(keys),
+            'matched': int(matched.sum()),
+            'new': len(new_keys),
+            'items': items,
+            'categories': by_category,
+            'drift_items': [f for f, r in items.items() if r.get('drift')]
+        }
+        self.snapshots.append({k: report[k] for k in ('file', 'digest', 'timestamp', 'sites',
+                                                       'matched', 'new', 'drift_items')})
+        self.digests.add(digest)
+        self.mark_seen(path)
+        return report
+
+
+def print_report(report):
+    print(f"\n📸 {Path(report['file']).name} ({report['timestamp']})")
+    print(f"   사이트 {report['sites']}개 / 이전 점수와 매칭 {report['matched']}개 / 신규 {report['new']}개")
+    if not report['matched']:
+        return
+
+    print(f"   {'항목':<12}{'표본':>5}{'변경':>5}{'평균변화':>9}{'t':>8}{'p':>10}")
+    for field, r in report['items'].items():
+        if 'mean_delta' not in r:
+            continue
+        t = f"{r['t']:.2f}" if r['t'] is not None else 'inf'
+        flag = ' ⚠️' if r['drift'] else ''
+        print(f"   {field:<12}{r['n']:>5}{r['changed']:>5}{r['mean_delta']:>+9.3f}{t:>8}{r['p']:>10.4f}{flag}")
+
+    for name, c in report['categories'].items():
+        for field, r in c['drift'].items():
+            print(f"   ⚠️  {name}: {field} {r['mean_delta']:+.3f} (n={r['n']}, p={r['p']:.4f})")
+    if not report['drift_items']:
+        print("   ✅ 유의한 drift 없음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검증 스냅샷 점수 drift 탐지')
+    parser.add_argument('files', nargs='*', help='validation_*.json 스냅샷 (기본: 저장소의 validation_*.json)')
+    parser.add_argument('--state', default=str(DEFAULT_STATE_FILE), help='누적 상태 파일')
+    parser.add_argument('--reset', action='store_true', help='상태를 지우고 처음부터 계산')
+    parser.add_argument('--alpha', type=float, default=0.05, help='유의 수준')
+    parser.add_argument('--min-delta', type=float, default=0.1, help='drift 로 볼 최소 평균 변화')
+    parser.add_argument('--json', metavar='OUTPUT', help='이번에 처리한 스냅샷 보고서를 JSON 으로 저장')
+    args = parser.parse_args()
+
+    if args.reset:
+        Path(args.state).unlink(missing_ok=True)
+    tracker = DriftTracker.load(args.state, alpha=args.alpha, min_delta=args.min_delta)
+
+    files = args.files or [str(p) for p in BASE_DIR.glob('validation_*.json')]
+    files = sorted(files, key=snapshot_timestamp)
+
+    reports = []
+    restamped = False
+    for path in files:
+        # 크기·수정 시각이 그대로면 이미 처리한 파일 → 읽지 않음
+        if tracker.is_seen(path):
+            continue
+        digest = file_digest(path)
+        if tracker.is_processed(digest):
+            # 내용은 같고 경로·수정 시각만 바뀐 파일: 다음부터는 해시 없이 건너뜀
+            tracker.mark_seen(path)
+            restamped = True
+            continue
+        report = tracker.add(path, digest)
+        print_report(report)
+        reports.append(report)
+
+    if not reports:
+        if restamped:
+            tracker.save(args.state)
+        print(f"✅ 새 스냅샷 없음 (처리된 스냅샷 {len(tracker.snapshots)}개)")
+        return
+
+    tracker.save(args.state)
+    print(f"\n💾 상태 저장: {args.state} (사이트 {len(tracker.index)}개, 스냅샷 {len(tracker.snapshots)}개)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 {args.json}")
+
+
+if __name__ == '__main__':
+    main()
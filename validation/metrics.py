@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검증 실행 지연 시간 측정
+- aiohttp TraceConfig 로 요청 단계별 시간 측정
+    acquire  커넥션 획득 (풀 대기 + 신규 연결)
+    send     요청 전송
+    ttfb     전송 완료 → 응답 헤더 수신 (분석기 처리 시간)
+    download 본문 수신
+    decode   JSON 파싱
+- HDR 방식(로그-선형 버킷) 히스토그램을 전체 / category / size 별로 집계
+- 실행 결과 JSON 메타데이터와 Prometheus 텍스트 형식으로 내보내기
+"""
+
+import time
+
+import aiohttp
+
+PHASES = ['acquire', 'send', 'ttfb', 'download', 'decode', 'total']
+
+# Prometheus 히스토그램 버킷 경계(초)
+PROMETHEUS_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15, 20, 30, 60]
+
+
+class LatencyHistogram:
+    """
+    HDR 방식 히스토그램 (마이크로초 정수, 상대 오차 약 1/2^(sub_bits-1))
+
+    값 v 의 버킷 = 상위 sub_bits 비트만 남긴 하한값. 버킷은 값 범위에 대해 로그 개수만큼만 생긴다.
+    """
+
+    def __init__(self, sub_bits=8):
+        self.sub_bits = sub_bits
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _bucket(self, value):
+        shift = max(0, value.bit_length() - self.sub_bits)
+        return (value >> shift) << shift, 1 << shift
+
+    def record(self, seconds):
+        value = max(0, int(seconds * 1_000_000))
+        lower, _ = self._bucket(value)
+        self.buckets[lower] = self.buckets.get(lower, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        for lower, n in other.buckets.items():
+            self.buckets[lower] = self.buckets.get(lower, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, p):
+        """p 백분위 값(초), 버킷 중간값 기준"""
+        if not self.count:
+            return None
+        rank = max(1, int(round(p / 100 * self.count)))
+        seen = 0
+        for lower in sorted(self.buckets):
+            seen += self.buckets[lower]
+            if seen >= rank:
+                _, width = self._bucket(lower)
+                return min(self.max, lower + width // 2) / 1_000_000
+        return self.max / 1_000_000
+
+    def cumulative(self, bounds):
+        """Prometheus 용 누적 버킷 [(경계(초), 누적 개수)] - 버킷 상한이 경계 이하인 값만 포함"""
+        ordered = sorted(self.buckets.items())
+        result = []
+        seen = 0
+        i = 0
+        for bound in bounds:
+            limit = bound * 1_000_000
+            while i < len(ordered):
+                lower, n = ordered[i]
+                _, width = self._bucket(lower)
+                if lower + width - 1 > limit:
+                    break
+                seen += n
+                i += 1
+            result.append((bound, seen))
+        return result
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count / 1_000_000, 4),
+            'min': round(self.min / 1_000_000, 4),
+            'p50': round(self.percentile(50), 4),
+            'p90': round(self.percentile(90), 4),
+            'p99': round(self.percentile(99), 4),
+            'max': round(self.max / 1_000_000, 4)
+        }
+
+
+def make_trace_config():
+    """요청별 trace_request_ctx(dict)에 단계 시각을 기록하는 TraceConfig"""
+    trace = aiohttp.TraceConfig()
+
+    def stamp(name):
+        async def handler(session, ctx, params):
+            if ctx.trace_request_ctx is not None:
+                ctx.trace_request_ctx[name] = time.perf_counter()
+        return handler
+
+    trace.on_request_start.append(stamp('start'))
+    trace.on_connection_reuseconn.append(stamp('connected'))
+    trace.on_connection_create_end.append(stamp('connected'))
+    trace.on_request_headers_sent.append(stamp('sent'))
+    trace.on_request_chunk_sent.append(stamp('sent'))
+    trace.on_request_end.append(stamp('headers'))
+    return trace
+
+
+def phase_durations(stamps, body_done, decoded):
+    """trace 시각 + 본문 수신/파싱 완료 시각 → 단계별 소요 시간(초)"""
+    start = stamps['start']
+    connected = stamps.get('connected', start)
+    sent = stamps.get('sent', connected)
+    headers = stamps.get('headers', sent)
+    return {
+        'acquire': connected - start,
+        'send': sent - connected,
+        'ttfb': headers - sent,
+        'download': body_done - headers,
+        'decode': decoded - body_done,
+        'total': decoded - start
+    }
+
+
+class RunMetrics:
+    """전체 / category / size 그룹별 단계 히스토그램"""
+
+    def __init__(self):
+        self.groups = {}
+        self.started = time.perf_counter()
+
+    def _histograms(self, group):
+        if group not in self.groups:
+            self.groups[group] = {phase: LatencyHistogram() for phase in PHASES}
+        return self.groups[group]
+
+    def record(self, site, phases):
+        groups = ['all']
+        if site.get('category'):
+            groups.append(f"category:{site['category']}")
+        if site.get('size'):
+            groups.append(f"size:{site['size']}")
+
+        for group in groups:
+            histograms = self._histograms(group)
+            for phase, seconds in phases.items():
+                histograms[phase].record(seconds)
+
+    def summary(self, elapsed=None):
+        elapsed = elapsed or (time.perf_counter() - self.started)
+        report = {}
+        for group, histograms in self.groups.items():
+            completed = histograms['total'].count
+            report[group] = {
+                'throughput': round(completed / elapsed, 3) if elapsed else None,
+                **{phase: h.summary() for phase, h in histograms.items()}
+            }
+        return report
+
+    def prometheus(self, labels=None):
+        """Prometheus 텍스트 노출 형식"""
+        base = dict(labels or {})
+        lines = [
+            '# HELP validation_request_phase_seconds /api/analyze request phase latency',
+            '# TYPE validation_request_phase_seconds histogram'
+        ]
+
+        def fmt(extra):
+            items = {**base, **extra}
+            return ','.join(f'{k}="{v}"' for k, v in items.items())
+
+        for group, histograms in self.groups.items():
+            kind, _, value = group.partition(':')
+            group_labels = {'group': kind} if not value else {'group': kind, kind: value}
+            for phase, h in histograms.items():
+                if not h.count:
+                    continue
+                label = {**group_labels, 'phase': phase}
+                for bound, n in h.cumulative(PROMETHEUS_BUCKETS):
+                    lines.append(f'validation_request_phase_seconds_bucket{{{fmt({**label, "le": bound})}}} {n}')
+                lines.append(f'validation_request_phase_seconds_bucket{{{fmt({**label, "le": "+Inf"})}}} {h.count}')
+                lines.append(f'validation_request_phase_seconds_sum{{{fmt(label)}}} {h.total / 1_000_000:.6f}')
+                lines.append(f'validation_request_phase_seconds_count{{{fmt(label)}}} {h.count}')
+
+        elapsed = time.perf_counter() - self.started
+        lines.append('# HELP validation_throughput_sites_per_second completed analyses per second')
+        lines.append('# TYPE validation_throughput_sites_per_second gauge')
+        for group, histograms in self.groups.items():
+            kind, _, value = group.partition(':')
+            group_labels = {'group': kind} if not value else {'group': kind, kind: value}
+            rate = histograms['total'].count / elapsed if elapsed else 0
+            lines.append(f'validation_throughput_sites_per_second{{{fmt(group_labels)}}} {rate:.4f}')
+
+        return '\n'.join(lines) + '\n'
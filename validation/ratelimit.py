@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 및 적응형 동시성 제어
+- TokenBucket: 초당 요청 수 상한 (버스트 허용)
+- AdaptiveConcurrency: AIMD 방식으로 동시 요청 수를 자동 조절
+  p95 지연 시간과 오류율이 목표 이하이면 가산 증가, 타임아웃/429/5xx 발생 시 절반으로 감소
+"""
+
+import asyncio
+import time
+from collections import deque
+
+import numpy as np
+
+
+class TokenBucket:
+    """초당 rate 개 토큰을 채우는 버킷 (rate 가 None 이면 제한 없음)"""
+
+    def __init__(self, rate=None, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD 동시성 제한기
+
+    acquire() 로 슬롯을 얻고, 요청이 끝나면 release() 에 지연 시간과 결과를 알려준다.
+    outcome: 'ok' (정상), 'error' (일반 실패), 'overload' (타임아웃, HTTP 429, 5xx)
+    maximum == initial 이면 증가 없이 고정 상한으로 동작한다.
+    """
+
+    def __init__(self, initial=5, minimum=1, maximum=None, target_p95=10.0,
+                 max_error_rate=0.1, window=20):
+        self.minimum = max(1, minimum)
+        self.maximum = max(initial, maximum or initial)
+        self.initial = min(max(initial, self.minimum), self.maximum)
+        self.limit = float(self.initial)
+        self.target_p95 = target_p95
+        self.max_error_rate = max_error_rate
+
+        self._latencies = deque(maxlen=window)
+        self._outcomes = deque(maxlen=window)
+        self._inflight = 0
+        self._epoch = 0
+        self._cond = asyncio.Condition()
+
+        self.peak = int(self.limit)
+        self.decreases = 0
+
+    @property
+    def current(self):
+        return int(self.limit)
+
+    async def acquire(self):
+        """슬롯 획득, (획득 시점의 동시성, epoch) 토큰 반환"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._inflight < int(self.limit))
+            self._inflight += 1
+            return int(self.limit), self._epoch
+
+    async def release(self, token, latency, outcome):
+        async with self._cond:
+            self._inflight -= 1
+            _, epoch = token
+
+            if outcome == 'overload':
+                # 감소 이전에 출발한 요청들의 실패로 연속 반감되지 않도록 epoch 당 한 번만 감소
+                if epoch == self._epoch:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self._epoch += 1
+                    self.decreases += 1
+                    self._latencies.clear()
+                    self._outcomes.clear()
+            else:
+                self._latencies.append(latency)
+                self._outcomes.append(outcome == 'ok')
+
+                if self._within_target():
+                    # 동시성 만큼 완료될 때마다 +1 (가산 증가)
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                    self.peak = max(self.peak, int(self.limit))
+
+            self._cond.notify_all()
+
+    def _within_target(self):
+        if len(self._latencies) < min(5, self._latencies.maxlen):
+            return False
+        p95 = float(np.percentile(self._latencies, 95))
+        error_rate = 1 - sum(self._outcomes) / len(self._outcomes)
+        return p95 <= self.target_p95 and error_rate <= self.max_error_rate
+
+    def summary(self):
+        return {
+            'initial': self.initial,
+            'final': int(self.limit),
+            'peak': self.peak,
+            'min': self.minimum,
+            'max': self.maximum,
+            'decreases': self.decreases
+        }
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검증 대상 사이트 레지스트리와 샤드 실행 지원
+- validation/sites.json (또는 같은 컬럼의 CSV) 하나에서 프리셋별 사이트 목록을 선택
+- URL 정규화로 중복 제거
+- --shard i/N: 정규화 URL 해시로 사이트를 N 개 조각에 고정 배정 (여러 프로세스·머신 분산)
+- merge: 샤드별 결과 문서를 하나의 검증 문서로 합침
+
+    python -m validation.registry list large_scale --shard 1/4
+    python -m validation.registry merge validation_large_scale_merged.json shard1.json shard2.json ...
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+DEFAULT_REGISTRY = Path(__file__).resolve().parent / 'sites.json'
+
+
+def normalize_url(url):
+    """스킴·www·대소문자·끝 슬래시 차이를 무시한 비교용 키"""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    return host + parts.path.rstrip('/').lower()
+
+
+def load_registry(path=DEFAULT_REGISTRY):
+    """
+    레지스트리 로드 (정규화 URL 기준 중복 제거, 먼저 나온 항목 우선)
+
+    JSON: [{"url", "name", "category", "size", "sets": [...]}, ...]
+    CSV : url,name,category,size,sets  (sets 는 '|' 구분)
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            rows = [
+                {**row, 'sets': [s for s in (row.get('sets') or '').split('|') if s]}
+                for row in csv.DictReader(f)
+            ]
+    else:
+        with open(path, encoding='utf-8') as f:
+            rows = json.load(f)
+
+    sites = {}
+    for row in rows:
+        key = normalize_url(row['url'])
+        if key in sites:
+            merged = sites[key]['sets']
+            merged.extend(s for s in row.get('sets', []) if s not in merged)
+            continue
+        sites[key] = {
+            'url': row['url'],
+            'name': row['name'],
+            'category': row.get('category') or None,
+            'size': row.get('size') or None,
+            'sets': list(row.get('sets', []))
+        }
+
+    return list(sites.values())
+
+
+def select(sites, preset=None):
+    """프리셋(sets)에 속한 사이트만 (None 이면 전체)"""
+    if preset is None:
+        return list(sites)
+    return [s for s in sites if preset in s['sets']]
+
+
+def parse_shard(spec):
+    """'2/4' → (2, 4), 1부터 시작"""
+    index, count = (int(x) for x in spec.split('/'))
+    if not 1 <= index <= count:
+        raise ValueError(f"잘못된 샤드 지정: {spec}")
+    return index, count
+
+
+def shard_of(url, count):
+    digest = hashlib.md5(normalize_url(url).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+
+def shard(sites, index, count):
+    """정규화 URL 해시 기준 index 번째 조각 (목록이 바뀌어도 기존 사이트의 배정은 유지)"""
+    return [s for s in sites if shard_of(s['url'], count) == index]
+
+
+def load_sites(preset=None, registry=DEFAULT_REGISTRY):
+    return select(load_registry(registry), preset)
+
+
+def merge(files, output_file):
+    """
+    샤드 결과 문서 병합
+
+    결과는 정규화 URL 기준 중복 제거 (나중 파일 우선), 실패는 어느 샤드에서든 성공한 URL 을 빼고
+    중복 제거해 전체 사이트 수를 병합 결과로 다시 계산한다. failed_urls 가 없는 예전 문서는
+    실패 건수를 그대로 더하고, 캐시·재시도 건수는 합산, 소요 시간은 가장 오래 걸린 샤드 기준
+    """
+    results = {}
+    failed_urls = {}
+    totals = Counter()
+    failures = Counter()
+    elapsed = 0.0
+    shards = []
+
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            doc = json.load(f)
+        meta = doc.get('metadata', {})
+
+        for result in doc['results']:
+            results[normalize_url(result['url'])] = result
+
+        if 'failed_urls' in meta:
+            for url, failure in meta['failed_urls'].items():
+                failed_urls[normalize_url(url)] = (url, failure)
+        else:
+            totals['failed'] += meta.get('failed', 0)
+            failures.update(meta.get('failures', {}))
+
+        for key in ('cache_hits', 'cache_misses', 'retries', 'circuit_opened'):
+            totals[key] += meta.get(key, 0)
+        elapsed = max(elapsed, meta.get('elapsed', 0.0))
+        shards.append({
+            'file': str(path),
+            'shard': meta.get('shard'),
+            'success': meta.get('success', len(doc['results'])),
+            'failed': meta.get('failed', 0)
+        })
+
+    # 다른 샤드(재실행)에서 성공한 URL 은 실패에서 제외
+    failed_urls = {key: entry for key, entry in failed_urls.items() if key not in results}
+    failures.update(failure for _, failure in failed_urls.values())
+
+    success = len(results)
+    failed = totals['failed'] + len(failed_urls)
+    total = success + failed
+    metadata = {
+        'total_sites': total,
+        'success': success,
+        'failed': failed,
+        'failures': dict(failures),
+        'failed_urls': dict(failed_urls.values()),
+        'cache_hits': totals['cache_hits'],
+        'cache_misses': totals['cache_misses'],
+        'success_rate': f"{success / total * 100:.1f}%" if total else "0.0%",
+        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+        'elapsed': elapsed,
+        'retries': totals['retries'],
+        'circuit_opened': totals['circuit_opened'],
+        'shards': shards
+    }
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': metadata, 'results': list(results.values())}, f, ensure_ascii=False, indent=2)
+
+    return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(description='검증 사이트 레지스트리')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_list = sub.add_parser('list', help='프리셋/샤드별 사이트 목록 출력')
+    p_list.add_argument('preset', nargs='?', help='batch / extended / large_scale (생략 시 전체)')
+    p_list.add_argument('--shard', help='i/N')
+    p_list.add_argument('--registry', default=str(DEFAULT_REGISTRY))
+
+    p_merge = sub.add_parser('merge', help='샤드 결과 병합')
+    p_merge.add_argument('output', help='병합 결과 파일')
+    p_merge.add_argument('inputs', nargs='+', help='샤드별 validation_*.json')
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        sites = load_sites(args.preset, args.registry)
+        if args.shard:
+            sites = shard(sites, *parse_shard(args.shard))
+        for s in sites:
+            print(f"{s['url']}\t{s['name']}\t{s['category']}\t{s['size']}")
+        print(f"# {len(sites)}개")
+    else:
+        meta = merge(args.inputs, args.output)
+        print(f"✅ {args.output}")
+        print(f"   샤드 {len(meta['shards'])}개 / 성공: {meta['success']}개 / 실패: {meta['failed']}개 ({meta['success_rate']})")
+
+
+if __name__ == '__main__':
+    main()
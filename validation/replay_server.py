@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/api/analyze 재생 서버 (오프라인 벤치마크용)
+실제 분석기와 외부 사이트 없이 검증 클라이언트의 처리량·동시성 제어·재시도를 측정
+
+응답 소스:
+    --from-results  이전 validation_*.json 결과 (predicted_score 를 재구성)
+    --recordings    클라이언트 --record 로 저장한 원본 응답 NDJSON ({url, status, elapsed, body})
+
+지연 분포 (--latency):
+    recorded            기록된 analysis_time 사용 (기본)
+    fixed:S             S 초 고정
+    uniform:A,B         A~B 초 균등
+    lognormal:M,SIGMA   중앙값 M 초, 로그 표준편차 SIGMA
+
+    python -m validation.replay_server --from-results validation_large_scale_20260129_231413.json \\
+        --latency-scale 0.1 --capacity 8 --error-rate 0.05 --port 3999
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+from validation.client import ITEM_FIELDS
+from validation.registry import normalize_url
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def response_from_result(result):
+    """검증 결과 레코드 → /api/analyze 응답 형태 (클라이언트가 읽는 필드만)"""
+    predicted = {
+        'overall': result['overall'],
+        'convenience': result['convenience'],
+        'design': result['design'],
+        'convenience_items': {},
+        'design_items': {}
+    }
+    for field, (group, key) in ITEM_FIELDS.items():
+        predicted[group][key] = {'score': result[field]}
+
+    return {'url': result['url'], 'mode': 'replay', 'predicted_score': predicted}
+
+
+def load_results(path):
+    """validation_*.json → [(url, 응답, 지연)] (목록 형식·문서 형식 모두 지원)"""
+    with open(path, encoding='utf-8') as f:
+        doc = json.load(f)
+    results = doc['results'] if isinstance(doc, dict) else doc
+    return [(r['url'], response_from_result(r), r.get('analysis_time')) for r in results]
+
+
+def load_recordings(path):
+    """녹화 NDJSON → [(url, 응답, 지연)] (200 응답만)"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('status', 200) == 200 and record.get('body') is not None:
+                entries.append((record['url'], record['body'], record.get('elapsed')))
+    return entries
+
+
+def parse_latency(spec):
+    """지연 분포 문자열 → sampler(recorded_latency) 함수"""
+    kind, _, params = spec.partition(':')
+    values = [float(x) for x in params.split(',')] if params else []
+
+    if kind == 'recorded':
+        fallback = values[0] if values else 2.0
+        return lambda recorded: recorded if recorded is not None else fallback
+    if kind == 'fixed':
+        return lambda recorded: values[0]
+    if kind == 'uniform':
+        return lambda recorded: random.uniform(values[0], values[1])
+    if kind == 'lognormal':
+        mu = math.log(values[0])
+        return lambda recorded: random.lognormvariate(mu, values[1])
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+
+class ReplayServer:
+    """기록된 응답을 지연·오류·용량 제한을 흉내 내며 돌려주는 서버"""
+
+    def __init__(self, entries, latency='recorded', latency_scale=1.0, capacity=None,
+                 max_queue=None, warmup=0.0, warmup_factor=3.0, error_rate=0.0,
+                 throttle_rate=0.0, timeout_rate=0.0, schema_error_rate=0.0, hang=60.0,
+                 unknown='random', weights_version='replay'):
+        self.responses = {normalize_url(url): (body, elapsed) for url, body, elapsed in entries}
+        self.pool = list(self.responses.values())
+        self.sample_latency = parse_latency(latency)
+        self.latency_scale = latency_scale
+
+        # 동시 처리 용량 (초과 요청은 대기, 대기열이 max_queue 를 넘으면 503)
+        self.capacity = capacity
+        self.max_queue = max_queue
+        # 서버 기동 직후 warmup 초 동안 용량은 1 → capacity 로, 지연은 warmup_factor 배 → 1배로
+        self.warmup = warmup
+        self.warmup_factor = warmup_factor
+
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.timeout_rate = timeout_rate
+        self.schema_error_rate = schema_error_rate
+        self.hang = hang
+        self.unknown = unknown
+        self.weights_version = weights_version
+
+        self.started = time.monotonic()
+        self.inflight = 0
+        self.waiting = 0
+        self.peak_inflight = 0
+        # 슬롯 반납 알림 (대기 요청은 폴링 없이 반납·용량 증가 시점에만 깨어남)
+        self._slot_freed = asyncio.Condition()
+        self.stats = {'requests': 0, 'ok': 0, 'http_500': 0, 'http_429': 0, 'http_503': 0,
+                      'timeout': 0, 'schema': 0, 'not_found': 0}
+
+    def _warmup_progress(self):
+        if not self.warmup:
+            return 1.0
+        return min(1.0, (time.monotonic() - self.started) / self.warmup)
+
+    def _current_capacity(self):
+        if self.capacity is None:
+            return None
+        return max(1, int(self.capacity * self._warmup_progress()))
+
+    def _next_capacity_step(self):
+        """warmup 중 용량이 현재 inflight 를 넘어서기까지 남은 초 (warmup 이 끝났으면 None)"""
+        if self._warmup_progress() >= 1.0:
+            return None
+        ready_at = self.started + self.warmup * (self.inflight + 1) / self.capacity
+        return max(0.001, ready_at - time.monotonic())
+
+    async def _wait_slot(self):
+        """슬롯 반납 알림 대기 (warmup 중에는 반납이 없어도 용량이 늘어나는 시점에 깨어남)"""
+        delay = self._next_capacity_step()
+        if delay is None:
+            await self._slot_freed.wait()
+            return
+        try:
+            await asyncio.wait_for(self._slot_freed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _enter(self):
+        """용량 슬롯 획득, 대기열 초과 시 False"""
+        if self.capacity is None:
+            self.inflight += 1
+            self.peak_inflight = max(self.peak_inflight, self.inflight)
+            return True
+
+        if self.inflight >= self._current_capacity():
+            if self.max_queue is not None and self.waiting >= self.max_queue:
+                return False
+            self.waiting += 1
+            try:
+                async with self._slot_freed:
+                    try:
+                        while self.inflight >= self._current_capacity():
+                            await self._wait_slot()
+                    except asyncio.CancelledError:
+                        # 알림을 받고 취소됐을 수 있으므로 다음 대기 요청에 넘김
+                        self._slot_freed.notify()
+                        raise
+                    if self.inflight + 1 < self._current_capacity():
+                        # 남는 슬롯이 더 있으면 다음 대기 요청도 깨움
+                        self._slot_freed.notify()
+            finally:
+                self.waiting -= 1
+
+        self.inflight += 1
+        self.peak_inflight = max(self.peak_inflight, self.inflight)
+        return True
+
+    async def _exit(self):
+        """용량 슬롯 반납, 대기 중인 요청 하나를 깨움"""
+        self.inflight -= 1
+        if self.capacity is not None and self.waiting:
+            async with self._slot_freed:
+                self._slot_freed.notify()
+
+    async def analyze(self, request):
+        self.stats['requests'] += 1
+        body = await request.json()
+        url = body.get('url', '')
+
+        entry = self.responses.get(normalize_url(url))
+        if entry is None:
+            if self.unknown != 'random' or not self.pool:
+                self.stats['not_found'] += 1
+                return web.json_response({'error': '분석 실패', 'message': 'not recorded'}, status=404)
+            entry = random.choice(self.pool)
+        response, recorded = entry
+
+        if not await self._enter():
+            self.stats['http_503'] += 1
+            return web.json_response({'error': '분석 실패', 'message': 'overloaded'}, status=503)
+
+        try:
+            roll = random.random()
+            if roll < self.timeout_rate:
+                self.stats['timeout'] += 1
+                await asyncio.sleep(self.hang)
+                return web.json_response({'error': '분석 실패', 'message': 'timeout'}, status=504)
+
+            factor = 1 + (self.warmup_factor - 1) * (1 - self._warmup_progress())
+            await asyncio.sleep(max(0.0, self.sample_latency(recorded)) * self.latency_scale * factor)
+
+            roll -= self.timeout_rate
+            if roll < self.error_rate:
+                self.stats['http_500'] += 1
+                return web.json_response({'error': '분석 실패', 'message': 'injected'}, status=500)
+            roll -= self.error_rate
+            if roll < self.throttle_rate:
+                self.stats['http_429'] += 1
+                return web.json_response({'error': 'too many requests'}, status=429)
+            roll -= self.throttle_rate
+            if roll < self.schema_error_rate:
+                self.stats['schema'] += 1
+                return web.json_response({'url': url, 'mode': 'replay'})
+
+            self.stats['ok'] += 1
+            return web.json_response(response)
+        finally:
+            await self._exit()
+
+    async def weights(self, request):
+        return web.json_response({'version': self.weights_version, 'weights': {}})
+
+    async def report(self, request):
+        return web.json_response({
+            **self.stats,
+            'inflight': self.inflight,
+            'waiting': self.waiting,
+            'peak_inflight': self.peak_inflight,
+            'capacity': self._current_capacity(),
+            'uptime': round(time.monotonic() - self.started, 2)
+        })
+
+    def make_app(self):
+        app = web.Application()
+        app.router.add_post('/api/analyze', self.analyze)
+        app.router.add_get('/api/weights', self.weights)
+        app.router.add_get('/__stats', self.report)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/api/analyze 재생 서버')
+    parser.add_argument('--from-results', nargs='*', default=[], help='validation_*.json 결과 파일')
+    parser.add_argument('--recordings', nargs='*', default=[], help='원본 응답 녹화 NDJSON')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--latency', default='recorded', help='recorded | fixed:S | uniform:A,B | lognormal:M,SIGMA')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='지연 배율 (0.1 = 10배 빠르게)')
+    parser.add_argument('--capacity', type=int, help='동시 처리 용량 (기본: 무제한)')
+    parser.add_argument('--max-queue', type=int, help='용량 초과 대기열 상한, 넘으면 503')
+    parser.add_argument('--warmup', type=float, default=0.0, help='기동 후 워밍업 시간(초)')
+    parser.add_argument('--warmup-factor', type=float, default=3.0, help='워밍업 시작 시 지연 배수')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 비율')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='HTTP 429 비율')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='응답 지연(hang) 비율')
+    parser.add_argument('--schema-error-rate', type=float, default=0.0, help='predicted_score 누락 비율')
+    parser.add_argument('--hang', type=float, default=60.0, help='hang 응답의 대기 시간(초)')
+    parser.add_argument('--unknown', choices=['random', '404'], default='random',
+                        help='기록에 없는 URL 처리 (임의 응답 재사용 / 404)')
+    parser.add_argument('--seed', type=int, help='난수 시드')
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    sources = args.from_results or ([] if args.recordings else
+                                    sorted(str(p) for p in BASE_DIR.glob('validation_large_scale_*.json')))
+    entries = []
+    for path in sources:
+        entries.extend(load_results(path))
+    for path in args.recordings:
+        entries.extend(load_recordings(path))
+
+    server = ReplayServer(
+        entries,
+        latency=args.latency,
+        latency_scale=args.latency_scale,
+        capacity=args.capacity,
+        max_queue=args.max_queue,
+        warmup=args.warmup,
+        warmup_factor=args.warmup_factor,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        timeout_rate=args.timeout_rate,
+        schema_error_rate=args.schema_error_rate,
+        hang=args.hang,
+        unknown=args.unknown
+    )
+
+    print(f"🎬 재생 서버: http://{args.host}:{args.port}/api/analyze")
+    print(f"   기록된 응답: {len(server.responses)}개 URL ({len(sources) + len(args.recordings)}개 파일)")
+    print(f"   통계: http://{args.host}:{args.port}/__stats")
+    web.run_app(server.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재시도 정책과 호스트별 회로 차단기
+- RetryPolicy: 재시도 가능한 실패(연결 오류, HTTP 429/5xx)만 지수 백오프 + full jitter 로 재시도
+  타임아웃은 기본적으로 재시도하지 않음 (25초 타임아웃 사이트가 재시도 동안 동시성 슬롯을
+  몇 배로 점유하지 않도록, retry_timeouts=True 면 재시도)
+- CircuitBreaker: 분석 대상 호스트별로 연속 실패(타임아웃 포함)가 쌓이면 일정 시간 즉시 실패 처리
+  차단 여부는 사이트의 첫 시도 전에만 확인하므로, 이미 시작한 사이트는 재시도를 모두 하고
+  차단은 같은 호스트의 다음 사이트부터 적용됨
+
+실패 분류:
+    timeout       요청 제한 시간 초과
+    connection    연결/전송 오류
+    http_<code>   200 이 아닌 응답 (예: http_500, http_429)
+    schema        응답에 predicted_score 등 필수 필드 누락
+    circuit_open  회로 차단으로 요청하지 않음
+"""
+
+import random
+import time
+
+
+def is_retryable(failure):
+    if failure in ('timeout', 'connection'):
+        return True
+    if failure.startswith('http_'):
+        code = int(failure[5:])
+        return code == 429 or code >= 500
+    return False
+
+
+class RetryPolicy:
+    """최대 max_attempts 회 시도, n 번째 재시도 전 0 ~ min(max_delay, base_delay * 2^n) 초 대기"""
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, retry_timeouts=False):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_timeouts = retry_timeouts
+
+    def should_retry(self, failure):
+        if failure == 'timeout' and not self.retry_timeouts:
+            return False
+        return is_retryable(failure)
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기
+
+    closed → 연속 failure_threshold 회 실패 시 open → reset_timeout 초 후 half-open(시험 요청 1회)
+    → 성공하면 closed, 어떤 실패든 다시 open
+    """
+
+    def __init__(self, failure_threshold=2, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._failures = {}
+        self._opened_at = {}
+        self._trial = set()
+        self.opened = 0
+
+    def allow(self, host):
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return True
+        if time.monotonic() - opened_at < self.reset_timeout or host in self._trial:
+            return False
+        self._trial.add(host)
+        return True
+
+    def record_success(self, host):
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._trial.discard(host)
+
+    def record_failure(self, host, counted=True):
+        """
+        counted=False: 호스트 상태와 무관한 실패(HTTP 4xx, schema) - 연속 실패로 세지 않지만
+        half-open 시험 요청이었다면 결과가 나온 것이므로 다시 open (시험 상태가 남지 않도록)
+        """
+        if not counted and host not in self._trial:
+            return
+        count = self._failures.get(host, 0) + 1
+        self._failures[host] = count
+
+        if host in self._trial or count >= self.failure_threshold:
+            if host not in self._opened_at or host in self._trial:
+                self.opened += 1
+            self._opened_at[host] = time.monotonic()
+            self._trial.discard(host)
@@ -4,7 +4,9 @@
 let allSites = [];
 let ageGroupSummary = {};
 let rankings = {};
-let nielsenReports = []; // Nielsen 상세 분석 데이터
+let nielsenReports = []; // Nielsen 상세 분석 데이터 (분할 색인이 없을 때만 전체 로드)
+let siteIndex = {}; // 기관별 분할 파일 색인 (data/sites/index.json, 기관명 → 항목)
+const siteShards = {}; // 불러온 기관별 상세 데이터 캐시
 let integratedNielsen = []; // 통합 Nielsen 점수 (국민평가 + KRDS)
 let krdsImageAnalysis = []; // KRDS 이미지 분석 결과
 let finalIntegratedScores = []; // 최종 통합 점수 (국민평가 + KRDS + 휴리스틱)
@@ -48,34 +50,30 @@ async function loadData() {
     console.log('📥 데이터 로드 중...');
     
     try {
-        // Load site averages
-        const sitesResponse = await fetch('data/site_averages.json');
-        allSites = await sitesResponse.json();
-        
-        // Load age group summary
-        const ageResponse = await fetch('data/age_group_summary.json');
-        ageGroupSummary = await ageResponse.json();
-        
-        // Load rankings
-        const rankingsResponse = await fetch('data/rankings.json');
-        rankings = await rankingsResponse.json();
-        
-        // Load Nielsen detailed reports
-        const nielsenResponse = await fetch('data/nielsen_detailed_reports.json');
-        nielsenReports = await nielsenResponse.json();
-        
-        // Load integrated Nielsen scores (국민평가 + KRDS)
-        const integratedResponse = await fetch('data/integrated_nielsen_scores.json');
-        integratedNielsen = await integratedResponse.json();
-        
-        // Load KRDS image analysis
-        const krdsImageResponse = await fetch('data/nielsen_mapped_results.json');
-        krdsImageAnalysis = await krdsImageResponse.json();
-        
-        // Load FINAL integrated scores (국민평가 + KRDS + 휴리스틱) ⭐ 최종 통합!
-        const finalIntegratedResponse = await fetch('data/final_integrated_scores.json');
-        const finalData = await finalIntegratedResponse.json();
-        finalIntegratedScores = finalData.agencies || [];
+        // 첫 화면은 기관별 분할 색인(data/sites/index.json) 하나만 로드
+        // (상세 데이터는 기관 선택 시 data/sites/<id>.json 로드)
+        const indexResponse = await fetch('data/sites/index.json');
+        if (indexResponse.ok) {
+            const index = await indexResponse.json();
+            index.sites.forEach(entry => siteIndex[entry.name] = entry);
+            
+            allSites = index.sites.filter(entry => entry.total_avg !== null);
+            ageGroupSummary = index.age_group_summary || {};
+            const byTotal = [...allSites].sort((a, b) => b.total_avg - a.total_avg);
+            rankings = { top_5: byTotal.slice(0, 5), bottom_5: byTotal.slice(-5) };
+            finalIntegratedScores = index.sites
+                .filter(entry => entry.final_nielsen_score !== null)
+                .map(entry => ({
+                    site_name: entry.name,
+                    final_nielsen_score: entry.final_nielsen_score,
+                    data_sources: entry.data_sources
+                }));
+            integratedNielsen = index.sites
+                .filter(entry => entry.nielsen_average !== null && entry.nielsen_average !== undefined)
+                .map(entry => ({ site_name: entry.name, nielsen_average: entry.nielsen_average }));
+        } else {
+            await loadFullData();
+        }
         
         console.log(`✅ ${allSites.length}개 기관 데이터 로드 완료`);
         console.log(`   - 최종 통합 점수: ${finalIntegratedScores.length}개 기관`);
@@ -86,6 +84,34 @@ async function loadData() {
     }
 }
 
+// Load the full JSON files (분할 색인이 없을 때)
+async function loadFullData() {
+    const sitesResponse = await fetch('data/site_averages.json');
+    allSites = await sitesResponse.json();
+    
+    const ageResponse = await fetch('data/age_group_summary.json');
+    ageGroupSummary = await ageResponse.json();
+    
+    const rankingsResponse = await fetch('data/rankings.json');
+    rankings = await rankingsResponse.json();
+    
+    const nielsenResponse = await fetch('data/nielsen_detailed_reports.json');
+    nielsenReports = expandNielsenReports(await nielsenResponse.json());
+    
+    // Load integrated Nielsen scores (국민평가 + KRDS)
+    const integratedResponse = await fetch('data/integrated_nielsen_scores.json');
+    integratedNielsen = await integratedResponse.json();
+    
+    // Load KRDS image analysis
+    const krdsImageResponse = await fetch('data/nielsen_mapped_results.json');
+    krdsImageAnalysis = await krdsImageResponse.json();
+    
+    // Load FINAL integrated scores (국민평가 + KRDS + 휴리스틱) ⭐ 최종 통합!
+    const finalIntegratedResponse = await fetch('data/final_integrated_scores.json');
+    const finalData = await finalIntegratedResponse.json();
+    finalIntegratedScores = finalData.agencies || [];
+}
+
 // Render statistics
 function renderStats() {
     const totalScores = allSites.map(s => s.total_avg);
@@ -359,7 +385,7 @@ function renderSitesTable(sites = allSites) {
                 ${finalScore ? `
                     <strong style="color: #10b981; font-size: 1.1em;">${finalScore.final_nielsen_score.toFixed(2)}</strong>
                     ${dataSourceTag}
-                ` : (nielsenData ? `
+                ` : (nielsenData && nielsenData.nielsen_average !== null ? `
                     <strong style="color: #f59e0b;">${nielsenData.nielsen_average.toFixed(2)}</strong>
                 ` : '-')}
             </td>
@@ -414,17 +440,26 @@ function sortTable() {
 }
 
 // Show site detail modal
-function showSiteDetail(siteName) {
-    const site = allSites.find(s => s.name === siteName);
+async function showSiteDetail(siteName) {
+    let site, nielsenData, imageAnalysis;
+    const shard = await loadSiteShard(siteName);
+    if (shard) {
+        // 분할 파일: 기관 평균 + 통합 Nielsen + KRDS 이미지 분석
+        site = shard.site_average;
+        nielsenData = shard.integrated_nielsen;
+        imageAnalysis = shard.krds_image_analysis;
+    } else {
+        site = allSites.find(s => s.name === siteName);
+        
+        // 통합 Nielsen 점수 찾기
+        nielsenData = integratedNielsen.find(n => n.site_name === siteName);
+        
+        // KRDS 이미지 분석 찾기
+        imageAnalysis = krdsImageAnalysis.agencies ? 
+            krdsImageAnalysis.agencies.find(a => a.agency === siteName) : null;
+    }
     if (!site) return;
     
-    // 통합 Nielsen 점수 찾기
-    const nielsenData = integratedNielsen.find(n => n.site_name === siteName);
-    
-    // KRDS 이미지 분석 찾기
-    const imageAnalysis = krdsImageAnalysis.agencies ? 
-        krdsImageAnalysis.agencies.find(a => a.agency === siteName) : null;
-    
     const modal = document.getElementById('siteModal');
     const modalBody = document.getElementById('modalBody');
     
@@ -486,7 +521,7 @@ function showSiteDetail(siteName) {
                 <div style="font-size: 2rem; font-weight: bold;">${site.design_avg.toFixed(2)}</div>
                 <div>디자인</div>
             </div>
-            ${nielsenData ? `
+            ${nielsenData && nielsenData.nielsen_average !== null ? `
                 <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, #f59e0b, #d97706); color: white; border-radius: 10px; position: relative;">
                     <div style="font-size: 2rem; font-weight: bold;">${nielsenData.nielsen_average.toFixed(2)}</div>
                     <div>Nielsen 통합</div>
@@ -634,9 +669,47 @@ function showSiteDetail(siteName) {
     modal.style.display = 'block';
 }
 
+// Rehydrate compact Nielsen reports (shared string table → inline text)
+function expandNielsenReports(doc) {
+    if (Array.isArray(doc)) return doc;
+    const expand = entry => {
+        const result = {};
+        Object.entries(entry).forEach(([key, value]) => {
+            result[key] = ['name', 'diagnosis', 'improvement'].includes(key) ? doc.strings[value] : value;
+        });
+        return result;
+    };
+    return doc.reports.map(report => {
+        const principles = {};
+        Object.entries(report.principles).forEach(([code, principle]) => {
+            principles[code] = expand(principle);
+            principles[code].items = {};
+            Object.entries(principle.items).forEach(([itemCode, item]) => {
+                principles[code].items[itemCode] = expand(item);
+            });
+        });
+        return { ...report, principles };
+    });
+}
+
+// Load one site's detail file (data/sites/<id>.json) on demand
+async function loadSiteShard(siteName) {
+    if (siteShards[siteName]) return siteShards[siteName];
+    const entry = siteIndex[siteName];
+    if (!entry) return null;
+    
+    const response = await fetch(`data/sites/${entry.file}`);
+    siteShards[siteName] = await response.json();
+    return siteShards[siteName];
+}
+
 // Show Nielsen detailed report
-function showNielsenReport(siteName) {
-    const report = nielsenReports.find(r => r.site_name === siteName);
+async function showNielsenReport(siteName) {
+    let report = nielsenReports.find(r => r.site_name === siteName);
+    if (!report) {
+        const shard = await loadSiteShard(siteName);
+        report = shard ? shard.nielsen_report : null;
+    }
     if (!report) {
         alert('Nielsen 상세 분석 데이터를 찾을 수 없습니다.');
         return;